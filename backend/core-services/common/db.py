@@ -0,0 +1,33 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+
+def _is_sqlite_memory(url) -> bool:
+    database = url.database or ""
+    # sqlite://, sqlite:///:memory: and URI databases such as
+    # sqlite:///file:name?mode=memory&cache=shared&uri=true
+    return database in ("", ":memory:") or url.query.get("mode") == "memory" or "mode=memory" in database
+
+
+def supports_concurrent_sessions(database_url: str) -> bool:
+    """Whether Sessions on separate threads get separate connections.
+
+    False for in-memory SQLite, whose single shared connection would
+    interleave their transactions.
+    """
+    url = make_url(database_url)
+    return not (url.get_backend_name() == "sqlite" and _is_sqlite_memory(url))
+
+
+def engine_options(database_url: str) -> dict:
+    """Pool and compiled-statement cache settings for the configured backend."""
+    url = make_url(database_url)
+    options = {"query_cache_size": 1200}
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        # In-memory databases live on a single connection; share it across threads
+        if _is_sqlite_memory(url):
+            options["poolclass"] = StaticPool
+        return options
+    options.update(pool_size=20, max_overflow=40, pool_pre_ping=True, pool_recycle=1800)
+    return options
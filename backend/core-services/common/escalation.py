@@ -1,4 +1,5 @@
 import os
+import threading
 import requests
 from typing import Optional
 
@@ -8,8 +9,28 @@ PSA_BASE = os.environ.get("PSA_BASE_URL", "http://localhost:8001")
 class EscalationClient:
     """Generic client to create cases in PSA. Reusable by multiple producers."""
 
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(self, base_url: Optional[str] = None, session: Optional[requests.Session] = None):
         self.base = base_url or PSA_BASE
+        self._session = session
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The Session for the calling thread.
+
+        requests.Session is not documented as thread-safe, so unless one was
+        passed in, each thread gets its own and keeps its PSA connection alive.
+        """
+        if self._session is not None:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._lock:
+                self._sessions.append(session)
+        return session
 
     def create_case(self, organisation_id: str, case_type: str = "incident", source_system: str = "external", severity: int = 1, extra: dict | None = None) -> dict:
         url = f"{self.base}/psa/cases"
@@ -21,6 +42,12 @@ class EscalationClient:
         }
         if extra:
             payload.update(extra)
-        r = requests.post(url, json=payload, timeout=10)
+        r = self.session.post(url, json=payload, timeout=10)
         r.raise_for_status()
         return r.json()
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
@@ -1,6 +1,7 @@
 """Penetration testing orchestration service entry point (MVP-12)."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
@@ -40,16 +41,34 @@ from .validation import (
 app = FastAPI(title="Penetration Test Orchestrator", version="0.1.0")
 
 
-def get_settings() -> Settings:
-    """Dependency to load settings once per request."""
-    return load_settings()
+@app.on_event("startup")
+async def _init_state() -> None:
+    """Load settings and build the store once, before any request is served."""
+    app.state.settings = load_settings()
+    app.state.store = build_store(app.state.settings.storage_path)
 
 
-def get_store(settings: Settings = Depends(get_settings)) -> PenTestStore:
+def get_settings(request: Request) -> Settings:
+    """Dependency to access settings loaded at startup."""
+    return request.app.state.settings
+
+
+def get_store(request: Request) -> PenTestStore:
     """Dependency to access the storage backend."""
-    if not hasattr(get_store, "_store"):
-        get_store._store = build_store(settings.storage_path)  # type: ignore[attr-defined]
-    return get_store._store  # type: ignore[attr-defined]
+    return request.app.state.store
+
+
+@dataclass(slots=True)
+class AppContext:
+    """Settings and storage resolved together for a single request."""
+
+    settings: Settings
+    store: PenTestStore
+
+
+async def get_ctx(request: Request) -> AppContext:
+    """Dependency bundling settings and storage into one solver node."""
+    return AppContext(settings=get_settings(request), store=get_store(request))
 
 
 async def enforce_https(request: Request, settings: Settings) -> None:
@@ -65,11 +84,11 @@ async def enforce_https(request: Request, settings: Settings) -> None:
 
 
 async def enforce_api_key(
-    settings: Settings = Depends(get_settings),
+    ctx: AppContext = Depends(get_ctx),
     api_key: Optional[str] = Header(None, alias="X-API-Key"),
 ) -> None:
     """Optional API key enforcement."""
-    if settings.api_key and api_key != settings.api_key:
+    if ctx.settings.api_key and api_key != ctx.settings.api_key:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_api_key")
 
 
@@ -90,11 +109,11 @@ def _default_safeguards(request: PenTestCreateRequest, settings: Settings) -> Sa
 
 
 @app.get("/health", response_class=JSONResponse)
-async def health_check(settings: Settings = Depends(get_settings)) -> dict:
+async def health_check(ctx: AppContext = Depends(get_ctx)) -> dict:
     """Simple health endpoint for load balancers."""
     return {
         "status": "ok",
-        "service": settings.service_name,
+        "service": ctx.settings.service_name,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
@@ -103,20 +122,19 @@ async def health_check(settings: Settings = Depends(get_settings)) -> dict:
 async def create_test_plan(
     request: Request,
     payload: PenTestCreateRequest,
-    settings: Settings = Depends(get_settings),
-    store: PenTestStore = Depends(get_store),
+    ctx: AppContext = Depends(get_ctx),
     _: None = Depends(enforce_api_key),
 ) -> PenTestResponse:
     """Create a new penetration test plan."""
-    await enforce_https(request, settings)
+    await enforce_https(request, ctx.settings)
 
     try:
-        validate_plan_request(payload, settings)
+        validate_plan_request(payload, ctx.settings)
     except ValidationError as error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)) from error
 
     now = datetime.now(timezone.utc)
-    safeguards = payload.safeguards or _default_safeguards(payload, settings)
+    safeguards = payload.safeguards or _default_safeguards(payload, ctx.settings)
 
     plan = PenTestPlan(
         test_id=uuid4(),
@@ -132,19 +150,19 @@ async def create_test_plan(
         created_at=now,
         last_updated_at=now,
     )
-    store.record_test(plan)
+    ctx.store.record_test(plan)
 
     return PenTestResponse(status="recorded", test=plan)
 
 
 @app.get("/tests", response_model=PenTestListResponse)
 async def list_tests(
-    store: PenTestStore = Depends(get_store),
+    ctx: AppContext = Depends(get_ctx),
     tenant_id: Optional[str] = None,
     status_filter: Optional[str] = None,
 ) -> PenTestListResponse:
     """List recorded test plans."""
-    tests = [_parse_plan(plan) for plan in store.list_tests()]
+    tests = [_parse_plan(plan) for plan in ctx.store.list_tests()]
     if tenant_id:
         tests = [plan for plan in tests if plan.tenant_id == tenant_id]
     if status_filter:
@@ -155,10 +173,10 @@ async def list_tests(
 @app.get("/tests/{test_id}", response_model=PenTestResponse)
 async def get_test(
     test_id: UUID,
-    store: PenTestStore = Depends(get_store),
+    ctx: AppContext = Depends(get_ctx),
 ) -> PenTestResponse:
     """Retrieve a test plan by ID."""
-    payload = store.get_test(test_id)
+    payload = ctx.store.get_test(test_id)
     if not payload:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="test_not_found")
     return PenTestResponse(status="recorded", test=_parse_plan(payload))
@@ -169,14 +187,13 @@ async def start_test(
     request: Request,
     test_id: UUID,
     payload: StartTestRequest,
-    settings: Settings = Depends(get_settings),
-    store: PenTestStore = Depends(get_store),
+    ctx: AppContext = Depends(get_ctx),
     _: None = Depends(enforce_api_key),
 ) -> PenTestResponse:
     """Start a penetration test within its authorised window."""
-    await enforce_https(request, settings)
+    await enforce_https(request, ctx.settings)
 
-    plan_payload = store.get_test(test_id)
+    plan_payload = ctx.store.get_test(test_id)
     if not plan_payload:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="test_not_found")
     plan = _parse_plan(plan_payload)
@@ -187,12 +204,12 @@ async def start_test(
     except ValidationError as error:
         if str(error) == "decommissioned_assets_in_scope":
             plan = plan.model_copy(update={"status": "blocked", "last_updated_at": now})
-            store.update_test(plan)
+            ctx.store.update_test(plan)
             return PenTestResponse(status="blocked", test=plan, message="decommissioned_assets_in_scope")
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(error)) from error
 
     plan = plan.model_copy(update={"status": "running", "started_at": now, "last_updated_at": now})
-    store.update_test(plan)
+    ctx.store.update_test(plan)
 
     return PenTestResponse(status="recorded", test=plan)
 
@@ -202,21 +219,20 @@ async def abort_test(
     request: Request,
     test_id: UUID,
     payload: AbortTestRequest,
-    settings: Settings = Depends(get_settings),
-    store: PenTestStore = Depends(get_store),
+    ctx: AppContext = Depends(get_ctx),
     _: None = Depends(enforce_api_key),
 ) -> PenTestResponse:
     """Abort an in-flight penetration test."""
-    await enforce_https(request, settings)
+    await enforce_https(request, ctx.settings)
 
-    plan_payload = store.get_test(test_id)
+    plan_payload = ctx.store.get_test(test_id)
     if not plan_payload:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="test_not_found")
     plan = _parse_plan(plan_payload)
 
     now = datetime.now(timezone.utc)
     plan = plan.model_copy(update={"status": "aborted", "completed_at": now, "last_updated_at": now})
-    store.update_test(plan)
+    ctx.store.update_test(plan)
 
     return PenTestResponse(status="recorded", test=plan, message=payload.reason)
 
@@ -226,14 +242,13 @@ async def ingest_results(
     request: Request,
     test_id: UUID,
     payload: ResultIngestRequest,
-    settings: Settings = Depends(get_settings),
-    store: PenTestStore = Depends(get_store),
+    ctx: AppContext = Depends(get_ctx),
     _: None = Depends(enforce_api_key),
 ) -> ResultIngestResponse:
     """Ingest raw observations and normalise them into results."""
-    await enforce_https(request, settings)
+    await enforce_https(request, ctx.settings)
 
-    plan_payload = store.get_test(test_id)
+    plan_payload = ctx.store.get_test(test_id)
     if not plan_payload:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="test_not_found")
     plan = _parse_plan(plan_payload)
@@ -242,19 +257,19 @@ async def ingest_results(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="test_not_running")
 
     try:
-        validate_results_request(payload, settings)
+        validate_results_request(payload, ctx.settings)
     except ValidationError as error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)) from error
 
     now = datetime.now(timezone.utc)
-    if now > plan.schedule.end_at:
+    if now.timestamp() > plan.schedule.end_epoch:
         plan = plan.model_copy(update={"status": "aborted", "completed_at": now, "last_updated_at": now})
-        store.update_test(plan)
+        ctx.store.update_test(plan)
         return ResultIngestResponse(status="aborted", test_id=test_id, result_count=0, message="window_expired")
 
     if should_abort_for_credentials(payload.observations):
         plan = plan.model_copy(update={"status": "aborted", "completed_at": now, "last_updated_at": now})
-        store.update_test(plan)
+        ctx.store.update_test(plan)
         return ResultIngestResponse(
             status="aborted",
             test_id=test_id,
@@ -264,7 +279,7 @@ async def ingest_results(
 
     if should_abort_for_detection(payload.detection_summary, plan.safeguards):
         plan = plan.model_copy(update={"status": "aborted", "completed_at": now, "last_updated_at": now})
-        store.update_test(plan)
+        ctx.store.update_test(plan)
         return ResultIngestResponse(
             status="aborted",
             test_id=test_id,
@@ -272,8 +287,8 @@ async def ingest_results(
             message="detection_system_failed",
         )
 
-    existing_results = store.list_results(test_id)
-    remaining = settings.max_results_per_test - len(existing_results)
+    existing_results = ctx.store.list_results(test_id)
+    remaining = ctx.settings.max_results_per_test - len(existing_results)
     if remaining <= 0:
         return ResultIngestResponse(
             status="truncated",
@@ -282,28 +297,34 @@ async def ingest_results(
             message="result_limit_reached",
         )
 
-    observations = payload.observations[:remaining]
+    # Only slice when truncating; the common case reuses the request list as-is.
+    observations = payload.observations
+    if len(observations) > remaining:
+        observations = observations[:remaining]
     results = normalise_observations(plan, observations, payload.detection_summary)
 
-    for observation in observations:
-        evidence_payload = build_evidence_payload(plan, observation)
-        evidence = EvidenceRecord(
+    # Every field is computed locally, so skip re-validating each record.
+    evidence_payloads = [build_evidence_payload(plan, observation) for observation in observations]
+    evidence = [
+        EvidenceRecord.model_construct(
             test_id=test_id,
             payload_hash=hash_payload(evidence_payload),
             payload=evidence_payload,
             captured_at=now,
         )
-        store.record_evidence(evidence)
+        for evidence_payload in evidence_payloads
+    ]
+    ctx.store.record_evidence_many(evidence)
 
-    store.trim_evidence(test_id, settings.max_evidence_per_test)
-    store.record_results(results)
+    ctx.store.trim_evidence(test_id, ctx.settings.max_evidence_per_test)
+    ctx.store.record_results(results)
 
-    dispatches = build_dispatch_records(plan, results, settings)
-    store.record_dispatches(dispatches)
+    dispatches = build_dispatch_records(plan, results, ctx.settings)
+    ctx.store.record_dispatches(dispatches)
 
     if payload.finalise:
         plan = plan.model_copy(update={"status": "completed", "completed_at": now, "last_updated_at": now})
-        store.update_test(plan)
+        ctx.store.update_test(plan)
 
     status_label = "recorded"
     message = None
@@ -322,28 +343,28 @@ async def ingest_results(
 @app.get("/tests/{test_id}/results", response_model=ResultListResponse)
 async def list_results(
     test_id: UUID,
-    store: PenTestStore = Depends(get_store),
+    ctx: AppContext = Depends(get_ctx),
 ) -> ResultListResponse:
     """List normalised results for a test."""
-    results = [NormalisedResult.model_validate(payload) for payload in store.list_results(test_id)]
+    results = [NormalisedResult.model_validate(payload) for payload in ctx.store.list_results(test_id)]
     return ResultListResponse(results=results)
 
 
 @app.get("/tests/{test_id}/evidence", response_model=EvidenceListResponse)
 async def list_evidence(
     test_id: UUID,
-    store: PenTestStore = Depends(get_store),
+    ctx: AppContext = Depends(get_ctx),
 ) -> EvidenceListResponse:
     """List immutable evidence records for a test."""
-    evidence = [EvidenceRecord.model_validate(payload) for payload in store.list_evidence(test_id)]
+    evidence = [EvidenceRecord.model_validate(payload) for payload in ctx.store.list_evidence(test_id)]
     return EvidenceListResponse(evidence=evidence)
 
 
 @app.get("/tests/{test_id}/dispatches", response_model=DispatchListResponse)
 async def list_dispatches(
     test_id: UUID,
-    store: PenTestStore = Depends(get_store),
+    ctx: AppContext = Depends(get_ctx),
 ) -> DispatchListResponse:
     """List dispatch records for downstream systems."""
-    dispatches = [IntegrationDispatch.model_validate(payload) for payload in store.list_dispatches(test_id)]
+    dispatches = [IntegrationDispatch.model_validate(payload) for payload in ctx.store.list_dispatches(test_id)]
     return DispatchListResponse(dispatches=dispatches)
@@ -33,12 +33,30 @@ class ScopeDefinition(BaseModel):
     decommissioned_assets: list[str] = Field(default_factory=list)
 
 
+def _aware_timestamp(value: datetime) -> float:
+    # A naive datetime would be read as local time; keep rejecting it as the
+    # aware/naive datetime comparison did.
+    if value.tzinfo is None:
+        raise TypeError("can't compare offset-naive and offset-aware datetimes")
+    return value.timestamp()
+
+
 class ScheduleWindow(BaseModel):
     """Execution window for a controlled test."""
 
     start_at: datetime
     end_at: datetime
 
+    # Plain properties: derived from the fields on every access, so copies and
+    # assignments never see a stale value.
+    @property
+    def start_epoch(self) -> float:
+        return _aware_timestamp(self.start_at)
+
+    @property
+    def end_epoch(self) -> float:
+        return _aware_timestamp(self.end_at)
+
 
 class CredentialReference(BaseModel):
     """Reference to credentials used for authenticated testing."""
@@ -0,0 +1,15 @@
+"""Shared, cached host resolution for the live reconnaissance tests."""
+from __future__ import annotations
+
+import socket
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def resolve(host: str) -> Optional[str]:
+    """Resolve ``host`` once per process, returning ``None`` if it does not resolve."""
+    try:
+        return socket.gethostbyname(host)
+    except socket.gaierror:
+        return None
@@ -1,5 +1,5 @@
 import socket
-import time
+import struct
 from typing import Any, Dict, List, Optional
 from ipaddress import ip_network, ip_address
 from logging_config import get_logger
@@ -7,7 +7,7 @@ logger = get_logger(__name__)
 
 # Scapy is an approved internal module for this project
 try:
-    from scapy.all import Ether, ARP, srp, IP, ICMP, sr1, conf as scapy_conf
+    from scapy.all import Ether, ARP, srp, IP, ICMP, sr, conf as scapy_conf
     # Suppress Scapy's verbose output during import and runtime, unless explicitly enabled
     scapy_conf.verb = 0
     HAS_SCAPY = True
@@ -63,6 +63,23 @@ def resolve_hostname_socket(ip_address: str) -> Optional[str]:
     except Exception:
         return None
 
+def expand_host_ips(network) -> List[str]:
+    """Return the usable host addresses of ``network`` as strings.
+
+    IPv4 ranges are expanded from integer bounds and formatted with
+    ``socket.inet_ntoa`` rather than building an ``IPv4Address`` per host,
+    which matters for /16-sized sweeps. Other networks fall back to
+    ``hosts()``.
+    """
+    if network.version != 4 or network.prefixlen >= 31:
+        return [str(ip_obj) for ip_obj in network.hosts()]
+    first = int(network.network_address) + 1
+    last = int(network.broadcast_address)
+    pack = struct.Struct("!I").pack
+    inet_ntoa = socket.inet_ntoa
+    return [inet_ntoa(pack(value)) for value in range(first, last)]
+
+
 def arp_scan_scapy(
     ip_range_or_subnet: str,
     timeout: int = 1,
@@ -139,7 +156,7 @@ def icmp_ping_sweep_scapy(
 
     try:
         network = ip_network(ip_range_or_subnet, strict=False)
-        target_ips = [str(ip_obj) for ip_obj in network.hosts()]
+        target_ips = expand_host_ips(network)
         if not target_ips and network.num_addresses == 1:
             target_ips = [str(network.network_address)]
 
@@ -148,53 +165,38 @@ def icmp_ping_sweep_scapy(
             return {"live_hosts": [], "unreachable_hosts": [], "scapy_errors": [], "general_errors": general_errors}
 
 
-        def ping_single_ip(ip_addr_str):
-            if verbose: logger.info(f"  Pinging {ip_addr_str}...")
-            try:
-                reply = sr1(IP(dst=ip_addr_str)/ICMP(), timeout=timeout, verbose=False, retry=0)
-                if reply and reply.haslayer(ICMP) and reply[ICMP].type == 0:
-                    hostname = resolve_hostname_socket(ip_addr_str) or ip_addr_str
-                    return {"status": "up", "ip": ip_addr_str, "hostname": hostname, "method": "icmp"}
-                return {"status": "down_or_filtered", "ip": ip_addr_str}
-            except RuntimeError as e_scapy:
-                if verbose:
-                    print(f"    Scapy runtime error pinging {ip_addr_str}: {e_scapy}")
-                return {"status": "error_scapy", "ip": ip_addr_str, "error_message": str(e_scapy)}
-            except Exception as e_generic:
-                if verbose:
-                    print(f"    Generic error pinging {ip_addr_str}: {e_generic}")
-                else: # No reply or not an ICMP Echo Reply
-                    return {"status": "down_or_filtered", "ip": ip_addr_str}
-            except RuntimeError as e_scapy: # Scapy runtime errors (e.g., "no route found", permissions for raw socket)
-                if verbose: logger.info(f"    Scapy runtime error pinging {ip_addr_str}: {e_scapy}")
-                return {"status": "error_scapy", "ip": ip_addr_str, "error_message": str(e_scapy)}
-            except Exception as e_generic:
-                if verbose: logger.info(f"    Generic error pinging {ip_addr_str}: {e_generic}")
-                return {"status": "error_generic", "ip": ip_addr_str, "error_message": str(e_generic)}
-
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        num_threads = min(len(target_ips), 32)
-
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            future_to_ip = {executor.submit(ping_single_ip, ip_s): ip_s for ip_s in target_ips}
-            for future in as_completed(future_to_ip):
-                ip_s = future_to_ip[future]
-                try:
-                    res = future.result()
-                    if res["status"] == "up":
-                        live_hosts.append({"ip": res["ip"], "mac": None, "hostname": res["hostname"], "vendor": None, "status": "up", "method": "icmp"})
-                        if verbose: logger.info(f"ICMP Reply from: IP={res['ip']}, Hostname={res['hostname']}")
-                    elif res["status"] == "down_or_filtered":
-                        unreachable_hosts.append({"ip": res["ip"], "status": "down_or_filtered"})
-                    elif res["status"] == "error_scapy":
-                        scapy_errors.append({"ip": res["ip"], "error": res["error_message"]})
-                    elif res["status"] == "error_generic":
-                        general_errors.append(f"Error on IP {res['ip']}: {res['error_message']}")
-                except Exception as exc:
-                    general_errors.append(f"Exception processing result for IP {ip_s}: {exc}")
-
-                if packet_interval > 0 and num_threads > 10:
-                    time.sleep(packet_interval / num_threads)
+        # One sr() call sends every echo request over a single raw socket and
+        # matches the replies, instead of opening a socket per host with sr1().
+        try:
+            answered, _ = sr(
+                IP(dst=target_ips)/ICMP(),
+                timeout=timeout,
+                inter=packet_interval,
+                retry=max(0, count_per_host - 1),
+                verbose=verbose,
+            )
+        except (RuntimeError, OSError) as e_scapy: # e.g. "no route found", permissions for raw socket
+            if verbose: logger.info(f"    Scapy error during ICMP sweep: {e_scapy}")
+            scapy_errors.extend({"ip": ip_s, "error": str(e_scapy)} for ip_s in target_ips)
+            return {"live_hosts": [], "unreachable_hosts": [], "scapy_errors": scapy_errors, "general_errors": general_errors}
+
+        replied = {
+            sent[IP].dst
+            for sent, reply in answered
+            if reply.haslayer(ICMP) and reply[ICMP].type == 0
+        }
+        live_ips = [ip_s for ip_s in target_ips if ip_s in replied]
+        unreachable_hosts.extend({"ip": ip_s, "status": "down_or_filtered"} for ip_s in target_ips if ip_s not in replied)
+
+        from concurrent.futures import ThreadPoolExecutor
+        if live_ips:
+            # Reverse DNS is still per host, so keep it concurrent.
+            with ThreadPoolExecutor(max_workers=min(len(live_ips), 32)) as executor:
+                hostnames = list(executor.map(resolve_hostname_socket, live_ips))
+            for ip_s, hostname in zip(live_ips, hostnames):
+                hostname = hostname or ip_s
+                live_hosts.append({"ip": ip_s, "mac": None, "hostname": hostname, "vendor": None, "status": "up", "method": "icmp"})
+                if verbose: logger.info(f"ICMP Reply from: IP={ip_s}, Hostname={hostname}")
 
     except ValueError as e_val:
         general_errors.append(f"Invalid IP range/subnet for ICMP Ping Sweep: {e_val}")
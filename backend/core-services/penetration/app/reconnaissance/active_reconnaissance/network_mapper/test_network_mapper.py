@@ -1,11 +1,14 @@
-import unittest
+import os
+import socket
 import time
-import socket # For checking if target is resolvable
 from ipaddress import ip_network
+from unittest import mock
+
+import pytest
 
 # Assuming network_mapper.py is in the same directory or PYTHONPATH is set up
 # from .network_mapper import icmp_ping_sweep_scapy, discover_network_hosts, HAS_SCAPY, resolve_hostname_socket
-from network_mapper import icmp_ping_sweep_scapy, discover_network_hosts, HAS_SCAPY, resolve_hostname_socket
+from network_mapper import icmp_ping_sweep_scapy, discover_network_hosts, expand_host_ips, HAS_SCAPY, resolve_hostname_socket
 
 
 # Target for live tests
@@ -16,184 +19,141 @@ TARGET_NETWORK_SMALL = "45.33.32.156/30" # scanme.nmap.org (45.33.32.157) is in
                                          # Hosts: .157, .158
 INVALID_NETWORK_SPEC = "not-a-network"
 
-# Global delay between different scan types to be polite
-NETWORK_TEST_DELAY_MAPPER = 2.0
-
-class TestNetworkMapper(unittest.TestCase):
-
-    @classmethod
-    def setUpClass(cls):
-        """Check if target host is resolvable before running tests."""
-        cls.host_resolvable_mapper = False
-        try:
-            socket.gethostbyname(TARGET_HOST_LIVE)
-            cls.host_resolvable_mapper = True
-            print(f"\nTarget host {TARGET_HOST_LIVE} is resolvable. Proceeding with network mapper tests.")
-        except socket.gaierror:
-            print(f"\nWARNING: Target host {TARGET_HOST_LIVE} is not resolvable. Network mapper tests relying on it will be skipped.")
-
-    def test_01_resolve_hostname_socket_valid(self):
-        print(f"\nRunning test_01_resolve_hostname_socket_valid for {TARGET_HOST_LIVE}...")
-        if not self.host_resolvable_mapper:
-            self.skipTest(f"Target host {TARGET_HOST_LIVE} not resolvable.")
-
-        # Get IP of TARGET_HOST_LIVE first
-        try:
-            target_ip = socket.gethostbyname(TARGET_HOST_LIVE)
-            hostname = resolve_hostname_socket(target_ip)
-            self.assertIsNotNone(hostname, f"Should resolve hostname for IP {target_ip}")
-            self.assertIn(TARGET_HOST_LIVE.split('.')[1], hostname.lower(), f"Resolved hostname {hostname} doesn't seem to match {TARGET_HOST_LIVE}")
-        except socket.gaierror:
-            self.fail(f"Could not get IP for {TARGET_HOST_LIVE} to test hostname resolution.")
-        time.sleep(0.5) # Small delay
-
-    def test_02_resolve_hostname_socket_invalid(self):
-        print("\nRunning test_02_resolve_hostname_socket_invalid...")
-        hostname = resolve_hostname_socket(TARGET_HOST_LIKELY_DOWN) # Should not resolve
-        self.assertIsNone(hostname, f"Should not resolve hostname for {TARGET_HOST_LIKELY_DOWN}, got {hostname}")
-        time.sleep(0.5)
-
-    @unittest.skipIf(not HAS_SCAPY, "Scapy not available, skipping ICMP ping sweep tests.")
-    @unittest.expectedFailure # Due to likely permission errors for Scapy raw sockets in test env
-    def test_03_icmp_ping_sweep_single_live_host(self):
-        if not self.host_resolvable_mapper:
-            self.skipTest(f"Target host {TARGET_HOST_LIVE} not resolvable.")
-        print(f"\nRunning test_03_icmp_ping_sweep_single_live_host on {TARGET_HOST_LIVE}...")
-
-        target_ip = socket.gethostbyname(TARGET_HOST_LIVE) # Use actual IP
-        results = icmp_ping_sweep_scapy(target_ip, timeout=2.0, verbose=False)
-
-        self.assertIn("live_hosts", results)
-        self.assertIn("unreachable_hosts", results)
-        self.assertIn("scapy_errors", results)
-        self.assertIn("general_errors", results)
-
-        if results["general_errors"] or results["scapy_errors"]:
-            print(f"  Warnings/Errors during single live host ping: General={results['general_errors']}, Scapy={results['scapy_errors']}")
-            # This might indicate a permission issue for Scapy if live_hosts is empty.
-            if any("Operation not permitted" in e.get("error","") for e in results["scapy_errors"]):
-                 self.skipTest("Scapy operation not permitted, cannot reliably test ping sweep.")
-
-
-        self.assertEqual(len(results["live_hosts"]), 1, f"Expected 1 live host for {target_ip}, got {len(results['live_hosts'])}. Results: {results}")
-        if results["live_hosts"]:
-            self.assertEqual(results["live_hosts"][0]["ip"], target_ip)
-            self.assertIsNotNone(results["live_hosts"][0]["hostname"])
-
-        self.assertEqual(len(results["unreachable_hosts"]), 0)
-        time.sleep(NETWORK_TEST_DELAY_MAPPER)
-
-    @unittest.skipIf(not HAS_SCAPY, "Scapy not available, skipping ICMP ping sweep tests.")
-    @unittest.expectedFailure # Due to likely permission errors for Scapy raw sockets in test env
-    def test_04_icmp_ping_sweep_single_down_host(self):
-        print(f"\nRunning test_04_icmp_ping_sweep_single_down_host on {TARGET_HOST_LIKELY_DOWN}...")
-        results = icmp_ping_sweep_scapy(TARGET_HOST_LIKELY_DOWN, timeout=1.0, verbose=False)
-
-        self.assertEqual(len(results["live_hosts"]), 0)
-        # We expect it to be in unreachable_hosts or potentially a scapy_error if routing fails immediately
-        is_unreachable = any(h["ip"] == TARGET_HOST_LIKELY_DOWN for h in results["unreachable_hosts"])
-        is_scapy_error = any(e["ip"] == TARGET_HOST_LIKELY_DOWN for e in results["scapy_errors"])
-
-        self.assertTrue(is_unreachable or is_scapy_error,
-                        f"Host {TARGET_HOST_LIKELY_DOWN} was not found in unreachable_hosts or scapy_errors. Results: {results}")
-
-        if results["general_errors"] or results["scapy_errors"]:
-             print(f"  Warnings/Errors during single down host ping: General={results['general_errors']}, Scapy={results['scapy_errors']}")
-             if any("Operation not permitted" in e.get("error","") for e in results["scapy_errors"]):
-                 self.skipTest("Scapy operation not permitted, cannot reliably test ping sweep.")
-        time.sleep(NETWORK_TEST_DELAY_MAPPER)
-
-    @unittest.skipIf(not HAS_SCAPY, "Scapy not available, skipping ICMP ping sweep tests.")
-    @unittest.expectedFailure # Due to likely permission errors for Scapy raw sockets in test env
-    def test_05_icmp_ping_sweep_small_network(self):
-        if not self.host_resolvable_mapper: # scanme.nmap.org needs to be resolvable for this network to be meaningful here
-            self.skipTest(f"Target host {TARGET_HOST_LIVE} (part of test network) not resolvable.")
-        print(f"\nRunning test_05_icmp_ping_sweep_small_network on {TARGET_NETWORK_SMALL}...")
-
-        results = icmp_ping_sweep_scapy(TARGET_NETWORK_SMALL, timeout=1.5, verbose=False) # Increased timeout slightly for range
-
-        if results["general_errors"] or results["scapy_errors"]:
-             print(f"  Warnings/Errors during small network ping: General={results['general_errors']}, Scapy={results['scapy_errors']}")
-             if any("Operation not permitted" in e.get("error","") for e in results.get("scapy_errors",[])): # Check if scapy_errors exists
-                 self.skipTest("Scapy operation not permitted, cannot reliably test ping sweep for network.")
-
-        # Expected: at least scanme.nmap.org (45.33.32.157) should be up in this range.
-        # The other host in this /30 is .158. Network addr .156, broadcast .159.
-        found_scanme = any(h["ip"] == "45.33.32.157" for h in results["live_hosts"])
-        self.assertTrue(found_scanme, f"Expected {TARGET_HOST_LIVE} (45.33.32.157) to be live in network {TARGET_NETWORK_SMALL}. Live: {results['live_hosts']}")
-
-        # Check that other possible IPs in the range are either live or unreachable (or had scapy error)
-        network_obj = ip_network(TARGET_NETWORK_SMALL, strict=False)
-        expected_scan_ips = {str(ip) for ip in network_obj.hosts()}
-        all_processed_ips = {h["ip"] for h in results["live_hosts"]} | \
-                            {h["ip"] for h in results["unreachable_hosts"]} | \
-                            {e["ip"] for e in results.get("scapy_errors",[]) if "ip" in e}
-
-        self.assertEqual(expected_scan_ips, all_processed_ips,
-                         f"Not all expected IPs in {TARGET_NETWORK_SMALL} were processed. Expected: {expected_scan_ips}, Processed: {all_processed_ips}")
-
-        print(f"  Live hosts in {TARGET_NETWORK_SMALL}: {[h['ip'] for h in results['live_hosts']]}")
-        print(f"  Unreachable hosts in {TARGET_NETWORK_SMALL}: {[h['ip'] for h in results['unreachable_hosts']]}")
-        if results.get("scapy_errors"): print(f"  Scapy errors for {TARGET_NETWORK_SMALL}: {results['scapy_errors']}")
-
-        time.sleep(NETWORK_TEST_DELAY_MAPPER)
-
-    @unittest.skipIf(not HAS_SCAPY, "Scapy not available, skipping ICMP ping sweep tests.")
-    def test_06_icmp_ping_sweep_invalid_network(self):
-        print(f"\nRunning test_06_icmp_ping_sweep_invalid_network on {INVALID_NETWORK_SPEC}...")
-        results = icmp_ping_sweep_scapy(INVALID_NETWORK_SPEC)
-        self.assertTrue(len(results["general_errors"]) > 0, f"Expected general_errors for invalid spec, got none. Errors: {results['general_errors']}")
-        self.assertIn("Invalid IP range/subnet", results["general_errors"][0])
-        self.assertEqual(len(results["live_hosts"]), 0)
-        self.assertEqual(len(results["unreachable_hosts"]), 0)
-        time.sleep(NETWORK_TEST_DELAY_MAPPER)
-
-    # --- Tests for discover_network_hosts (focus on ICMP part) ---
-    @unittest.skipIf(not HAS_SCAPY, "Scapy not available, skipping discover_network_hosts test.")
-    def test_07_discover_network_hosts_icmp_only_live(self):
-        if not self.host_resolvable_mapper:
-            self.skipTest(f"Target host {TARGET_HOST_LIVE} not resolvable.")
-        print(f"\nRunning test_07_discover_network_hosts_icmp_only_live for {TARGET_HOST_LIVE}...")
-        target_ip = socket.gethostbyname(TARGET_HOST_LIVE)
-        results = discover_network_hosts(target_ip, do_arp=False, do_icmp=True, icmp_timeout=2.0)
-
-        if any("Operation not permitted" in e for e in results.get("errors",[])):
-            self.skipTest("Scapy operation not permitted, cannot reliably test discover_network_hosts.")
-
-        self.assertTrue(len(results["live_hosts"]) >= 1, f"Expected at least 1 live host, got {results['live_hosts']}")
-        if results["live_hosts"]:
-            self.assertEqual(results["live_hosts"][0]["ip"], target_ip)
-            self.assertIn("icmp", results["live_hosts"][0]["method"])
-
-        print(f"  discover_network_hosts (ICMP only) found: {[h['ip'] for h in results['live_hosts']]}")
-        if results.get("errors"): print(f"  Errors: {results['errors']}")
+# Global delay between different live scan types to be polite
+NETWORK_TEST_DELAY_MAPPER = 0.0 if os.environ.get("TAMSIL_FAST_TESTS") else 2.0
 
+# Tests that reach real hosts only run when TAMSIL_LIVE_TESTS is set
+live = pytest.mark.skipif(not os.environ.get("TAMSIL_LIVE_TESTS"), reason="live network test; set TAMSIL_LIVE_TESTS=1 to enable")
 
-if __name__ == '__main__':
-    host_is_currently_resolvable_mapper_main = False
+requires_scapy = pytest.mark.skipif(not HAS_SCAPY, reason="Scapy not available, skipping ICMP ping sweep tests.")
+# Due to likely permission errors for Scapy raw sockets in test env
+raw_socket_xfail = pytest.mark.xfail(reason="Scapy raw sockets usually need elevated privileges")
+
+
+@pytest.fixture(scope="session")
+def live_target_ip() -> str:
+    """Resolve the live target once per session, skipping when DNS is unavailable."""
     try:
-        socket.gethostbyname(TARGET_HOST_LIVE)
-        host_is_currently_resolvable_mapper_main = True
+        return socket.gethostbyname(TARGET_HOST_LIVE)
     except socket.gaierror:
-        pass
-
-    if not host_is_currently_resolvable_mapper_main:
-        print(f"CRITICAL: Target host {TARGET_HOST_LIVE} for network mapper tests is not resolvable. Aborting test run.")
-        TestNetworkMapper.host_resolvable_mapper = False # Set for completeness for test methods
-    else:
-        TestNetworkMapper.host_resolvable_mapper = True # Ensure it's set for script execution and test methods
-        suite = unittest.TestSuite()
-        tests_to_run = [
-            TestNetworkMapper('test_01_resolve_hostname_socket_valid'),
-            TestNetworkMapper('test_02_resolve_hostname_socket_invalid'),
-            TestNetworkMapper('test_03_icmp_ping_sweep_single_live_host'),
-            TestNetworkMapper('test_04_icmp_ping_sweep_single_down_host'),
-            TestNetworkMapper('test_05_icmp_ping_sweep_small_network'),
-            TestNetworkMapper('test_06_icmp_ping_sweep_invalid_network'),
-            TestNetworkMapper('test_07_discover_network_hosts_icmp_only_live'),
-        ]
-        for test in tests_to_run:
-            suite.addTest(test)
-        runner = unittest.TextTestRunner(verbosity=2)
-        runner.run(suite)
-        # unittest.main(verbosity=2)
+        pytest.skip(f"Target host {TARGET_HOST_LIVE} not resolvable.")
+
+
+def _skip_if_not_permitted(errors) -> None:
+    if any("Operation not permitted" in e.get("error", "") for e in errors):
+        pytest.skip("Scapy operation not permitted, cannot reliably test ping sweep.")
+
+
+@live
+def test_01_resolve_hostname_socket_valid(live_target_ip):
+    hostname = resolve_hostname_socket(live_target_ip)
+    assert hostname is not None, f"Should resolve hostname for IP {live_target_ip}"
+    assert TARGET_HOST_LIVE.split('.')[1] in hostname.lower(), \
+        f"Resolved hostname {hostname} doesn't seem to match {TARGET_HOST_LIVE}"
+
+
+def test_02_resolve_hostname_socket_invalid():
+    with mock.patch("socket.gethostbyaddr", side_effect=socket.herror("unknown host")):
+        hostname = resolve_hostname_socket(TARGET_HOST_LIKELY_DOWN) # Should not resolve
+    assert hostname is None, f"Should not resolve hostname for {TARGET_HOST_LIKELY_DOWN}, got {hostname}"
+
+
+def test_02b_resolve_hostname_socket_valid_mocked():
+    with mock.patch("socket.gethostbyaddr", return_value=("scanme.nmap.org", [], ["45.33.32.157"])):
+        assert resolve_hostname_socket("45.33.32.157") == "scanme.nmap.org"
+
+
+@live
+@requires_scapy
+@raw_socket_xfail
+def test_03_icmp_ping_sweep_single_live_host(live_target_ip):
+    results = icmp_ping_sweep_scapy(live_target_ip, timeout=2.0, verbose=False)
+
+    assert "live_hosts" in results
+    assert "unreachable_hosts" in results
+    assert "scapy_errors" in results
+    assert "general_errors" in results
+    _skip_if_not_permitted(results["scapy_errors"])
+
+    assert len(results["live_hosts"]) == 1, \
+        f"Expected 1 live host for {live_target_ip}, got {len(results['live_hosts'])}. Results: {results}"
+    assert results["live_hosts"][0]["ip"] == live_target_ip
+    assert results["live_hosts"][0]["hostname"] is not None
+    assert len(results["unreachable_hosts"]) == 0
+    time.sleep(NETWORK_TEST_DELAY_MAPPER)
+
+
+@live
+@requires_scapy
+@raw_socket_xfail
+def test_04_icmp_ping_sweep_single_down_host():
+    results = icmp_ping_sweep_scapy(TARGET_HOST_LIKELY_DOWN, timeout=1.0, verbose=False)
+
+    assert len(results["live_hosts"]) == 0
+    # We expect it to be in unreachable_hosts or potentially a scapy_error if routing fails immediately
+    is_unreachable = any(h["ip"] == TARGET_HOST_LIKELY_DOWN for h in results["unreachable_hosts"])
+    is_scapy_error = any(e["ip"] == TARGET_HOST_LIKELY_DOWN for e in results["scapy_errors"])
+    assert is_unreachable or is_scapy_error, \
+        f"Host {TARGET_HOST_LIKELY_DOWN} was not found in unreachable_hosts or scapy_errors. Results: {results}"
+    _skip_if_not_permitted(results["scapy_errors"])
+    time.sleep(NETWORK_TEST_DELAY_MAPPER)
+
+
+@live
+@requires_scapy
+@raw_socket_xfail
+def test_05_icmp_ping_sweep_small_network(live_target_ip):
+    results = icmp_ping_sweep_scapy(TARGET_NETWORK_SMALL, timeout=1.5, verbose=False) # Increased timeout slightly for range
+    _skip_if_not_permitted(results.get("scapy_errors", []))
+
+    # Expected: at least scanme.nmap.org (45.33.32.157) should be up in this range.
+    # The other host in this /30 is .158. Network addr .156, broadcast .159.
+    found_scanme = any(h["ip"] == "45.33.32.157" for h in results["live_hosts"])
+    assert found_scanme, \
+        f"Expected {TARGET_HOST_LIVE} (45.33.32.157) to be live in network {TARGET_NETWORK_SMALL}. Live: {results['live_hosts']}"
+
+    # Check that other possible IPs in the range are either live or unreachable (or had scapy error)
+    network_obj = ip_network(TARGET_NETWORK_SMALL, strict=False)
+    expected_scan_ips = set(expand_host_ips(network_obj))
+    all_processed_ips = {h["ip"] for h in results["live_hosts"]} | \
+                        {h["ip"] for h in results["unreachable_hosts"]} | \
+                        {e["ip"] for e in results.get("scapy_errors", []) if "ip" in e}
+    assert expected_scan_ips == all_processed_ips, \
+        f"Not all expected IPs in {TARGET_NETWORK_SMALL} were processed. Expected: {expected_scan_ips}, Processed: {all_processed_ips}"
+    time.sleep(NETWORK_TEST_DELAY_MAPPER)
+
+
+@pytest.mark.parametrize("spec", ["10.0.0.0/30", "10.1.0.0/22", "10.0.0.7/31", "10.0.0.7/32", "2001:db8::/126"])
+def test_05b_expand_host_ips_matches_hosts(spec):
+    network_obj = ip_network(spec, strict=False)
+    assert expand_host_ips(network_obj) == [str(ip) for ip in network_obj.hosts()]
+
+
+@requires_scapy
+def test_06_icmp_ping_sweep_invalid_network():
+    # The spec is rejected while parsing, before any packet is sent.
+    results = icmp_ping_sweep_scapy(INVALID_NETWORK_SPEC)
+    assert len(results["general_errors"]) > 0, \
+        f"Expected general_errors for invalid spec, got none. Errors: {results['general_errors']}"
+    assert "Invalid IP range/subnet" in results["general_errors"][0]
+    assert len(results["live_hosts"]) == 0
+    assert len(results["unreachable_hosts"]) == 0
+
+
+# --- Tests for discover_network_hosts (focus on ICMP part) ---
+@live
+@pytest.mark.skipif(not HAS_SCAPY, reason="Scapy not available, skipping discover_network_hosts test.")
+def test_07_discover_network_hosts_icmp_only_live(live_target_ip):
+    results = discover_network_hosts(live_target_ip, do_arp=False, do_icmp=True, icmp_timeout=2.0)
+
+    if any("Operation not permitted" in e for e in results.get("errors", [])):
+        pytest.skip("Scapy operation not permitted, cannot reliably test discover_network_hosts.")
+
+    assert len(results["live_hosts"]) >= 1, f"Expected at least 1 live host, got {results['live_hosts']}"
+    assert results["live_hosts"][0]["ip"] == live_target_ip
+    assert "icmp" in results["live_hosts"][0]["method"]
+
+
+if __name__ == '__main__':
+    os.environ.setdefault("TAMSIL_LIVE_TESTS", "1")
+    raise SystemExit(pytest.main([__file__, "-v"]))
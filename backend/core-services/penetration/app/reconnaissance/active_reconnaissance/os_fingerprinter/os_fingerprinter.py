@@ -1,15 +1,22 @@
+import os
+import select
 import socket
+import struct
 import re
 import time
 import random  # Added import for random
+from bisect import bisect_right
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 from logging_config import get_logger
 logger = get_logger(__name__)
 
+from ..raw_sockets import inet_checksum
+from ..scapy_sockets import PersistentSendSock
+
 # Scapy is approved per network_mapper.py comments
 try:
-    from scapy.all import IP, TCP, ICMP, sr1, conf as scapy_conf
+    from scapy.all import IP, TCP, ICMP, conf as scapy_conf
     scapy_conf.verb = 0 # Suppress Scapy's verbose output
     HAS_SCAPY = True
 except ImportError:
@@ -40,12 +47,18 @@ WINDOW_SIZE_OS_MAP = {
     # Add more specific known default window sizes if available
 }
 
+# TTL_OS_MAP flattened into sorted bins for bisect lookups.
+_TTL_BINS = sorted(TTL_OS_MAP.items(), key=lambda item: item[0].start)
+_TTL_BIN_STARTS = [ttl_range.start for ttl_range, _ in _TTL_BINS]
+
 
 def get_os_from_ttl(ttl_value: int) -> str:
     """Guess an operating system based on TTL value."""
     if not isinstance(ttl_value, int):
         return "Unknown (Invalid TTL)"
-    for ttl_range, os_guess in TTL_OS_MAP.items():
+    idx = bisect_right(_TTL_BIN_STARTS, ttl_value) - 1
+    if idx >= 0:
+        ttl_range, os_guess = _TTL_BINS[idx]
         if ttl_value in ttl_range:
             return f"{os_guess} (TTL: {ttl_value})"
     return f"Unknown OS (TTL: {ttl_value})"
@@ -55,44 +68,67 @@ def get_os_from_window_size(window_size: int) -> str:
     """Guess an operating system based on TCP window size."""
     if not isinstance(window_size, int):
         return "Unknown (Invalid Window Size)"
-    if window_size in WINDOW_SIZE_OS_MAP:
-        return f"{WINDOW_SIZE_OS_MAP[window_size]} (Window: {window_size})"
+    os_guess = WINDOW_SIZE_OS_MAP.get(window_size)
+    if os_guess is not None:
+        return f"{os_guess} (Window: {window_size})"
     return f"Potentially custom or less common OS (Window: {window_size})"
 
 
-def fingerprint_os_single_target(
-    target_ip: str,
-    open_tcp_port: Optional[int] = None,
-    timeout: float = DEFAULT_OS_PROBE_TIMEOUT,
-) -> Dict[str, Any]:
-    """Perform basic OS fingerprinting on a single target.
+def _raw_ping_ttl(target_ip: str, timeout: float = DEFAULT_OS_PROBE_TIMEOUT) -> Optional[int]:
+    """Send one ICMP echo over a raw socket and return the reply's IP TTL.
 
-    Args:
-        target_ip: Target IP address.
-        open_tcp_port: Known open TCP port; if ``None`` only ICMP is used.
-        timeout: Probe timeout in seconds.
+    Avoids Scapy's packet dissection for the single value the TTL heuristic
+    needs. Requires raw-socket privileges, like Scapy itself.
 
     Returns:
-        Dictionary containing TTL and window-size-based guesses and any errors.
-    """
-    if not HAS_SCAPY:
-        return {
-            "ip": target_ip,
-            "ttl_os_guess": "Requires Scapy",
-            "window_os_guess": "Requires Scapy for reliable check / open port",
-            "errors": ["Scapy not available, OS fingerprinting limited."],
-        }
-
-    results = {"ip": target_ip, "ttl_os_guess": "N/A", "window_os_guess": "N/A", "errors": []}
+        The TTL of the echo reply, or ``None`` if none arrived within ``timeout``.
 
+    Raises:
+        OSError: If the raw socket cannot be opened or the send fails.
+    """
+    dest = socket.gethostbyname(target_ip)
+    ident = os.getpid() & 0xFFFF
+    seq = random.randint(0, 0xFFFF)
+    payload = b"tamsil-os-fp"
+    header = struct.pack("!BBHHH", 8, 0, 0, ident, seq)
+    packet = struct.pack("!BBHHH", 8, 0, inet_checksum(header + payload), ident, seq) + payload
+
+    with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP) as sock:
+        sock.sendto(packet, (dest, 0))
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            if not select.select([sock], [], [], remaining)[0]:
+                break
+            data, (src, _) = sock.recvfrom(1024)
+            ihl = (data[0] & 0x0F) * 4
+            if src != dest or len(data) < ihl + 8:
+                continue
+            icmp_type, _, _, reply_ident, reply_seq = struct.unpack_from("!BBHHH", data, ihl)
+            if icmp_type == 0 and reply_ident == ident and reply_seq == seq:
+                return data[8]
+    return None
+
+
+def _probe_os(
+    sock: Any,
+    target_ip: str,
+    open_tcp_port: Optional[int],
+    timeout: float,
+    results: Dict[str, Any],
+) -> None:
+    """Run the ICMP and TCP probes for :func:`fingerprint_os_single_target` over ``sock``."""
     # 1. TTL-based guess using ICMP Echo Request (Ping)
     # This is often blocked by firewalls.
     icmp_ttl = None
     try:
-        pkt = IP(dst=target_ip)/ICMP()
-        reply = sr1(pkt, timeout=timeout, verbose=0)
-        if reply and reply.haslayer(IP):
-            icmp_ttl = reply.ttl
+        try:
+            icmp_ttl = _raw_ping_ttl(target_ip, timeout)
+        except OSError:
+            # Raw ICMP socket unavailable; let Scapy try over the shared socket.
+            reply = sock.sr1(IP(dst=target_ip)/ICMP(), timeout=timeout, verbose=0)
+            if reply and reply.haslayer(IP):
+                icmp_ttl = reply.ttl
+        if icmp_ttl is not None:
             results["ttl_os_guess"] = get_os_from_ttl(icmp_ttl)
             results["ttl_source"] = "ICMP Echo Reply"
         else:
@@ -126,7 +162,7 @@ def fingerprint_os_single_target(
         # print(f"Attempting TCP fingerprint on {target_ip}:{port_to_probe}")
         try:
             syn_pkt = IP(dst=target_ip)/TCP(dport=port_to_probe, flags="S", window=random.randint(1000,2000)*10) # Send a decent window
-            syn_ack_reply = sr1(syn_pkt, timeout=timeout, verbose=0)
+            syn_ack_reply = sock.sr1(syn_pkt, timeout=timeout, verbose=0)
 
             if syn_ack_reply and syn_ack_reply.haslayer(TCP) and syn_ack_reply[TCP].flags == 0x12: # SYN-ACK
                 tcp_ttl = syn_ack_reply.ttl
@@ -141,7 +177,7 @@ def fingerprint_os_single_target(
 
                 # Send RST to close
                 rst_pkt = IP(dst=target_ip)/TCP(dport=port_to_probe, sport=syn_ack_reply[TCP].dport, seq=syn_ack_reply[TCP].ack, ack=syn_ack_reply[TCP].seq + 1, flags="R")
-                sr1(rst_pkt, timeout=0.2, verbose=0) # Send and don't wait long
+                sock.send(rst_pkt) # Fire and forget
             else:
                 results["errors"].append(f"No SYN-ACK received from {target_ip}:{port_to_probe} (port may be closed/filtered).")
         except Exception as e:
@@ -151,6 +187,48 @@ def fingerprint_os_single_target(
         results["window_os_guess"] = "Failed (No open port for TCP method)"
 
 
+def fingerprint_os_single_target(
+    target_ip: str,
+    open_tcp_port: Optional[int] = None,
+    timeout: float = DEFAULT_OS_PROBE_TIMEOUT,
+    l3_socket: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """Perform basic OS fingerprinting on a single target.
+
+    Args:
+        target_ip: Target IP address.
+        open_tcp_port: Known open TCP port; if ``None`` only ICMP is used.
+        timeout: Probe timeout in seconds.
+        l3_socket: Optional Scapy L3 socket to reuse for every probe. One is
+            opened for this call if omitted.
+
+    Returns:
+        Dictionary containing TTL and window-size-based guesses and any errors.
+    """
+    if not HAS_SCAPY:
+        results = {
+            "ip": target_ip,
+            "ttl_os_guess": "Requires Scapy",
+            "window_os_guess": "Requires Scapy for reliable check / open port",
+            "errors": ["Scapy not available, OS fingerprinting limited."],
+        }
+        # The ICMP TTL guess only needs a raw socket, not Scapy.
+        try:
+            icmp_ttl = _raw_ping_ttl(target_ip, timeout)
+        except OSError:
+            icmp_ttl = None
+        if icmp_ttl is not None:
+            results["ttl_os_guess"] = get_os_from_ttl(icmp_ttl)
+            results["ttl_source"] = "ICMP Echo Reply"
+        return results
+
+    results = {"ip": target_ip, "ttl_os_guess": "N/A", "window_os_guess": "N/A", "errors": []}
+    try:
+        with PersistentSendSock(l3_socket, target_ip) as sock:
+            _probe_os(sock, target_ip, open_tcp_port, timeout, results)
+    except Exception as e:
+        results["errors"].append(f"Error opening raw socket for OS fingerprinting: {e}")
+
     # Clean up results if some parts failed
     if not results["ttl_os_guess"] or results["ttl_os_guess"] == "N/A":
         if "Requires Scapy" not in results["ttl_os_guess"]:
@@ -1,28 +1,26 @@
+import os
 import unittest
 import time
-import socket # For checking if target is resolvable
 
-# Assuming os_fingerprinter.py is in the same directory or PYTHONPATH is set up
-# from .os_fingerprinter import fingerprint_os_single_target, get_os_from_ttl, get_os_from_window_size, HAS_SCAPY
-from os_fingerprinter import fingerprint_os_single_target, get_os_from_ttl, get_os_from_window_size, HAS_SCAPY
+from .._resolve import resolve
+from .os_fingerprinter import fingerprint_os_single_target, get_os_from_ttl, get_os_from_window_size, HAS_SCAPY
 
 # Target for live tests
 TARGET_HOST_OS = "scanme.nmap.org" # Known to be Linux
 # TARGET_HOST_OS = "127.0.0.1" # For local testing against a known OS
 
-NETWORK_TEST_DELAY_OS = 1.5
+NETWORK_TEST_DELAY_OS = 0.0 if os.environ.get("TAMSIL_FAST_TESTS") else 1.5
+
 
 class TestOSFingerprinter(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
         """Check if target host is resolvable before running tests."""
-        cls.host_resolvable_os = False
-        try:
-            socket.gethostbyname(TARGET_HOST_OS)
-            cls.host_resolvable_os = True
+        cls.host_resolvable_os = resolve(TARGET_HOST_OS) is not None
+        if cls.host_resolvable_os:
             print(f"\nTarget host {TARGET_HOST_OS} is resolvable. Proceeding with OS fingerprinting tests.")
-        except socket.gaierror:
+        else:
             print(f"\nWARNING: Target host {TARGET_HOST_OS} is not resolvable. OS fingerprinting tests will be skipped.")
 
     def test_01_get_os_from_ttl(self):
@@ -84,12 +82,7 @@ class TestOSFingerprinter(unittest.TestCase):
         time.sleep(NETWORK_TEST_DELAY_OS)
 
 if __name__ == '__main__':
-    host_is_currently_resolvable_os_main = False
-    try:
-        socket.gethostbyname(TARGET_HOST_OS)
-        host_is_currently_resolvable_os_main = True
-    except socket.gaierror:
-        pass
+    host_is_currently_resolvable_os_main = resolve(TARGET_HOST_OS) is not None
 
     if not host_is_currently_resolvable_os_main:
         print(f"CRITICAL: Target host {TARGET_HOST_OS} for OS fingerprinting tests is not resolvable. Aborting test run.")
@@ -1,4 +1,12 @@
+import asyncio
+import ctypes
+import errno
+import os
+import re
+import select
 import socket
+import sys
+import struct
 import time
 import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -7,6 +15,9 @@ from typing import Any, Dict, List, Optional
 from logging_config import get_logger
 logger = get_logger(__name__)
 
+from ..raw_sockets import inet_checksum
+from ..scapy_sockets import PersistentSendSock
+
 # Scapy is approved per network_mapper.py comments
 try:
     from scapy.all import IP, TCP, UDP, ICMP, sr1, sr, conf as scapy_conf
@@ -16,10 +27,17 @@ except ImportError:
     HAS_SCAPY = False
     logger.info("Warning: Scapy library not found. Advanced scans (SYN, UDP with Scapy) will be disabled.")
 
+try:
+    import uvloop as _uvloop
+except ImportError:
+    _uvloop = None
+
 # Default timeout for socket connections in seconds
 DEFAULT_SOCKET_TIMEOUT = 1.0
 # Default number of threads for concurrent scanning
 DEFAULT_THREADS = 10
+# Maximum in-flight TCP connects for the asyncio connect scan
+DEFAULT_CONNECT_CONCURRENCY = 500
 
 class ScanType(Enum):
     TCP_CONNECT = "TCP Connect"
@@ -51,6 +69,28 @@ COMMON_PORTS = {
     8000: "Development HTTP (Common Alt)", 8080: "HTTP Alt (Tomcat, etc.)", 8443: "HTTPS Alt",
     27017: "MongoDB", 27018: "MongoDB Shard"
 }
+# Precomputed views of COMMON_PORTS for parse_ports("common").
+_COMMON_PORTS_FROZEN = frozenset(COMMON_PORTS)
+_COMMON_PORTS_SORTED = tuple(sorted(_COMMON_PORTS_FROZEN))
+
+
+# SO_LINGER {on, 0s}: close() sends RST instead of FIN, so probed connections
+# never sit in TIME_WAIT holding an ephemeral port. Reconnaissance only needs
+# the "open" signal, not a graceful shutdown.
+_LINGER_RST = struct.pack("ii", 1, 0)
+
+
+def _abort_on_close(sock: Optional[socket.socket]) -> None:
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RST)
+    except OSError:
+        pass
+
+
+# One comma-separated token: a port or a "start-end" range, whitespace tolerated.
+_PORT_TOKEN_RE = re.compile(r"\s*([0-9]+)\s*(?:-\s*([0-9]+)\s*)?")
 
 
 def parse_ports(port_spec: Optional[str]) -> List[int]:
@@ -73,35 +113,37 @@ def parse_ports(port_spec: Optional[str]) -> List[int]:
 
     ports: set[int] = set()
     if port_spec.lower() == "common":
-        return sorted(list(COMMON_PORTS.keys()))
-
-    parts = port_spec.split(',')
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-        if part.lower() == "common":
-            ports.update(COMMON_PORTS.keys())
-            continue
-        if '-' in part:
-            try:
-                start, end = map(int, part.split('-', 1))
-                if 1 <= start <= end <= 65535:
-                    ports.update(range(start, end + 1))
-                else:
-                    logger.info(f"Warning: Invalid port range '{part}'. Skipping.")
-            except ValueError:
+        return list(_COMMON_PORTS_SORTED)
+
+    for part in port_spec.split(','):
+        match = _PORT_TOKEN_RE.fullmatch(part)
+        if match is None:
+            part = part.strip()
+            if not part:
+                continue
+            if part.lower() == "common":
+                ports |= _COMMON_PORTS_FROZEN
+            elif '-' in part:
                 logger.info(f"Warning: Invalid port range format '{part}'. Skipping.")
-        elif part.isdigit():
-            port_num = int(part)
-            if 1 <= port_num <= 65535:
-                ports.add(port_num)
             else:
-                logger.info(f"Warning: Invalid port number '{part}'. Skipping.")
+                logger.info(f"Warning: Invalid port specification '{part}'. Skipping.")
+            continue
+
+        start_str, end_str = match.groups()
+        start = int(start_str)
+        if end_str is None:
+            if 1 <= start <= 65535:
+                ports.add(start)
+            else:
+                logger.info(f"Warning: Invalid port number '{part.strip()}'. Skipping.")
         else:
-            logger.info(f"Warning: Invalid port specification '{part}'. Skipping.")
+            end = int(end_str)
+            if 1 <= start <= end <= 65535:
+                ports.update(range(start, end + 1))
+            else:
+                logger.info(f"Warning: Invalid port range '{part.strip()}'. Skipping.")
 
-    return sorted(list(ports))
+    return sorted(ports)
 
 
 def tcp_connect_scan_port(target_ip: str, port: int, timeout: float = DEFAULT_SOCKET_TIMEOUT) -> bool:
@@ -119,6 +161,8 @@ def tcp_connect_scan_port(target_ip: str, port: int, timeout: float = DEFAULT_SO
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
             sock.settimeout(timeout)
             result = sock.connect_ex((target_ip, port))
+            if result == 0:
+                _abort_on_close(sock)
             return result == 0
     except socket.gaierror:
         return False
@@ -128,6 +172,57 @@ def tcp_connect_scan_port(target_ip: str, port: int, timeout: float = DEFAULT_SO
         return False
 
 
+async def _tcp_connect_probe(target_ip: str, port: int, timeout: float, semaphore: asyncio.Semaphore) -> bool:
+    async with semaphore:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(target_ip, port), timeout)
+        except (asyncio.TimeoutError, OSError):
+            return False
+        _abort_on_close(writer.get_extra_info("socket"))
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
+
+async def _tcp_connect_async(
+    target_ip: str,
+    ports: List[int],
+    timeout: float,
+    concurrency: int = DEFAULT_CONNECT_CONCURRENCY,
+) -> List[tuple[int, bool]]:
+    """Probe ``ports`` with non-blocking connects, ``concurrency`` at a time.
+
+    Returns:
+        ``(port, is_open)`` pairs in the order of ``ports``.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results = await asyncio.gather(
+        *(_tcp_connect_probe(target_ip, port, timeout, semaphore) for port in ports)
+    )
+    return list(zip(ports, results))
+
+
+def _run_coroutine(coro):
+    """Run ``coro`` to completion from synchronous code.
+
+    Uses uvloop's event loop when it is installed (it already ships with the
+    service on non-Windows hosts), which drives the thousands of in-flight
+    connects with markedly less per-socket overhead than the default loop.
+    Falls back to a helper thread when the caller is already inside a
+    running event loop (e.g. an async FastAPI handler).
+    """
+    runner = _uvloop.run if _uvloop is not None else asyncio.run
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return runner(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(runner, coro).result()
+
+
 def tcp_syn_scan_port(target_ip: str, port: int, timeout: float = DEFAULT_SOCKET_TIMEOUT) -> str:
     """Perform a TCP SYN scan using Scapy.
 
@@ -169,6 +264,295 @@ def tcp_syn_scan_port(target_ip: str, port: int, timeout: float = DEFAULT_SOCKET
         return "error_scan_exception"
 
 
+def _syn_batch(
+    target_ip: str,
+    ports: List[int],
+    timeout: float = DEFAULT_SOCKET_TIMEOUT,
+    l3_socket: Optional[Any] = None,
+) -> Dict[int, str]:
+    """SYN-scan ``ports`` with a single Scapy ``sr()`` call.
+
+    Scapy opens a raw socket per send/receive call, so probing port by
+    port with ``sr1`` pays that setup once per port. Sending every SYN in
+    one batch pays it once per scan. Open ports are torn down with one
+    batched RST.
+
+    Returns:
+        Mapping of port to ``"open"``, ``"closed"`` or ``"filtered"``, or
+        to ``"error_scan_exception"`` for every port if the batch failed.
+    """
+    src_port = random.randint(1024, 65535)
+    probe = IP(dst=target_ip) / TCP(sport=src_port, dport=list(ports), flags="S")
+    try:
+        with PersistentSendSock(l3_socket, target_ip) as sock:
+            answered, _ = sock.sr(probe, timeout=timeout, verbose=0, inter=0, retry=0)
+
+            # Anything without a reply stays filtered.
+            statuses = {port: "filtered" for port in ports}
+            resets = []
+            for sent_pkt, response in answered:
+                port = sent_pkt[TCP].dport
+                if not response.haslayer(TCP):
+                    continue
+                flags = int(response[TCP].flags)
+                if flags == 0x12:
+                    statuses[port] = "open"
+                    resets.append(IP(dst=target_ip) / TCP(sport=src_port, dport=port, flags="R", seq=response[TCP].ack))
+                elif flags in (0x14, 0x04):
+                    statuses[port] = "closed"
+
+            for reset in resets:
+                try:
+                    sock.send(reset)
+                except Exception:
+                    pass
+    except Exception:
+        return {port: "error_scan_exception" for port in ports}
+    return statuses
+
+
+# TCP header without options: sport, dport, seq, ack, data offset, flags, window, checksum, urgent
+_TCP_HEADER = struct.Struct("!HHIIBBHHH")
+
+
+def _syn_batch_socket(target_ip: str, ports: List[int], timeout: float = DEFAULT_SOCKET_TIMEOUT) -> Dict[int, str]:
+    """SYN-scan ``ports`` through one raw IPv4 socket, for hosts without Scapy.
+
+    Only the TCP header is built (the kernel adds the IP header); it is packed
+    once per port with the destination port and checksum filled in. Every SYN
+    is sent before a single ``select``/``recv`` loop classifies the replies.
+    The kernel answers SYN-ACKs with a RST itself, since no local socket owns
+    the source port. Needs ``CAP_NET_RAW``.
+
+    Returns:
+        Same mapping as :func:`_syn_batch`.
+    """
+    statuses = {port: "filtered" for port in ports}
+    src_port = random.randint(1024, 65535)
+    seq = random.getrandbits(32)
+    try:
+        # Connecting a datagram socket reveals the source address the kernel
+        # will route from, which the checksum's pseudo-header needs.
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as route_probe:
+            route_probe.connect((target_ip, 9))
+            src_ip = route_probe.getsockname()[0]
+        dst = socket.inet_aton(target_ip)
+        pseudo_header = socket.inet_aton(src_ip) + dst + struct.pack("!BBH", 0, socket.IPPROTO_TCP, _TCP_HEADER.size)
+
+        with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP) as sock:
+            for port in ports:
+                header = _TCP_HEADER.pack(src_port, port, seq, 0, 5 << 4, 0x02, 1024, 0, 0)
+                checksum = inet_checksum(pseudo_header + header)
+                sock.sendto(_TCP_HEADER.pack(src_port, port, seq, 0, 5 << 4, 0x02, 1024, checksum, 0), (target_ip, 0))
+            sock.setblocking(False)
+
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                readable, _, _ = select.select([sock], [], [], remaining)
+                if not readable:
+                    break
+                try:
+                    packet = sock.recv(65535)
+                except (BlockingIOError, InterruptedError):
+                    continue
+                ihl = (packet[0] & 0x0F) * 4
+                if len(packet) < ihl + 14 or packet[12:16] != dst:
+                    continue
+                reply_sport, reply_dport = struct.unpack_from("!HH", packet, ihl)
+                if reply_dport != src_port or reply_sport not in statuses:
+                    continue
+                flags = packet[ihl + 13]
+                if flags == 0x12:
+                    statuses[reply_sport] = "open"
+                elif flags in (0x14, 0x04):
+                    statuses[reply_sport] = "closed"
+    except OSError:
+        return {port: "error_scan_exception" for port in ports}
+    return statuses
+
+
+def _udp_batch(
+    target_ip: str,
+    ports: List[int],
+    timeout: float = DEFAULT_SOCKET_TIMEOUT,
+    l3_socket: Optional[Any] = None,
+) -> Dict[int, str]:
+    """UDP-scan ``ports`` with one Scapy ``sr()`` over a single L3 socket.
+
+    Returns:
+        Mapping of port to ``"open"``, ``"closed"``, ``"filtered"`` or
+        ``"open|filtered"``; ``"error_scan_exception"`` for every port if the
+        batch failed.
+    """
+    probe = IP(dst=target_ip) / UDP(sport=random.randint(1024, 65535), dport=list(ports))
+    try:
+        with PersistentSendSock(l3_socket, target_ip) as sock:
+            answered, _ = sock.sr(probe, timeout=timeout, verbose=0, inter=0, retry=0)
+    except Exception:
+        return {port: "error_scan_exception" for port in ports}
+
+    statuses = {port: "open|filtered" for port in ports}
+    for sent_pkt, response in answered:
+        port = sent_pkt[UDP].dport
+        if response.haslayer(UDP):
+            statuses[port] = "open"
+        elif response.haslayer(ICMP) and response[ICMP].type == 3:
+            if response[ICMP].code == 3:
+                statuses[port] = "closed"
+            elif response[ICMP].code in (1, 2, 9, 10, 13):
+                statuses[port] = "filtered"
+    return statuses
+
+
+# --- Unprivileged UDP batch (no Scapy) -------------------------------------
+# Linux-only knobs; the values are stable ABI but not all exposed by ``socket``.
+_IP_RECVERR = getattr(socket, "IP_RECVERR", 11)
+_MSG_ERRQUEUE = getattr(socket, "MSG_ERRQUEUE", 0x2000)
+_SO_EE_ORIGIN_ICMP = 2
+_UIO_MAXIOV = 1024
+# Queued ICMP errors count against the receive buffer; the default fills after
+# a few hundred and further "closed" replies would be dropped.
+_UDP_BATCH_RCVBUF = 4 << 20
+# With IP_RECVERR, an ICMP error for an earlier probe is also reported once
+# by the next send. The error queue records it, so the send is just retried.
+_DEFERRED_ICMP_ERRNOS = frozenset({errno.ECONNREFUSED, errno.EHOSTUNREACH, errno.ENETUNREACH, errno.EACCES})
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_sendmmsg():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).sendmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_sendmmsg = _load_sendmmsg()
+
+
+def _send_udp_probes(sock: socket.socket, target_ip: str, ports: List[int]) -> None:
+    """Send one empty datagram to each port, batching syscalls with sendmmsg(2) where available."""
+    if _sendmmsg is None:
+        for port in ports:
+            try:
+                sock.sendto(b"", (target_ip, port))
+            except OSError as e:
+                if e.errno not in _DEFERRED_ICMP_ERRNOS:
+                    raise
+                sock.sendto(b"", (target_ip, port))
+        return
+
+    packed_ip = socket.inet_aton(target_ip)
+    empty = _IoVec(None, 0)
+    for offset in range(0, len(ports), _UIO_MAXIOV):
+        chunk = ports[offset:offset + _UIO_MAXIOV]
+        # struct sockaddr_in: family (host order), port (network order), address, zero padding.
+        addrs = [
+            ctypes.create_string_buffer(struct.pack("=H", socket.AF_INET) + struct.pack("!H", port) + packed_ip + bytes(8), 16)
+            for port in chunk
+        ]
+        msgs = (_MMsgHdr * len(chunk))()
+        for msg, addr in zip(msgs, addrs):
+            msg.msg_hdr.msg_name = ctypes.cast(addr, ctypes.c_void_p)
+            msg.msg_hdr.msg_namelen = 16
+            msg.msg_hdr.msg_iov = ctypes.pointer(empty)
+            msg.msg_hdr.msg_iovlen = 1
+        sent = 0
+        retried = -1
+        while sent < len(chunk):
+            head = ctypes.cast(ctypes.addressof(msgs) + sent * ctypes.sizeof(_MMsgHdr), ctypes.POINTER(_MMsgHdr))
+            rc = _sendmmsg(sock.fileno(), head, len(chunk) - sent, 0)
+            if rc < 0:
+                err = ctypes.get_errno()
+                # Retry a message once, as above; a second failure is persistent
+                # (e.g. EACCES for a broadcast address) rather than a deferred error.
+                if err in _DEFERRED_ICMP_ERRNOS and retried != sent:
+                    retried = sent
+                    continue
+                raise OSError(err, f"sendmmsg failed: {os.strerror(err)}")
+            sent += rc
+
+
+def _udp_batch_socket(target_ip: str, ports: List[int], timeout: float = DEFAULT_SOCKET_TIMEOUT) -> Dict[int, str]:
+    """UDP-scan ``ports`` from one unprivileged datagram socket.
+
+    All probes go out back to back (via ``sendmmsg`` on Linux). ICMP errors
+    are read from the socket error queue (``IP_RECVERR``), whose source
+    address names the probed port, so a single socket can still tell closed
+    and filtered ports apart. Ports without any reply stay ``"open|filtered"``.
+    """
+    statuses = {port: "open|filtered" for port in ports}
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setsockopt(socket.IPPROTO_IP, _IP_RECVERR, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _UDP_BATCH_RCVBUF)
+            # Send while still blocking so a full send buffer waits instead of failing.
+            _send_udp_probes(sock, target_ip, ports)
+            sock.setblocking(False)
+
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                readable, _, _ = select.select([sock], [], [], remaining)
+                if not readable:
+                    break
+                _drain_udp_errqueue(sock, statuses)
+                try:
+                    _, (src_ip, src_port) = sock.recvfrom(1024)
+                except (BlockingIOError, InterruptedError):
+                    continue
+                except OSError:
+                    # Pending ICMP error also surfaces as sk_err; the queue above already recorded it.
+                    continue
+                if src_ip == target_ip and src_port in statuses:
+                    statuses[src_port] = "open"
+    except OSError:
+        return {port: "error_scan_exception" for port in ports}
+    return statuses
+
+
+def _drain_udp_errqueue(sock: socket.socket, statuses: Dict[int, str]) -> None:
+    while True:
+        try:
+            _, ancdata, _, address = sock.recvmsg(0, 512, _MSG_ERRQUEUE)
+        except (BlockingIOError, InterruptedError):
+            return
+        port = address[1] if address else None
+        for level, cmsg_type, cmsg_data in ancdata:
+            if level != socket.IPPROTO_IP or cmsg_type != _IP_RECVERR or len(cmsg_data) < 16:
+                continue
+            # struct sock_extended_err: u32 errno; u8 origin, type, code, pad; u32 info, data
+            _, origin, icmp_type, icmp_code = struct.unpack_from("=IBBB", cmsg_data)
+            if port not in statuses or origin != _SO_EE_ORIGIN_ICMP or icmp_type != 3:
+                continue
+            if icmp_code == 3:
+                statuses[port] = "closed"
+            elif icmp_code in (1, 2, 9, 10, 13):
+                statuses[port] = "filtered"
+
+
 def udp_scan_port(target_ip: str, port: int, timeout: float = DEFAULT_SOCKET_TIMEOUT, use_scapy_if_available: bool = True) -> str:
     """Perform a UDP scan on a single port.
 
@@ -224,6 +608,7 @@ def scan_ports(
     scan_type: ScanType = ScanType.TCP_CONNECT,
     num_threads: int = DEFAULT_THREADS,
     timeout: float = DEFAULT_SOCKET_TIMEOUT,
+    l3_socket: Optional[Any] = None,
 ) -> Dict[str, Any]:
     """Scan a list of ports on a target host.
 
@@ -231,8 +616,15 @@ def scan_ports(
         target_ip: Target IP address.
         ports_to_scan: Ports to scan.
         scan_type: Type of scan to perform.
-        num_threads: Number of worker threads.
+        num_threads: Number of worker threads for UDP scans without Scapy
+            on non-Linux hosts. TCP connect scans run on an event loop with
+            up to ``DEFAULT_CONNECT_CONCURRENCY`` connects in flight, SYN/UDP
+            scans go out as a single Scapy batch, and SYN/UDP scans without
+            Scapy on Linux share one raw or datagram socket.
         timeout: Timeout for individual scans.
+        l3_socket: Optional Scapy L3 socket to reuse for SYN/UDP probes, so
+            several scans can share one raw socket. Opened per scan if
+            omitted.
 
     Returns:
         Summary dictionary including open ports and statistics.
@@ -246,47 +638,95 @@ def scan_ports(
     errors_encountered: List[str] = []
 
     try:
-        socket.gethostbyname(target_ip)
+        resolved_ip = socket.gethostbyname(target_ip)
     except socket.gaierror:
         return {"error": f"Cannot resolve hostname: {target_ip}"}
 
+    if scan_type == ScanType.TCP_CONNECT:
+        # Connect probes are pure I/O wait, so they run on an event loop rather
+        # than tying up one thread per in-flight port.
+        concurrency = min(len(ports_to_scan), DEFAULT_CONNECT_CONCURRENCY)
+        try:
+            connect_results = _run_coroutine(_tcp_connect_async(resolved_ip, ports_to_scan, timeout, concurrency))
+        except Exception as e:
+            connect_results = []
+            errors_encountered.append(f"Error during TCP connect scan: {e}")
+        for port, is_open in connect_results:
+            if is_open:
+                open_ports_details[port] = {"status": "open", "service_guess": COMMON_PORTS.get(port, "unknown"), "protocol": "tcp"}
+        return _build_summary(
+            target_ip, scan_type, ports_to_scan, open_ports_details,
+            closed_ports_count, filtered_ports_count, errors_encountered,
+        )
+
+    if scan_type == ScanType.TCP_SYN:
+        if HAS_SCAPY:
+            syn_results = _syn_batch(resolved_ip, ports_to_scan, timeout, l3_socket)
+        elif sys.platform.startswith("linux"):
+            syn_results = _syn_batch_socket(resolved_ip, ports_to_scan, timeout)
+        else:
+            return {"target_ip": target_ip, "scan_type": scan_type.value, "error": "Scapy is required for this scan type but not available."}
+        for port, result in syn_results.items():
+            if result == "open":
+                open_ports_details[port] = {"status": "open", "service_guess": COMMON_PORTS.get(port, "unknown"), "protocol": "tcp"}
+            elif result == "closed":
+                closed_ports_count += 1
+            elif result == "filtered":
+                filtered_ports_count += 1
+            else:
+                errors_encountered.append(f"Port {port} (SYN): {result}")
+        return _build_summary(
+            target_ip, scan_type, ports_to_scan, open_ports_details,
+            closed_ports_count, filtered_ports_count, errors_encountered,
+        )
+
+    if scan_type == ScanType.UDP and HAS_SCAPY:
+        for port, result in _udp_batch(resolved_ip, ports_to_scan, timeout, l3_socket).items():
+            if result in ("open", "open|filtered"):
+                open_ports_details[port] = {"status": result, "service_guess": COMMON_PORTS.get(port, "unknown_udp"), "protocol": "udp"}
+            elif result == "closed":
+                closed_ports_count += 1
+            elif result == "filtered":
+                filtered_ports_count += 1
+            else:
+                errors_encountered.append(f"Port {port} (UDP): {result}")
+        return _build_summary(
+            target_ip, scan_type, ports_to_scan, open_ports_details,
+            closed_ports_count, filtered_ports_count, errors_encountered,
+        )
+
+    if scan_type == ScanType.UDP and sys.platform.startswith("linux"):
+        udp_results = _udp_batch_socket(resolved_ip, ports_to_scan, timeout)
+        for port, result in udp_results.items():
+            if result in ("open", "open|filtered"):
+                open_ports_details[port] = {"status": result, "service_guess": COMMON_PORTS.get(port, "unknown_udp"), "protocol": "udp"}
+            elif result == "closed":
+                closed_ports_count += 1
+            elif result == "filtered":
+                filtered_ports_count += 1
+            else:
+                errors_encountered.append(f"Port {port} (UDP): {result}")
+        return _build_summary(
+            target_ip, scan_type, ports_to_scan, open_ports_details,
+            closed_ports_count, filtered_ports_count, errors_encountered,
+        )
+
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
         future_to_port = {}
         for port in ports_to_scan:
-            if scan_type == ScanType.TCP_CONNECT:
-                future = executor.submit(tcp_connect_scan_port, target_ip, port, timeout)
-            elif scan_type == ScanType.TCP_SYN:
-                if not HAS_SCAPY:
-                    errors_encountered.append("Scapy not available for SYN scan.")
-                    break
-                future = executor.submit(tcp_syn_scan_port, target_ip, port, timeout)
-            elif scan_type == ScanType.UDP:
-                future = executor.submit(udp_scan_port, target_ip, port, timeout, True)
+            if scan_type == ScanType.UDP:
+                future = executor.submit(udp_scan_port, target_ip, port, timeout, False)
             else:
                 return {"error": "Invalid scan type specified."}
             future_to_port[future] = port
 
-        if errors_encountered and "Scapy not available" in errors_encountered[0]:
-            return {"target_ip": target_ip, "scan_type": scan_type.value, "error": "Scapy is required for this scan type but not available."}
-
         for future in as_completed(future_to_port):
             port = future_to_port[future]
             try:
                 result = future.result()
                 protocol_name = "tcp" if scan_type != ScanType.UDP else "udp"
 
-                if scan_type == ScanType.TCP_CONNECT and result is True:
-                    open_ports_details[port] = {"status": "open", "service_guess": COMMON_PORTS.get(port, "unknown"), "protocol": protocol_name}
-                elif scan_type == ScanType.TCP_SYN:
-                    if result == "open":
-                        open_ports_details[port] = {"status": "open", "service_guess": COMMON_PORTS.get(port, "unknown"), "protocol": protocol_name}
-                    elif result == "closed":
-                        closed_ports_count += 1
-                    elif result == "filtered":
-                        filtered_ports_count += 1
-                    elif isinstance(result, str) and "error" in result:
-                        errors_encountered.append(f"Port {port} (SYN): {result}")
-                elif scan_type == ScanType.UDP:
+                if scan_type == ScanType.UDP:
                     if result == "open":
                         open_ports_details[port] = {"status": "open", "service_guess": COMMON_PORTS.get(port, "unknown_udp"), "protocol": protocol_name}
                     elif result == "open|filtered":
@@ -300,6 +740,21 @@ def scan_ports(
             except Exception as e:
                 errors_encountered.append(f"Error processing result for port {port}: {e}")
 
+    return _build_summary(
+        target_ip, scan_type, ports_to_scan, open_ports_details,
+        closed_ports_count, filtered_ports_count, errors_encountered,
+    )
+
+
+def _build_summary(
+    target_ip: str,
+    scan_type: ScanType,
+    ports_to_scan: List[int],
+    open_ports_details: Dict[int, Dict[str, str]],
+    closed_ports_count: int,
+    filtered_ports_count: int,
+    errors_encountered: List[str],
+) -> Dict[str, Any]:
     summary: Dict[str, Any] = {
         "target_ip": target_ip,
         "scan_type": scan_type.value,
@@ -1,22 +1,24 @@
+import os
+import socket
+import sys
 import unittest
 import time
-import socket # For checking if target is resolvable
 
-from .port_scanner import scan_ports, parse_ports, ScanType, HAS_SCAPY, COMMON_PORTS
+from .._resolve import resolve
+from .port_scanner import scan_ports, parse_ports, ScanType, HAS_SCAPY, COMMON_PORTS, _syn_batch_socket, _udp_batch_socket
 
 TARGET_HOST = "scanme.nmap.org"
-NETWORK_TEST_DELAY_SCANNER = 2.0
+NETWORK_TEST_DELAY_SCANNER = 0.0 if os.environ.get("TAMSIL_FAST_TESTS") else 2.0
+
 
 class TestPortScanner(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.host_resolvable = False
-        try:
-            socket.gethostbyname(TARGET_HOST)
-            cls.host_resolvable = True
+        cls.host_resolvable = resolve(TARGET_HOST) is not None
+        if cls.host_resolvable:
             print(f"\nTarget host {TARGET_HOST} is resolvable. Proceeding with port scan tests.")
-        except socket.gaierror:
+        else:
             print(f"\nWARNING: Target host {TARGET_HOST} is not resolvable. Port scan tests will be skipped or may fail expectedly.")
 
     def test_01_parse_ports(self):
@@ -118,13 +120,29 @@ class TestPortScanner(unittest.TestCase):
         print(f"  UDP Scan - Stats: {stats}")
         time.sleep(NETWORK_TEST_DELAY_SCANNER)
 
+    @unittest.skipUnless(sys.platform.startswith("linux"), "Raw-socket SYN fallback is Linux only.")
+    def test_05_syn_batch_socket_loopback(self):
+        print("\nRunning test_05_syn_batch_socket_loopback...")
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            open_port = listener.getsockname()[1]
+            closed_port = 1 if open_port != 1 else 2
+
+            results = _syn_batch_socket("127.0.0.1", [open_port, closed_port], timeout=0.5)
+
+        if set(results.values()) == {"error_scan_exception"}:
+            self.skipTest("Raw sockets need CAP_NET_RAW.")
+        self.assertEqual(results, {open_port: "open", closed_port: "closed"})
+
+    def test_06_udp_batch_socket_persistent_send_error(self):
+        print("\nRunning test_06_udp_batch_socket_persistent_send_error...")
+        # Sending to broadcast without SO_BROADCAST fails with EACCES on every attempt.
+        results = _udp_batch_socket("255.255.255.255", [53, 54], timeout=0.5)
+        self.assertEqual(results, {53: "error_scan_exception", 54: "error_scan_exception"})
+
 if __name__ == '__main__':
-    host_is_currently_resolvable_main = False
-    try:
-        socket.gethostbyname(TARGET_HOST)
-        host_is_currently_resolvable_main = True
-    except socket.gaierror:
-        pass
+    host_is_currently_resolvable_main = resolve(TARGET_HOST) is not None
 
     if not host_is_currently_resolvable_main:
         print(f"CRITICAL: Target host {TARGET_HOST} for port scan tests is not resolvable. Aborting test run for this file.")
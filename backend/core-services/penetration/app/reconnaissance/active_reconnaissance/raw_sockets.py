@@ -0,0 +1,11 @@
+import struct
+
+
+def inet_checksum(data: bytes) -> int:
+    """RFC 1071 Internet checksum, as used by the ICMP and TCP headers built here."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
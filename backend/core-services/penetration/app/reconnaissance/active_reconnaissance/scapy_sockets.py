@@ -0,0 +1,33 @@
+from typing import Any, Optional
+
+
+class PersistentSendSock:
+    """Context manager yielding one Scapy L3 socket for a whole scan.
+
+    ``sr()``/``send()`` open and close a raw socket on every call. Reusing a
+    socket amortises that setup across all probes. A socket passed in by the
+    caller is reused and left open; otherwise one is opened on the interface
+    routing to ``target_ip`` and closed here.
+    """
+
+    def __init__(self, sock: Optional[Any] = None, target_ip: Optional[str] = None) -> None:
+        self._sock = sock
+        self._owned = sock is None
+        self._target_ip = target_ip
+
+    def __enter__(self) -> Any:
+        if self._sock is None:
+            # Scapy is optional for the scanners; only needed once a socket is opened here.
+            from scapy.all import conf as scapy_conf
+            from scapy.interfaces import resolve_iface
+
+            # Pick the interface the way sr() does, from the route to the target.
+            route_iface = scapy_conf.route.route(self._target_ip)[0] if self._target_ip else None
+            iface = resolve_iface(route_iface or scapy_conf.iface)
+            self._sock = iface.l3socket(False)(iface=iface)
+        return self._sock
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._owned and self._sock is not None:
+            self._sock.close()
+            self._sock = None
@@ -1,3 +1,4 @@
+import os
 import unittest
 import time
 import socket # For checking if target is resolvable
@@ -10,7 +11,7 @@ from service_enumerator import enumerate_services, parse_banner, SERVICE_PROBES,
 TARGET_HOST_SE = "scanme.nmap.org"
 # TARGET_HOST_SE = "127.0.0.1" # For local testing
 
-NETWORK_TEST_DELAY_SE = 1.0
+NETWORK_TEST_DELAY_SE = 0.0 if os.environ.get("TAMSIL_FAST_TESTS") else 1.0
 
 class TestServiceEnumerator(unittest.TestCase):
 
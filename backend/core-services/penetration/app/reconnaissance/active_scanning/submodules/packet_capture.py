@@ -1,22 +1,178 @@
 # core/reconnaissance/active_scanning/submodules/packet_capture.py
 import logging
+import mmap
+import select
+import socket
+import struct
+import sys
+import time
+from collections import deque
 from logging_config import get_logger
 logger = get_logger(__name__)
 
+try:
+    from scapy.all import AsyncSniffer, IP, IPv6
+    HAS_SCAPY = True
+except ImportError:
+    HAS_SCAPY = False
+
+HAS_PACKET_MMAP = sys.platform.startswith("linux") and hasattr(socket, "AF_PACKET")
+
+# <linux/if_packet.h> constants not exposed by the socket module.
+_SOL_PACKET = 263
+_PACKET_RX_RING = 5
+_PACKET_VERSION = 10
+_TPACKET_V2 = 1
+_TP_STATUS_KERNEL = 0
+_TP_STATUS_USER = 1
+_ETH_P_ALL = 0x0003
+
+# Ring geometry: 8 x 1 MiB blocks of 2 KiB frames. Frames never straddle a
+# block because the block size is a multiple of the frame size.
+RING_BLOCK_SIZE = 1 << 20
+RING_BLOCK_NR = 8
+RING_FRAME_SIZE = 2048
+
+# struct tpacket2_hdr: status, len, snaplen, mac, net, sec, nsec, vlan_tci, vlan_tpid
+_TPACKET2_HDR = struct.Struct("=IIIHHIIHH")
+_IP_PROTO_NAMES = {1: "ICMP", 2: "IGMP", 6: "TCP", 17: "UDP", 47: "GRE", 50: "ESP", 58: "ICMPv6", 132: "SCTP"}
+_ETHERTYPE_NAMES = {0x0806: "ARP", 0x8100: "802.1Q", 0x88CC: "LLDP"}
+
+
+def _summarise_packet(pkt):
+    """Reduce a Scapy packet to the small dict returned by :func:`capture_packets`."""
+    if pkt.haslayer(IP):
+        layer = pkt[IP]
+    elif pkt.haslayer(IPv6):
+        layer = pkt[IPv6]
+    else:
+        layer = None
+    if layer is not None:
+        src, dst = layer.src, layer.dst
+        proto = layer.payload.name if layer.payload else layer.name
+    else:
+        src = getattr(pkt, "src", None)
+        dst = getattr(pkt, "dst", None)
+        proto = pkt.lastlayer().name
+    return {"src": src, "dst": dst, "proto": proto, "summary": pkt.summary()}
+
+
+def _summarise_frame(frame, wire_len):
+    """Parse the Ethernet/IP headers of a raw frame into the capture dict."""
+    if len(frame) < 14:
+        return {"src": None, "dst": None, "proto": "Unknown", "summary": f"Truncated frame ({wire_len} bytes)"}
+    ethertype = struct.unpack_from("!H", frame, 12)[0]
+    if ethertype == 0x0800 and len(frame) >= 34:
+        proto = _IP_PROTO_NAMES.get(frame[23], str(frame[23]))
+        src = socket.inet_ntop(socket.AF_INET, frame[26:30])
+        dst = socket.inet_ntop(socket.AF_INET, frame[30:34])
+        family = "IP"
+    elif ethertype == 0x86DD and len(frame) >= 54:
+        proto = _IP_PROTO_NAMES.get(frame[20], str(frame[20]))
+        src = socket.inet_ntop(socket.AF_INET6, frame[22:38])
+        dst = socket.inet_ntop(socket.AF_INET6, frame[38:54])
+        family = "IPv6"
+    else:
+        src = ":".join(f"{b:02x}" for b in frame[6:12])
+        dst = ":".join(f"{b:02x}" for b in frame[0:6])
+        proto = _ETHERTYPE_NAMES.get(ethertype, f"0x{ethertype:04x}")
+        family = "Ether"
+    return {"src": src, "dst": dst, "proto": proto, "summary": f"{family} / {proto} {src} > {dst} ({wire_len} bytes)"}
+
+
+def _capture_packet_mmap(interface, count, timeout):
+    """Capture through an ``AF_PACKET`` ``PACKET_RX_RING`` shared with the kernel.
+
+    The kernel writes frames straight into the mmap'd ring; we only make a
+    syscall (``select``) when the ring is empty, and hand each slot back by
+    resetting its status word after summarising it.
+    """
+    frame_nr = RING_BLOCK_SIZE // RING_FRAME_SIZE * RING_BLOCK_NR
+    ring_size = RING_BLOCK_SIZE * RING_BLOCK_NR
+    buf = deque(maxlen=count)
+
+    with socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(_ETH_P_ALL)) as sock:
+        sock.setsockopt(_SOL_PACKET, _PACKET_VERSION, _TPACKET_V2)
+        sock.setsockopt(
+            _SOL_PACKET,
+            _PACKET_RX_RING,
+            struct.pack("=IIII", RING_BLOCK_SIZE, RING_BLOCK_NR, RING_FRAME_SIZE, frame_nr),
+        )
+        sock.bind((interface, 0))
+        ring = mmap.mmap(sock.fileno(), ring_size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        try:
+            slot = 0
+            deadline = time.monotonic() + timeout
+            while len(buf) < count:
+                offset = slot * RING_FRAME_SIZE
+                status, wire_len, snaplen, mac, _net, *_ = _TPACKET2_HDR.unpack_from(ring, offset)
+                if not status & _TP_STATUS_USER:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+                        break
+                    continue
+                start = offset + mac
+                buf.append(_summarise_frame(ring[start:start + min(snaplen, 64)], wire_len))
+                struct.pack_into("=I", ring, offset, _TP_STATUS_KERNEL)
+                slot = (slot + 1) % frame_nr
+        finally:
+            ring.close()
+    return list(buf)
+
+
+def _capture_scapy(interface, count, timeout):
+    buf = deque(maxlen=count)
+    sniffer = AsyncSniffer(
+        iface=interface,
+        prn=lambda pkt: buf.append(_summarise_packet(pkt)),
+        store=False,
+        stop_filter=lambda _pkt: len(buf) >= count,
+    )
+    try:
+        sniffer.start()
+        sniffer.join(timeout=timeout)
+        if sniffer.running:
+            sniffer.stop()
+    except Exception as e:
+        logger.error("Packet capture on %s failed: %s", interface, e)
+    return list(buf)
+
 
 def capture_packets(interface='eth0', count=10, timeout=60):
-    """Placeholder function for capturing network packets."""
-    logger.info(f"Starting packet capture on {interface} for {count} packets (placeholder)...")
-    # In a real implementation, use libraries like Scapy or pcapy
-    packets_data = [
-        {"src": "192.168.1.10", "dst": "192.168.1.1", "proto": "TCP", "summary": "Packet 1 data..."},
-        {"src": "192.168.1.1", "dst": "192.168.1.10", "proto": "TCP", "summary": "Packet 2 data..."}
-    ]
-    logger.info("Packet capture finished (placeholder).")
-    return packets_data
+    """Capture up to ``count`` packets on ``interface`` for at most ``timeout`` seconds.
+
+    On Linux the capture reads a ``PACKET_MMAP`` ring, parsing only the
+    headers needed for the summary. Elsewhere, or if the ring cannot be set
+    up, Scapy's ``AsyncSniffer`` is used without storing packets. Either way
+    memory stays bounded by ``count`` however busy the interface is.
+
+    Args:
+        interface: Network interface to sniff on.
+        count: Maximum number of packets to capture.
+        timeout: Capture timeout in seconds.
+
+    Returns:
+        List of ``{"src", "dst", "proto", "summary"}`` dictionaries, oldest first.
+    """
+    logger.info("Starting packet capture on %s for %d packets...", interface, count)
+    captured = None
+    if HAS_PACKET_MMAP:
+        try:
+            captured = _capture_packet_mmap(interface, count, timeout)
+        except OSError as e:
+            logger.info("PACKET_MMAP capture on %s unavailable (%s); falling back to Scapy.", interface, e)
+
+    if captured is None:
+        if not HAS_SCAPY:
+            logger.warning("Scapy is not available; packet capture skipped.")
+            return []
+        captured = _capture_scapy(interface, count, timeout)
+
+    logger.info("Packet capture finished: %d packets captured.", len(captured))
+    return captured
 
 if __name__ == '__main__':
     captured = capture_packets()
-    logger.info("Captured Packets (Placeholder):")
+    logger.info("Captured Packets:")
     for pkt in captured:
         logger.info(pkt)
@@ -9,12 +9,62 @@ underlying functionality programmatically and from tests.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import cache
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from .main_recon import perform_dns_enumeration, generate_topology_map
 import inspect
 
 
+# Upper bound on the number of steps ``Reconnaissance.run`` executes at once.
+MAX_PARALLEL_STEPS = 16
+
+# Steps that consume another step's output.  A dependency is only honoured
+# when both steps are part of the same ``run`` call.
+STEP_DEPENDENCIES: Dict[str, frozenset[str]] = {
+    "enumerate_services": frozenset({"scan_ports"}),
+    "fingerprint_os_single_target": frozenset({"scan_ports"}),
+    "scan_vulnerabilities": frozenset({"enumerate_services"}),
+    "topology_map": frozenset({"scan_ip_blocks", "arp_scan_scapy", "icmp_ping_sweep_scapy"}),
+}
+
+
+# Per-host chain streamed by ``Reconnaissance.run`` when ``target_ips`` is given.
+PIPELINE_STAGES = ("scan_ports", "enumerate_services", "scan_vulnerabilities")
+
+
+@cache
+def _load(module: str, name: str) -> Callable[..., Any]:
+    """Import ``name`` from the relative submodule ``module`` once.
+
+    Wrappers resolve their implementation through this loader so the import
+    machinery is only consulted on first use rather than on every call.
+    """
+
+    return getattr(import_module(module, __package__), name)
+
+
+def _unique_ports(ports: Iterable[Any]) -> List[int]:
+    """Return the valid port numbers in ``ports`` sorted and without duplicates.
+
+    Specs such as ``parse_ports("common")`` combined with explicit ranges
+    overlap, and every duplicate would otherwise cost a full probe.
+    """
+
+    unique = set()
+    for port in ports:
+        try:
+            number = int(port)
+        except (TypeError, ValueError):
+            continue
+        if 1 <= number <= 65535:
+            unique.add(number)
+    return sorted(unique)
+
+
 class Reconnaissance:
     """Provide granular access to reconnaissance tasks.
 
@@ -22,6 +72,14 @@ class Reconnaissance:
     individual tasks or compose them into a full reconnaissance phase.
     """
 
+    def __init__(self) -> None:
+        self._steps = self._available_steps()
+        # Parameter names per step, so ``run`` does not rebuild signatures.
+        self._step_params: Dict[str, frozenset[str]] = {
+            name: frozenset(inspect.signature(fn).parameters)
+            for name, fn in self._steps.items()
+        }
+
     def dns_enumeration(self, domain: str, record_type: str = "A") -> Union[List[str], str]:
         """Perform basic DNS enumeration.
 
@@ -94,8 +152,9 @@ class Reconnaissance:
             Discovered host information.
         """
 
-        from .active_scanning.scan_ip_blocks import scan_ip_blocks
-
+        scan_ip_blocks = _load(".active_scanning.scan_ip_blocks", "scan_ip_blocks")
+        if ports is not None:
+            ports = _unique_ports(ports)
         return scan_ip_blocks(network, method, ports, timeout, retries, max_workers)
 
     def capture_packets(self, interface: str = "eth0", count: int = 10, timeout: int = 60) -> List[Dict[str, Any]]:
@@ -119,8 +178,7 @@ class Reconnaissance:
             Simplified packet summaries.
         """
 
-        from .active_scanning.submodules.packet_capture import capture_packets
-
+        capture_packets = _load(".active_scanning.submodules.packet_capture", "capture_packets")
         return capture_packets(interface, count, timeout)
 
     def scan_ports(
@@ -130,6 +188,7 @@ class Reconnaissance:
         scan_type: Optional[Any] = None,
         num_threads: int = 10,
         timeout: float = 1.0,
+        l3_socket: Optional[Any] = None,
     ) -> Dict[str, Any]:
         """Scan multiple ports on a target host.
 
@@ -140,7 +199,8 @@ class Reconnaissance:
         target_ip:
             IP address of the host to scan.
         ports_to_scan:
-            List of port numbers.
+            List of port numbers.  Duplicates and out-of-range values are
+            dropped before scanning.
         scan_type:
             A :class:`ScanType` value selecting the scan strategy.  Defaults to
             ``ScanType.TCP_CONNECT``.
@@ -148,6 +208,9 @@ class Reconnaissance:
             Number of concurrent worker threads.
         timeout:
             Timeout for individual probes.
+        l3_socket:
+            Optional Scapy L3 socket reused for SYN and UDP probes.  Opened
+            per call when omitted.
 
         Returns
         -------
@@ -155,13 +218,12 @@ class Reconnaissance:
             Summary information including discovered open ports.
         """
 
-        from .active_reconnaissance.port_scanner.port_scanner import (
-            scan_ports as _scan_ports,
-            ScanType,
-        )
+        _scan_ports = _load(".active_reconnaissance.port_scanner.port_scanner", "scan_ports")
+        ScanType = _load(".active_reconnaissance.port_scanner.port_scanner", "ScanType")
 
         scan_type = scan_type or ScanType.TCP_CONNECT
-        return _scan_ports(target_ip, ports_to_scan, scan_type, num_threads, timeout)
+        ports_to_scan = _unique_ports(ports_to_scan)
+        return _scan_ports(target_ip, ports_to_scan, scan_type, num_threads, timeout, l3_socket=l3_socket)
 
     def arp_scan_scapy(
         self,
@@ -179,8 +241,7 @@ class Reconnaissance:
         error structure when Scapy is unavailable.
         """
 
-        from .active_reconnaissance.network_mapper.network_mapper import arp_scan_scapy
-
+        arp_scan_scapy = _load(".active_reconnaissance.network_mapper.network_mapper", "arp_scan_scapy")
         return arp_scan_scapy(ip_range_or_subnet, timeout, verbose, retry_count, packet_interval)
 
     def icmp_ping_sweep_scapy(
@@ -193,8 +254,7 @@ class Reconnaissance:
     ) -> Dict[str, List[Any]]:
         """Perform an ICMP ping sweep using Scapy."""
 
-        from .active_reconnaissance.network_mapper.network_mapper import icmp_ping_sweep_scapy
-
+        icmp_ping_sweep_scapy = _load(".active_reconnaissance.network_mapper.network_mapper", "icmp_ping_sweep_scapy")
         return icmp_ping_sweep_scapy(ip_range_or_subnet, timeout, verbose, count_per_host, packet_interval)
 
     def fingerprint_os_single_target(
@@ -202,12 +262,12 @@ class Reconnaissance:
         target_ip: str,
         open_tcp_port: Optional[int] = None,
         timeout: float = 2.0,
+        l3_socket: Optional[Any] = None,
     ) -> Dict[str, Any]:
-        """Guess the operating system of a host."""
+        """Guess the operating system of a host, optionally reusing ``l3_socket``."""
 
-        from .active_reconnaissance.os_fingerprinter.os_fingerprinter import fingerprint_os_single_target as _fingerprint
-
-        return _fingerprint(target_ip, open_tcp_port, timeout)
+        _fingerprint = _load(".active_reconnaissance.os_fingerprinter.os_fingerprinter", "fingerprint_os_single_target")
+        return _fingerprint(target_ip, open_tcp_port, timeout, l3_socket=l3_socket)
 
     def enumerate_services(
         self,
@@ -218,16 +278,13 @@ class Reconnaissance:
     ) -> Dict[str, Any]:
         """Probe open ports to enumerate running services."""
 
-        from .active_reconnaissance.service_enumerator.service_enumerator import enumerate_services as _enumerate
-
+        _enumerate = _load(".active_reconnaissance.service_enumerator.service_enumerator", "enumerate_services")
         return _enumerate(target_ip, open_ports_map, num_threads, probe_timeout)
 
     def scan_vulnerabilities(self, services: Dict[int, str]) -> Dict[str, Any]:
         """Check services against a vulnerability database."""
 
-        from .active_reconnaissance.vulnerability_scanner.vulnerability_scanner import (
-            scan_vulnerabilities as _scan_vulns,
-        )
+        _scan_vulns = _load(".active_reconnaissance.vulnerability_scanner.vulnerability_scanner", "scan_vulnerabilities")
 
         return _scan_vulns(services)
 
@@ -244,16 +301,13 @@ class Reconnaissance:
     ) -> Dict[str, Any]:
         """Perform WHOIS/RDAP lookup for a domain."""
 
-        from .passive_reconnaissance.whois.whois import unified_domain_lookup as _lookup
-
+        _lookup = _load(".passive_reconnaissance.whois.whois", "unified_domain_lookup")
         return _lookup(domain, preferred_protocol, whois_max_referrals, timeout)
 
     def fetch_certificates_from_ct(self, domain: str, timeout: int = 20) -> Dict[str, Any]:
         """Fetch certificate transparency information for a domain."""
 
-        from .passive_reconnaissance.certificate_transparency.certificate_transparency import (
-            fetch_certificates_from_ct as _fetch_ct,
-        )
+        _fetch_ct = _load(".passive_reconnaissance.certificate_transparency.certificate_transparency", "fetch_certificates_from_ct")
 
         return _fetch_ct(domain, timeout)
 
@@ -266,16 +320,13 @@ class Reconnaissance:
     ) -> Dict[str, Any]:
         """Harvest email addresses from various sources."""
 
-        from .passive_reconnaissance.email_harvester.email_harvester import harvest_emails as _harvest
-
+        _harvest = _load(".passive_reconnaissance.email_harvester.email_harvester", "harvest_emails")
         return _harvest(target_domain, sources, base_url_to_scrape, filter_by_domain)
 
     def extract_metadata(self, file_path: str) -> Dict[str, Any]:
         """Extract metadata from a file."""
 
-        from .passive_reconnaissance.metadata_extractor.metadata_extractor import (
-            extract_metadata as _extract_metadata,
-        )
+        _extract_metadata = _load(".passive_reconnaissance.metadata_extractor.metadata_extractor", "extract_metadata")
 
         return _extract_metadata(file_path)
 
@@ -288,9 +339,7 @@ class Reconnaissance:
     ) -> Dict[str, Any]:
         """Query a search engine for reconnaissance purposes."""
 
-        from .passive_reconnaissance.search_engine_scraper.search_engine_scraper import (
-            search_engine_query as _search_engine_query,
-        )
+        _search_engine_query = _load(".passive_reconnaissance.search_engine_scraper.search_engine_scraper", "search_engine_query")
 
         return _search_engine_query(query, num_results, engine, delay)
 
@@ -302,9 +351,7 @@ class Reconnaissance:
     ) -> Dict[str, Any]:
         """Scrape data from a social media platform."""
 
-        from .passive_reconnaissance.social_media_analysis.social_media_analysis import (
-            scrape_social_media as _scrape_social_media,
-        )
+        _scrape_social_media = _load(".passive_reconnaissance.social_media_analysis.social_media_analysis", "scrape_social_media")
 
         return _scrape_social_media(platform, query, num_results)
 
@@ -315,15 +362,13 @@ class Reconnaissance:
     ) -> Dict[str, Any]:
         """Retrieve multiple DNS record types for a domain."""
 
-        from .dns_enumeration.dns_enumeration import get_all_dns_records as _get_all_dns_records
-
+        _get_all_dns_records = _load(".dns_enumeration.dns_enumeration", "get_all_dns_records")
         return _get_all_dns_records(domain, record_types)
 
     def attempt_zone_transfer(self, domain: str) -> Dict[str, Any]:
         """Attempt a DNS zone transfer for a domain."""
 
-        from .dns_enumeration.dns_enumeration import attempt_zone_transfer as _attempt_zone_transfer
-
+        _attempt_zone_transfer = _load(".dns_enumeration.dns_enumeration", "attempt_zone_transfer")
         return _attempt_zone_transfer(domain)
 
     # ------------------------------------------------------------------
@@ -333,43 +378,49 @@ class Reconnaissance:
     def gather_all_info(self, target_ip: Optional[str] = None) -> Dict[str, str]:
         """Collect basic host information."""
 
-        from .gather_host_info.gather_host_info import gather_all_info as _gather_all_info
-
+        _gather_all_info = _load(".gather_host_info.gather_host_info", "gather_all_info")
         return _gather_all_info(target_ip)
 
     def gather_network_info(self, target_domain: Optional[str] = None) -> Dict[str, str]:
         """Collect high level network information."""
 
-        from .gather_network_info.gather_network_info import (
-            gather_network_info as _gather_network_info,
-        )
+        _gather_network_info = _load(".gather_network_info.gather_network_info", "gather_network_info")
 
         return _gather_network_info(target_domain)
 
     def gather_identity_info(self, target: Optional[str] = None) -> Dict[str, List[str]]:
         """Gather identity-related information such as users and groups."""
 
-        from .gather_identity_info.gather_identity_info import (
-            gather_identity_info as _gather_identity_info,
-        )
+        _gather_identity_info = _load(".gather_identity_info.gather_identity_info", "gather_identity_info")
 
         return _gather_identity_info(target)
 
     def phishing_for_info(self, target_domain: Optional[str] = None) -> Dict[str, List[str]]:
         """Provide phishing related intelligence for a domain."""
 
-        from .phishing_for_info.phishing_for_info import phishing_for_info as _phishing_for_info
-
+        _phishing_for_info = _load(".phishing_for_info.phishing_for_info", "phishing_for_info")
         return _phishing_for_info(target_domain)
 
     def run(self, steps: Optional[List[str]] = None, **kwargs) -> Dict[str, Any]:
-        """Execute multiple reconnaissance steps sequentially.
+        """Execute multiple reconnaissance steps, concurrently where possible.
 
         The method recognises the wrapper methods defined on this class such as
         ``scan_ip_blocks`` or ``unified_domain_lookup``.  Each step name in
         ``steps`` is looked up and invoked if present.  Only the arguments that
         match the wrapper's signature are forwarded, allowing a single call to
-        drive several reconnaissance primitives in sequence.
+        drive several reconnaissance primitives together.
+
+        Steps run on a thread pool.  A step listed in :data:`STEP_DEPENDENCIES`
+        waits for those of its upstream steps that were also requested, and
+        receives their output (for example ``enumerate_services`` is handed the
+        open ports found by ``scan_ports``) unless the caller supplied that
+        argument explicitly.
+
+        When ``target_ips`` is passed, the requested :data:`PIPELINE_STAGES`
+        are streamed per host instead: each host moves on to the next stage as
+        soon as its previous stage finishes, so enumeration of early hosts
+        overlaps with port scans of later ones.  Their results are then
+        mappings of host to return value.
 
         Parameters
         ----------
@@ -377,7 +428,11 @@ class Reconnaissance:
             Iterable of wrapper names to invoke.  Unsupported names are
             ignored.
         **kwargs:
-            Candidate arguments forwarded to each step.
+            Candidate arguments forwarded to each step.  Pass ``_serial=True``
+            to run the steps one after another in the given order, which is
+            handy when debugging; the per-host pipeline then also takes one
+            host at a time through its stages.  ``target_ips`` enables the
+            per-host pipeline described above.
 
         Returns
         -------
@@ -385,10 +440,133 @@ class Reconnaissance:
             Mapping of step name to return value.
         """
 
-        steps = steps or []
+        serial = bool(kwargs.pop("_serial", False))
+        target_ips = kwargs.pop("target_ips", None)
+        # Preserve caller order, drop unknown names and duplicates.
+        selected = [step for step in dict.fromkeys(steps or []) if step in self._steps]
         results: Dict[str, Any] = {}
 
-        available_steps = {
+        staged = [step for step in PIPELINE_STAGES if step in selected] if target_ips else []
+        if staged:
+            rest = [step for step in selected if step not in staged]
+            hosts = list(dict.fromkeys(target_ips))
+            if serial:
+                results.update(self.run(rest, _serial=True, **kwargs))
+                results.update(self._serial_pipeline(staged, hosts, kwargs))
+                return {step: results[step] for step in selected}
+            run_coroutine = _load(".active_reconnaissance.port_scanner.port_scanner", "_run_coroutine")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                others = executor.submit(self.run, rest, **kwargs) if rest else None
+                streamed = run_coroutine(self._stream_pipeline(staged, hosts, kwargs))
+                if others is not None:
+                    results.update(others.result())
+            results.update(streamed)
+            return {step: results[step] for step in selected}
+
+        if serial or len(selected) <= 1:
+            for step in selected:
+                results[step] = self._call_step(step, kwargs, results)
+            return results
+
+        pending = {
+            step: set(STEP_DEPENDENCIES.get(step, ())) & set(selected)
+            for step in selected
+        }
+        with ThreadPoolExecutor(max_workers=min(len(selected), MAX_PARALLEL_STEPS)) as executor:
+            running: Dict[Future, str] = {}
+
+            def submit_ready() -> None:
+                for step in [s for s, deps in pending.items() if not deps]:
+                    del pending[step]
+                    future = executor.submit(self._call_step, step, kwargs, dict(results))
+                    running[future] = step
+
+            submit_ready()
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    results[step] = future.result()
+                    for deps in pending.values():
+                        deps.discard(step)
+                submit_ready()
+
+        return {step: results[step] for step in selected}
+
+    def _serial_pipeline(
+        self,
+        stages: List[str],
+        hosts: List[str],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Take each host through ``stages`` in turn, on the calling thread."""
+
+        results: Dict[str, Dict[str, Any]] = {stage: {} for stage in stages}
+        for host in hosts:
+            upstream: Dict[str, Any] = {}
+            for stage in stages:
+                upstream[stage] = self._call_step(stage, {**kwargs, "target_ip": host}, dict(upstream))
+                results[stage][host] = upstream[stage]
+        return results
+
+    async def _stream_pipeline(
+        self,
+        stages: List[str],
+        hosts: List[str],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Push every host through ``stages`` with an :class:`asyncio.Queue` between stages."""
+
+        results: Dict[str, Dict[str, Any]] = {stage: {} for stage in stages}
+        failures: List[BaseException] = []
+        queues: List[asyncio.Queue] = [asyncio.Queue() for _ in stages]
+        workers_per_stage = min(len(hosts), MAX_PARALLEL_STEPS)
+        # A Scapy L3 socket is not thread-safe; without one each step opens its own.
+        kwargs = {k: v for k, v in kwargs.items() if k != "l3_socket"}
+
+        async def work(index: int) -> None:
+            stage = stages[index]
+            while True:
+                host, upstream = await queues[index].get()
+                try:
+                    value = await asyncio.to_thread(
+                        self._call_step, stage, {**kwargs, "target_ip": host}, upstream
+                    )
+                except Exception as exc:
+                    failures.append(exc)
+                else:
+                    results[stage][host] = value
+                    if index + 1 < len(stages):
+                        queues[index + 1].put_nowait((host, {**upstream, stage: value}))
+                finally:
+                    queues[index].task_done()
+
+        for host in hosts:
+            queues[0].put_nowait((host, {}))
+        workers = [
+            [asyncio.create_task(work(index)) for _ in range(workers_per_stage)]
+            for index in range(len(stages))
+        ]
+        try:
+            # A stage is finished once its queue drains, because every item it
+            # forwards is enqueued downstream before being marked done.
+            for index, queue in enumerate(queues):
+                await queue.join()
+                for task in workers[index]:
+                    task.cancel()
+        finally:
+            for task in (t for stage_workers in workers for t in stage_workers):
+                task.cancel()
+
+        if failures:
+            raise failures[0]
+        return {
+            stage: {host: results[stage][host] for host in hosts if host in results[stage]}
+            for stage in stages
+        }
+
+    def _available_steps(self) -> Dict[str, Callable[..., Any]]:
+        return {
             "dns_enumeration": self.dns_enumeration,
             "topology_map": self.topology_map,
             "scan_ip_blocks": self.scan_ip_blocks,
@@ -413,12 +591,52 @@ class Reconnaissance:
             "phishing_for_info": self.phishing_for_info,
         }
 
-        for step in steps:
-            func = available_steps.get(step)
-            if func is None:
-                continue
-            sig = inspect.signature(func)
-            call_args = {k: kwargs[k] for k in sig.parameters if k in kwargs}
-            results[step] = func(**call_args)
-
-        return results
+    def _call_step(self, step: str, kwargs: Dict[str, Any], upstream: Dict[str, Any]) -> Any:
+        """Invoke ``step`` with the matching ``kwargs`` plus upstream-derived defaults."""
+
+        candidates = dict(_upstream_kwargs(step, upstream))
+        candidates.update(kwargs)
+        params = self._step_params[step]
+        call_args = {k: v for k, v in candidates.items() if k in params}
+        return self._steps[step](**call_args)
+
+
+def _open_tcp_ports(scan_result: Any) -> Dict[int, Dict[str, str]]:
+    if not isinstance(scan_result, dict):
+        return {}
+    return scan_result.get("open_ports") or {}
+
+
+def _upstream_kwargs(step: str, upstream: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive default arguments for ``step`` from already finished steps."""
+
+    derived: Dict[str, Any] = {}
+    if step == "enumerate_services" and "scan_ports" in upstream:
+        derived["open_ports_map"] = _open_tcp_ports(upstream["scan_ports"])
+    elif step == "fingerprint_os_single_target" and "scan_ports" in upstream:
+        tcp_ports = [
+            port
+            for port, details in _open_tcp_ports(upstream["scan_ports"]).items()
+            if str(details.get("protocol", "tcp")).lower() == "tcp"
+        ]
+        if tcp_ports:
+            derived["open_tcp_port"] = min(tcp_ports)
+    elif step == "scan_vulnerabilities" and "enumerate_services" in upstream:
+        enumerated = upstream["enumerate_services"]
+        services = enumerated.get("services", {}) if isinstance(enumerated, dict) else {}
+        derived["services"] = {
+            port: details["banner"]
+            for port, details in services.items()
+            if isinstance(details, dict) and details.get("banner")
+        }
+    elif step == "topology_map":
+        hosts: List[Dict[str, Any]] = []
+        for source in ("scan_ip_blocks", "arp_scan_scapy", "icmp_ping_sweep_scapy"):
+            found = upstream.get(source)
+            if isinstance(found, dict):
+                found = found.get("live_hosts")
+            if isinstance(found, list):
+                hosts.extend(h for h in found if isinstance(h, dict) and "ip" in h)
+        if hosts:
+            derived["active_hosts"] = hosts
+    return derived
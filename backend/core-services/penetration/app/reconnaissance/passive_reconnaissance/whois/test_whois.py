@@ -4,7 +4,7 @@ from datetime import datetime
 
 # Assuming whois.py is in the same directory or PYTHONPATH is set up
 # from .whois import unified_domain_lookup, parse_datetime_string
-from whois import unified_domain_lookup, parse_datetime_string # Simplified import
+from whois import unified_domain_lookup, parse_datetime_string, parse_rdap_data # Simplified import
 
 # Domains for testing
 GOOGLE_COM = "google.com" # Good for RDAP
@@ -130,6 +130,26 @@ class TestWhoisRdap(unittest.TestCase):
         self.assertEqual(result.get("domain_queried", "").lower(), NONEXISTENT_DOMAIN_WHOIS.lower())
         time.sleep(NETWORK_TEST_DELAY)
 
+    def test_07_parse_rdap_vcard_fields(self):
+        print("\nRunning test_07_parse_rdap_vcard_fields...")
+        rdap_json = {
+            "ldhName": "example.test",
+            "entities": [
+                {"roles": ["registrar"], "vcardArray": ["vcard", [
+                    ["fn", {}, "text", "First Registrar"], ["fn", {}, "text", "Second Registrar"],
+                ]]},
+                {"roles": ["registrant"], "vcardArray": ["vcard", [
+                    ["fn", {}, "text", "Old Name"], ["org", {}, "text", "Old Org"],
+                    ["fn", {}, "text", "New Name"], ["org", {}, "text", "New Org"],
+                ]]},
+            ],
+        }
+        parsed = parse_rdap_data(rdap_json, "example.test")
+        # Registrar takes the first fn; contacts keep the last fn/org of their vCard
+        self.assertEqual(parsed["registrar"], "First Registrar")
+        self.assertEqual(parsed["registrant_name"], "New Name")
+        self.assertEqual(parsed["registrant_organization"], "New Org")
+
 if __name__ == '__main__':
     # To run from the parent directory of 'core':
     # python -m core.reconnaissance.passive_reconnaissance.whois.test_whois
@@ -144,6 +164,7 @@ if __name__ == '__main__':
         TestWhoisRdap('test_04_unified_lookup_example_com_force_whois'),
         TestWhoisRdap('test_05_unified_lookup_nic_uk_try_both'),
         TestWhoisRdap('test_06_unified_lookup_nonexistent_domain'),
+        TestWhoisRdap('test_07_parse_rdap_vcard_fields'),
     ]
     for test in tests_to_run:
         suite.addTest(test)
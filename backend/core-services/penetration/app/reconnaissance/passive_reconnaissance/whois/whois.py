@@ -1,20 +1,49 @@
+# Performance notes: lookups are dominated by network round trips, which
+# lookup_many() overlaps. The parsing side (parse_datetime_string,
+# parse_whois_text_data) is string/dict work, so it is sped up with
+# precompiled regexes and per-key caches rather than Numba, which only helps
+# numeric loops and would fall back to object mode here while adding JIT
+# start-up cost. Both parsers are pure functions (text in, dict/datetime out),
+# so a compiled replacement could be swapped in later without touching callers.
+import functools
+import http.client
 import socket
 import re
 import time
 import json
-import urllib.request
-import urllib.error
-from datetime import datetime, timezone
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from logging_config import get_logger
+
+try:
+    from ....scanning.http_session import HTTPSession
+except ImportError:
+    # Standalone execution / testing: app/ is on sys.path, as for logging_config
+    from scanning.http_session import HTTPSession
+
+try:
+    import orjson as _json_parser  # Faster RDAP/bootstrap decoding when installed
+except ImportError:
+    _json_parser = json
 logger = get_logger(__name__)
 
 # Common WHOIS port
 WHOIS_PORT = 43
 # Default IANA WHOIS server
 IANA_WHOIS_SERVER = "whois.iana.org"
+# Bytes requested per recv() when reading a WHOIS response
+WHOIS_RECV_SIZE = 65536
 # Default timeout for socket/HTTP operations
 DEFAULT_TIMEOUT = 10  # seconds
 
+# Upper bound on lookups in flight for lookup_many()
+DEFAULT_LOOKUP_CONCURRENCY = 32
+
+# Keep-alive connections shared by all lookups, so repeated RDAP queries to
+# one registry skip the TCP/TLS handshake
+_http_session = HTTPSession()
+
 # Precompiled regex for extracting referral server from IANA response (WHOIS)
 REFERRAL_REGEX_WHOIS = re.compile(r"^(?:refer|whois):\s*([a-zA-Z0-9\-\.]+)", re.IGNORECASE)
 
@@ -40,6 +69,55 @@ COMMON_DATE_FORMATS = [
     "%Y-%m-%d"                  # Added simple YYYY-MM-DD as a common case
 ]
 
+# ISO-8601 shapes that are parsed without strptime: a date, optionally followed by
+# a time (with optional fraction) and a Z or numeric UTC offset.
+ISO_DATETIME_REGEX = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})"
+    r"(?:([T ])(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:?\d{2})?)?$"
+)
+TRAILING_PARENS_REGEX = re.compile(r'\s*\([^)]*\)\s*$')
+TZ_SUFFIX_REGEX = re.compile(r'\s+(UTC|GMT|Z|EST|EDT|CST|CDT|MST|MDT|PST|PDT)$', re.IGNORECASE)
+
+# Maps digits to "D" and ASCII letters to "A" to fingerprint a date string's shape
+DATE_SHAPE_TABLE = str.maketrans(
+    "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "D" * 10 + "A" * 52,
+)
+DATE_SHAPE_CACHE_SIZE = 1024
+# Shape fingerprint -> the COMMON_DATE_FORMATS entry that last parsed it
+_DATE_FORMAT_BY_SHAPE = {}
+
+
+def _parse_iso_datetime(date_str):
+    """Build a datetime for the ISO shapes COMMON_DATE_FORMATS accepts, else None.
+
+    Mirrors what the strptime loop would return for the same string (naive
+    unless it carries ``Z`` or an offset after a ``T``) so callers can treat
+    this purely as a shortcut.
+    """
+    match = ISO_DATETIME_REGEX.match(date_str)
+    if not match:
+        return None
+    year, month, day, sep, hour, minute, second, fraction, tz = match.groups()
+    if sep is None:
+        return datetime(int(year), int(month), int(day))
+    if tz is None:
+        if sep == "T":
+            return None  # Not one of the known formats; let the loop decide
+        tzinfo = None
+    elif sep != "T":
+        return None
+    elif tz == "Z":
+        tzinfo = timezone.utc
+    elif fraction is not None:
+        return None
+    else:
+        offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[-2:]))
+        tzinfo = timezone(-offset if tz[0] == "-" else offset)
+    microsecond = int(fraction.ljust(6, "0")) if fraction else 0
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond, tzinfo=tzinfo)
+
+
 def parse_datetime_string(date_str):
     """
     Parses a date string from WHOIS/RDAP into a datetime object.
@@ -52,25 +130,47 @@ def parse_datetime_string(date_str):
     original_date_str = date_str # Keep for timezone hint if needed
     
     # Minimal initial cleaning, mainly for common WHOIS cruft
-    date_str = date_str.replace("(YYYY-MM-DD)", "").strip()
-    # Remove text in parentheses at the end, often like (Expires on YYYY-MM-DD)
-    date_str = re.sub(r'\s*\([^)]*\)\s*$', '', date_str).strip()
+    if "(YYYY-MM-DD)" in date_str:
+        date_str = date_str.replace("(YYYY-MM-DD)", "")
+    date_str = date_str.strip()
+    # Remove text in parentheses at the end, often like (Expires on YYYY-MM-DD);
+    # most dates have none, so only run the regex when one could match
+    if date_str.endswith(')'):
+        date_str = TRAILING_PARENS_REGEX.sub('', date_str).strip()
     
     if date_str.lower().startswith("before "):
         date_str = date_str[7:].strip()
 
     # More targeted timezone stripping:
-    tz_match = re.search(r'\s+(UTC|GMT|Z|EST|EDT|CST|CDT|MST|MDT|PST|PDT)$', date_str, re.IGNORECASE)
+    tz_match = TZ_SUFFIX_REGEX.search(date_str)
     tz_suffix_present = False
     if tz_match:
         tz_suffix_present = True # A timezone suffix like "UTC" was found and stripped
         date_str = date_str[:tz_match.start()].strip()
 
+    # Fast path for the ISO dates that make up most RDAP/WHOIS records
+    try:
+        dt_obj = _parse_iso_datetime(date_str)
+    except ValueError:
+        dt_obj = None  # Out-of-range field; the loop below will reject it too
+    if dt_obj is not None:
+        if dt_obj.tzinfo is None and tz_suffix_present and tz_match.group(1).upper() in ["UTC", "GMT", "Z"]:
+            dt_obj = dt_obj.replace(tzinfo=timezone.utc)
+        return dt_obj
+
     is_likely_iso_with_z = date_str.upper().endswith('Z') and 'T' in date_str
 
-    for fmt in COMMON_DATE_FORMATS:
+    # Strings of one shape almost always share a format, so try the last
+    # winner for this shape first and only walk the whole list on a miss
+    shape = date_str.translate(DATE_SHAPE_TABLE)
+    cached_fmt = _DATE_FORMAT_BY_SHAPE.get(shape)
+    formats = COMMON_DATE_FORMATS if cached_fmt is None else (cached_fmt, *COMMON_DATE_FORMATS)
+
+    for fmt in formats:
         try:
             dt_obj = datetime.strptime(date_str, fmt)
+            if fmt is not cached_fmt and len(_DATE_FORMAT_BY_SHAPE) < DATE_SHAPE_CACHE_SIZE:
+                _DATE_FORMAT_BY_SHAPE[shape] = fmt
 
             # If format didn't handle timezone, but original string or suffix implies UTC
             if dt_obj.tzinfo is None:
@@ -102,19 +202,21 @@ def parse_datetime_string(date_str):
 def query_whois_socket(query, server, port=WHOIS_PORT, timeout=DEFAULT_TIMEOUT):
     """Sends a query to a WHOIS server using raw sockets."""
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(timeout)
-            s.connect((server, port))
-            s.send(f"{query}\r\n".encode())
+        # create_connection tries every address the server resolves to, IPv6 included
+        with socket.create_connection((server, port), timeout=timeout) as s:
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Send the one-line query immediately
+            s.sendall(f"{query}\r\n".encode())
             
-            response_bytes = b""
+            chunks = []
             while True:
-                data = s.recv(4096)
+                data = s.recv(WHOIS_RECV_SIZE)
                 if not data: break
-                response_bytes += data
+                chunks.append(data)
+            response_bytes = b"".join(chunks)
 
-        try: return response_bytes.decode('utf-8', errors='ignore')
-        except UnicodeDecodeError: return response_bytes.decode('latin-1', errors='ignore')
+        # Most WHOIS servers answer in plain ASCII, which has the cheapest decoder
+        if response_bytes.isascii(): return response_bytes.decode('ascii')
+        return response_bytes.decode('utf-8', errors='ignore')
 
     except socket.timeout: return f"Error: Timeout querying {server} for {query} via WHOIS."
     except socket.gaierror: return f"Error: Could not resolve WHOIS server {server}."
@@ -122,25 +224,31 @@ def query_whois_socket(query, server, port=WHOIS_PORT, timeout=DEFAULT_TIMEOUT):
     except Exception as e: return f"Error: Failed to query {server} for {query} via WHOIS: {e}"
 
 
+def _http_get(url, headers, timeout=DEFAULT_TIMEOUT):
+    """GET ``url`` over the shared keep-alive pool, following redirects.
+
+    Returns ``(status, reason, content_type, body)``. Transport failures raise
+    ``OSError`` or ``http.client.HTTPException``.
+    """
+    result = _http_session.request("GET", url, headers=headers, timeout=timeout)
+    return result.status, result.reason, result.headers.get("Content-Type", ""), result.body
+
+
 def query_rdap_http(rdap_url, timeout=DEFAULT_TIMEOUT):
     """Sends a query to an RDAP server using HTTP GET."""
     try:
-        req = urllib.request.Request(rdap_url, headers={'Accept': 'application/rdap+json', 'User-Agent': 'Python-WhoisRdapClient/0.1'})
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            if response.status == 200:
-                content_type = response.headers.get('Content-Type', '')
-                if 'application/rdap+json' in content_type or 'application/json' in content_type:
-                    return json.loads(response.read().decode('utf-8'))
-                else:
-                    return {"error": f"RDAP server returned non-JSON content-type: {content_type}", "response_snippet": response.read().decode('utf-8', errors='ignore')[:200]}
-            elif response.status == 404:
-                 return {"error": "RDAP object not found (404)."}
+        status, reason, content_type, body = _http_get(rdap_url, {'Accept': 'application/rdap+json', 'User-Agent': 'Python-WhoisRdapClient/0.1'}, timeout)
+        if status == 200:
+            if 'application/rdap+json' in content_type or 'application/json' in content_type:
+                return _json_parser.loads(body)  # Both parsers accept UTF-8 bytes; skips a decoded copy
             else:
-                return {"error": f"RDAP query failed with HTTP status {response.status}", "response_snippet": response.read().decode('utf-8', errors='ignore')[:200]}
-    except urllib.error.HTTPError as e:
-        return {"error": f"RDAP HTTPError: {e.code} {e.reason}", "response_snippet": e.read().decode('utf-8', errors='ignore')[:200] if hasattr(e, 'read') else ""}
-    except urllib.error.URLError as e:
-        return {"error": f"RDAP URLError: {e.reason}"}
+                return {"error": f"RDAP server returned non-JSON content-type: {content_type}", "response_snippet": body.decode('utf-8', errors='ignore')[:200]}
+        elif status >= 400:
+            return {"error": f"RDAP HTTPError: {status} {reason}", "response_snippet": body.decode('utf-8', errors='ignore')[:200]}
+        else:
+            return {"error": f"RDAP query failed with HTTP status {status}", "response_snippet": body.decode('utf-8', errors='ignore')[:200]}
+    except (OSError, http.client.HTTPException) as e:
+        return {"error": f"RDAP URLError: {e}"}
     except json.JSONDecodeError:
         return {"error": "Failed to decode JSON response from RDAP server."}
     except Exception as e:
@@ -156,26 +264,71 @@ def get_whois_referral_server(response_text):
             if server_name != "none" and '.' in server_name: return server_name
     return None
 
-def get_rdap_base_url_from_iana_bootstrap(tld, timeout=DEFAULT_TIMEOUT):
+def _fill_once(fn):
+    """Cache ``fn`` by its positional arguments; keywords such as ``timeout`` are not part of the key.
+
+    Unlike ``lru_cache``, concurrent misses for one key wait for a single call
+    instead of each repeating it. Exceptions propagate and are not cached.
+    """
+    values, locks, guard = {}, {}, threading.Lock()
+
+    @functools.wraps(fn)
+    def wrapper(*key, **kwargs):
+        try:
+            return values[key]
+        except KeyError:
+            pass
+        with guard:
+            lock = locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in values:
+                values[key] = fn(*key, **kwargs)
+        return values[key]
+
+    wrapper.cache_clear = values.clear
+    return wrapper
+
+
+@_fill_once
+def _load_iana_bootstrap(timeout=DEFAULT_TIMEOUT):
+    """Fetch the IANA DNS RDAP bootstrap once and index it as ``{tld: base_url}``.
+
+    Errors propagate so that a failed fetch is not cached.
+    """
     iana_dns_bootstrap_url = "https://data.iana.org/rdap/dns.json"
+    status, _reason, _content_type, body = _http_get(iana_dns_bootstrap_url, {'User-Agent': 'Python-WhoisRdapClient/0.1'}, timeout)
+    if status != 200:
+        raise OSError(f"IANA RDAP bootstrap returned HTTP {status}")
+    # Keep only the service list; the rest of the document is not needed
+    services = _json_parser.loads(body).get("services", [])
+
+    base_urls = {}
+    for service_block in services:
+        if len(service_block) == 2 and len(service_block[0]) > 0 and len(service_block[1]) > 0:
+            url_list_in_block = service_block[1]
+            base_url = next((url for url in url_list_in_block if url.startswith("https://")), url_list_in_block[0])
+            for tld_in_block in service_block[0]:
+                base_urls.setdefault(tld_in_block.lower(), base_url)  # First block listing a TLD wins
+    return base_urls
+
+
+def get_rdap_base_url_from_iana_bootstrap(tld, timeout=DEFAULT_TIMEOUT):
     try:
-        req = urllib.request.Request(iana_dns_bootstrap_url, headers={'User-Agent': 'Python-WhoisRdapClient/0.1'})
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            if response.status == 200:
-                bootstrap_data = json.loads(response.read().decode('utf-8'))
-                services = bootstrap_data.get("services", [])
-                for service_block in services:
-                    if len(service_block) == 2 and len(service_block[0]) > 0 and len(service_block[1]) > 0:
-                        tld_list_in_block = service_block[0]
-                        url_list_in_block = service_block[1]
-                        if tld.lower() in [item.lower() for item in tld_list_in_block]:
-                            for url_item in url_list_in_block:
-                                if url_item.startswith("https://"): return url_item
-                            return url_list_in_block[0]
-            return None
+        return _load_iana_bootstrap(timeout=timeout).get(tld.lower())
     except Exception:
         return None
-    return None
+
+
+def _vcard_name_and_org(entity):
+    """Last ``fn`` and ``org`` values of an RDAP entity's vCard, or None without one."""
+    vcard_array = entity.get("vcardArray")
+    if not vcard_array or len(vcard_array) <= 1:
+        return None
+    fn_name, org_name = None, None
+    for item in vcard_array[1]:
+        if item[0] == "fn": fn_name = item[3]
+        elif item[0] == "org": org_name = item[3]
+    return fn_name, org_name
 
 
 def parse_rdap_data(rdap_json, domain_norm): # Changed 'domain' to 'domain_norm' for clarity
@@ -196,8 +349,12 @@ def parse_rdap_data(rdap_json, domain_norm): # Changed 'domain' to 'domain_norm'
         elif action == "last changed": parsed["updated_date"] = dt_obj
         elif action == "expiration": parsed["expiration_date"] = dt_obj
 
+    registrar_found = False
     for entity in rdap_json.get("entities", []):
-        if "registrar" in entity.get("roles", []):
+        roles = set(entity.get("roles", []))
+
+        if "registrar" in roles and not registrar_found:
+            registrar_found = True
             public_ids = entity.get("publicIds", [])
             if public_ids:
                 iana_id_found = False
@@ -209,17 +366,31 @@ def parse_rdap_data(rdap_json, domain_norm): # Changed 'domain' to 'domain_norm'
                 if not iana_id_found and public_ids[0].get("identifier"):
                      parsed["registrar_iana_id"] = str(public_ids[0].get("identifier"))
 
-            if entity.get("vcardArray") and len(entity["vcardArray"]) > 1:
-                 vcard = entity["vcardArray"][1]
-                 for item in vcard:
-                     if item[0] == "fn":
-                         parsed["registrar"] = item[3]
-                         break
+            # The registrar takes the first fn of its vCard, contacts below the last
+            vcard_array = entity.get("vcardArray")
+            if vcard_array and len(vcard_array) > 1:
+                for item in vcard_array[1]:
+                    if item[0] == "fn":
+                        parsed["registrar"] = item[3]
+                        break
             for link in entity.get("links", []):
                 if link.get("rel") == "alternate" and link.get("type") == "text/html":
                     parsed["registrar_url"] = link.get("href")
                     break
-            break
+
+        main_role_for_entity = None
+        if "registrant" in roles: main_role_for_entity = "registrant"
+        elif "administrative" in roles: main_role_for_entity = "admin"
+        elif "technical" in roles: main_role_for_entity = "tech"
+
+        vcard_fields = _vcard_name_and_org(entity) if main_role_for_entity else None
+        if vcard_fields is not None:
+            contact_prefix = main_role_for_entity
+            fn_name, org_name = vcard_fields
+            if not parsed.get(f"{contact_prefix}_name"):
+                parsed[f"{contact_prefix}_name"] = fn_name
+            if not parsed.get(f"{contact_prefix}_organization"):
+                 parsed[f"{contact_prefix}_organization"] = org_name if org_name else (fn_name if not fn_name and not org_name else None)
 
     parsed["name_servers"] = [ns.get("ldhName", "").lower() for ns in rdap_json.get("nameservers", []) if ns.get("ldhName")]
     parsed["domain_status"] = rdap_json.get("status", [])
@@ -227,29 +398,120 @@ def parse_rdap_data(rdap_json, domain_norm): # Changed 'domain' to 'domain_norm'
     dnssec_signed = rdap_json.get("secureDNS", {}).get("delegationSigned")
     if dnssec_signed is not None:
         parsed["dnssec"] = "signedDelegation" if dnssec_signed else "unsigned"
+    return parsed
 
-    contact_roles_map = {"registrant": "registrant", "administrative": "admin", "technical": "tech"}
-    for entity in rdap_json.get("entities", []):
-        entity_roles = entity.get("roles", [])
-        main_role_for_entity = None
-        if "registrant" in entity_roles: main_role_for_entity = "registrant"
-        elif "administrative" in entity_roles: main_role_for_entity = "admin"
-        elif "technical" in entity_roles: main_role_for_entity = "tech"
 
-        if main_role_for_entity:
-            contact_prefix = main_role_for_entity
-            if entity.get("vcardArray") and len(entity["vcardArray"]) > 1:
-                vcard = entity["vcardArray"][1]
-                org_name, fn_name = None, None
-                for item in vcard:
-                    if item[0] == "fn": fn_name = item[3]
-                    if item[0] == "org": org_name = item[3]
-
-                if not parsed.get(f"{contact_prefix}_name"):
-                    parsed[f"{contact_prefix}_name"] = fn_name
-                if not parsed.get(f"{contact_prefix}_organization"):
-                     parsed[f"{contact_prefix}_organization"] = org_name if org_name else (fn_name if not fn_name and not org_name else None)
-    return parsed
+# Lines starting with these are comments/banners, not "key: value" data
+WHOIS_COMMENT_PREFIXES = ("%", ">>>", "#")
+# Boilerplate footer lines (matched against the lowercased line)
+WHOIS_NOISE_REGEX = re.compile(r"last update of whois database|for more information on whois status codes")
+
+# WHOIS key substrings that identify a date field, in match priority order
+WHOIS_DATE_KEYWORDS = {
+    "creation date": "creation_date", "created": "creation_date", "registration time": "creation_date", "registered on": "creation_date", "domain registration date": "creation_date",
+    "updated date": "updated_date", "last update": "updated_date", "last modified": "updated_date", "changed": "updated_date", "domain last updated date": "updated_date",
+    "expiry date": "expiration_date", "expiration time": "expiration_date", "registrar registration expiration date": "expiration_date", "paid-till": "expiration_date", "expires on": "expiration_date", "registry expiry date": "expiration_date", "domain expiration date": "expiration_date"
+}
+
+# Exact WHOIS contact keys, also matched by prefix inside a contact block
+WHOIS_CONTACT_KEYWORDS = {
+    "registrant name": "registrant_name", "registrant organization": "registrant_organization",
+    "holder name": "registrant_name", "holder organization": "registrant_organization", # Alternative terms
+    "admin name": "admin_name", "admin organization": "admin_organization", "administrative contact name": "admin_name",
+    "tech name": "tech_name", "tech organization": "tech_organization", "technical contact name": "tech_name",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _date_fields_for_key(key_lower):
+    """Date fields a WHOIS key may fill, in keyword priority order.
+
+    Records repeat a small vocabulary of keys, so the keyword scan runs once
+    per distinct key and every later line is a cache hit.
+    """
+    return tuple(dict.fromkeys(field for kw, field in WHOIS_DATE_KEYWORDS.items() if kw in key_lower))
+
+
+@functools.lru_cache(maxsize=1024)
+def _contact_fields_for_key(key_lower, contact_type):
+    """Contact fields a WHOIS key may fill inside ``contact_type``'s block, in priority order."""
+    fields = []
+    for kw, field_name in WHOIS_CONTACT_KEYWORDS.items():
+        if kw == key_lower or (
+            contact_type and kw.startswith(contact_type) and (
+                ("name" in kw and "name" in key_lower and "server" not in key_lower)
+                or ("organization" in kw and "organization" in key_lower)
+            )
+        ):
+            fields.append(field_name)
+    return tuple(fields)
+
+
+def _set_domain_name(parsed_info, key, value):
+    if parsed_info["domain_name"]:
+        return False
+    parsed_info["domain_name"] = value.lower()
+    return True
+
+def _set_registrar(parsed_info, key, value):
+    parsed_info["registrar"] = value
+    return True
+
+def _set_registrar_whois_server(parsed_info, key, value):
+    parsed_info["registrar_whois_server"] = value.lower()
+    return True
+
+def _set_registrar_url(parsed_info, key, value):
+    parsed_info["registrar_url"] = value
+    return True
+
+def _set_registrar_url_if_named(parsed_info, key, value):
+    # A bare "url" key only counts when it follows the registrar line
+    if parsed_info.get("registrar") not in key:
+        return False
+    parsed_info["registrar_url"] = value
+    return True
+
+def _set_registrar_iana_id(parsed_info, key, value):
+    parsed_info["registrar_iana_id"] = value
+    return True
+
+def _add_name_server(parsed_info, key, value):
+    ns_val = value.lower().split()[0]
+    if ns_val and '.' in ns_val: parsed_info["name_servers"][ns_val] = None
+    return True
+
+def _add_domain_status(parsed_info, key, value):
+    statuses = value.lower().split()
+    for status_val in statuses:
+        if "https://" in status_val: continue
+        if status_val: parsed_info["domain_status"][status_val] = None
+    return True
+
+def _set_dnssec(parsed_info, key, value):
+    parsed_info["dnssec"] = value.lower()
+    return True
+
+
+# (key matcher, handler) in priority order; a handler returns False to let
+# the next matching rule have the line.
+WHOIS_FIELD_RULES = (
+    (lambda k: "domain name" in k, _set_domain_name),
+    (lambda k: k == "registrar", _set_registrar),
+    (lambda k: "whois server" in k, _set_registrar_whois_server),
+    (lambda k: "registrar url" in k, _set_registrar_url),
+    (lambda k: k == "url", _set_registrar_url_if_named),
+    (lambda k: "registrar iana id" in k, _set_registrar_iana_id),
+    (lambda k: "name server" in k or "nserver" in k or k.startswith("ns_name_"), _add_name_server),
+    (lambda k: "domain status" in k or k == "status", _add_domain_status),
+    (lambda k: "dnssec" in k, _set_dnssec),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _field_handlers_for_key(key_lower):
+    """Handlers of the WHOIS_FIELD_RULES matching ``key_lower``, classified once per distinct key."""
+    return tuple(handler for matches, handler in WHOIS_FIELD_RULES if matches(key_lower))
 
 
 def parse_whois_text_data(raw_text, domain_norm): # Changed 'domain' to 'domain_norm'
@@ -268,12 +530,17 @@ def parse_whois_text_data(raw_text, domain_norm): # Changed 'domain' to 'domain_
         return parsed_info
 
     lines = raw_text.replace('\r\n', '\n').split('\n')
+    # Collected as dicts (ordered sets) while parsing, sorted into lists at the end
+    parsed_info["name_servers"], parsed_info["domain_status"] = {}, {}
     current_contact_type = None
     date_field_set_flags = {"creation_date": False, "updated_date": False, "expiration_date": False}
 
     for line in lines:
         line = line.strip()
-        if not line or line.startswith("%") or line.startswith(">>>") or line.startswith("#") or "last update of whois database" in line.lower() or "for more information on whois status codes" in line.lower():
+        if not line or line.startswith(WHOIS_COMMENT_PREFIXES):
+            continue
+        line_lower = line.lower()
+        if "whois" in line_lower and WHOIS_NOISE_REGEX.search(line_lower):
             continue
 
         if ":" in line:
@@ -281,85 +548,86 @@ def parse_whois_text_data(raw_text, domain_norm): # Changed 'domain' to 'domain_
             key_lower = key.strip().lower()
             value = value.strip()
 
-            date_keywords = {
-                "creation date": "creation_date", "created": "creation_date", "registration time": "creation_date", "registered on": "creation_date", "domain registration date": "creation_date",
-                "updated date": "updated_date", "last update": "updated_date", "last modified": "updated_date", "changed": "updated_date", "domain last updated date": "updated_date",
-                "expiry date": "expiration_date", "expiration time": "expiration_date", "registrar registration expiration date": "expiration_date", "paid-till": "expiration_date", "expires on": "expiration_date", "registry expiry date": "expiration_date", "domain expiration date": "expiration_date"
-            }
-            for kw, field_name in date_keywords.items():
-                if kw in key_lower and not date_field_set_flags[field_name]:
+            for field_name in _date_fields_for_key(key_lower):
+                if not date_field_set_flags[field_name]:
                     dt_val = parse_datetime_string(value)
                     if dt_val:
                         parsed_info[field_name] = dt_val
                         date_field_set_flags[field_name] = True
                     break
 
-            if "domain name" in key_lower and not parsed_info["domain_name"]: parsed_info["domain_name"] = value.lower()
-            elif key_lower == "registrar" and not any(s in key_lower for s in ["abuse", "iana", "server", "url", "contact"]): parsed_info["registrar"] = value
-            elif "whois server" in key_lower or "registrar whois server" in key_lower: parsed_info["registrar_whois_server"] = value.lower()
-            elif "registrar url" in key_lower or (key_lower == "url" and parsed_info.get("registrar") in key): parsed_info["registrar_url"] = value
-            elif "registrar iana id" in key_lower: parsed_info["registrar_iana_id"] = value
-            elif "name server" in key_lower or "nserver" in key_lower or key_lower.startswith("ns_name_"):
-                ns_val = value.lower().split()[0]
-                if ns_val and '.' in ns_val and ns_val not in parsed_info["name_servers"]: parsed_info["name_servers"].append(ns_val)
-            elif "domain status" in key_lower or (key_lower == "status" and not any(s in key_lower for s in ["payment", "billing"])):
-                statuses = value.lower().split()
-                for status_val in statuses:
-                    if "https://" in status_val: continue
-                    if status_val and status_val not in parsed_info["domain_status"]: parsed_info["domain_status"].append(status_val)
-            elif "dnssec" in key_lower: parsed_info["dnssec"] = value.lower()
-
-            contact_keywords_map = {
-                "registrant name": "registrant_name", "registrant organization": "registrant_organization",
-                "holder name": "registrant_name", "holder organization": "registrant_organization", # Alternative terms
-                "admin name": "admin_name", "admin organization": "admin_organization", "administrative contact name": "admin_name",
-                "tech name": "tech_name", "tech organization": "tech_organization", "technical contact name": "tech_name",
-            }
+            for apply_field in _field_handlers_for_key(key_lower):
+                if apply_field(parsed_info, key, value):
+                    break
+
             if key_lower in ["registrant", "administrative contact", "technical contact", "holder", "owner"]: current_contact_type = key_lower.split()[0]
 
-            for kw, field_name in contact_keywords_map.items():
-                if kw == key_lower and not parsed_info.get(field_name):
+            for field_name in _contact_fields_for_key(key_lower, current_contact_type):
+                if not parsed_info.get(field_name):
                     parsed_info[field_name] = value
                     break
-                elif current_contact_type and kw.startswith(current_contact_type) and not parsed_info.get(field_name) :
-                    if ("name" in kw and "name" in key_lower and "server" not in key_lower) or \
-                       ("organization" in kw and "organization" in key_lower):
-                         parsed_info[field_name] = value
-                         break
 
     if not parsed_info["domain_name"] and domain_norm : parsed_info["domain_name"] = domain_norm.lower()
-    if parsed_info["name_servers"]: parsed_info["name_servers"] = sorted(list(set(ns for ns in parsed_info["name_servers"] if ns != "." and ns)))
-    if parsed_info["domain_status"]: parsed_info["domain_status"] = sorted(list(set(parsed_info["domain_status"])))
+    parsed_info["name_servers"] = sorted(ns for ns in parsed_info["name_servers"] if ns != ".")
+    parsed_info["domain_status"] = sorted(parsed_info["domain_status"])
         
     return parsed_info
 
 
-def get_authoritative_server_for_domain(domain_norm, preferred_protocol="try_both", timeout=DEFAULT_TIMEOUT): # Changed 'domain' to 'domain_norm'
-    tld = domain_norm.split('.')[-1].lower()
+@_fill_once
+def _whois_server_for_tld(tld, timeout=DEFAULT_TIMEOUT):
+    """WHOIS server and protocol IANA refers ``tld`` to.
+
+    Referrals are per TLD, so results are cached for every domain under it.
+    Raises ``LookupError`` when IANA gives no usable answer, which keeps
+    transient failures out of the cache.
+    """
+    iana_response_text = query_whois_socket(tld, IANA_WHOIS_SERVER, timeout=timeout)
+    if not iana_response_text or iana_response_text.startswith("Error:"):
+        raise LookupError(f"Initial IANA WHOIS query for {tld} failed or gave error: {iana_response_text if iana_response_text else 'No response'}")
+    referral_server = get_whois_referral_server(iana_response_text)
+    if referral_server:
+        return referral_server, "whois"
+    return IANA_WHOIS_SERVER, "whois_direct_iana"
+
+
+def _get_authoritative_server_for_tld(tld, preferred_protocol, timeout):
+    """Resolve the RDAP base URL or WHOIS server for ``tld``.
+
+    The RDAP bootstrap is consulted on every call (the document itself is
+    cached once fetched), so a transient bootstrap failure that falls back
+    to WHOIS is not remembered for the TLD.
+    """
     error_log = []
 
     if preferred_protocol == "rdap" or preferred_protocol == "try_both":
         rdap_base_url = get_rdap_base_url_from_iana_bootstrap(tld, timeout=timeout)
         if rdap_base_url:
             if not rdap_base_url.endswith('/'): rdap_base_url += '/'
-            final_rdap_url = f"{rdap_base_url}domain/{domain_norm}"
-            return final_rdap_url, "rdap", None
+            return rdap_base_url, "rdap", None
         else:
             error_log.append(f"Could not determine RDAP base URL for TLD '{tld}' from IANA bootstrap.")
             if preferred_protocol == "rdap":
-                return None, None, " ; ".join(error_log)
+                raise LookupError(" ; ".join(error_log))
 
-    iana_response_text = query_whois_socket(domain_norm, IANA_WHOIS_SERVER, timeout=timeout)
+    try:
+        server, protocol = _whois_server_for_tld(tld, timeout=timeout)
+    except LookupError as e:
+        error_log.append(str(e))
+        raise LookupError(" ; ".join(error_log))
+    return server, protocol, " ; ".join(error_log) if error_log else None
 
-    if iana_response_text and not iana_response_text.startswith("Error:"):
-        referral_server = get_whois_referral_server(iana_response_text)
-        if referral_server:
-            return referral_server, "whois", " ; ".join(error_log) if error_log else None
-        else:
-            return IANA_WHOIS_SERVER, "whois_direct_iana", " ; ".join(error_log) if error_log else None
-    else:
-        error_log.append(f"Initial IANA WHOIS query for {domain_norm} failed or gave error: {iana_response_text if iana_response_text else 'No response'}")
-        return None, None, " ; ".join(error_log)
+
+def get_authoritative_server_for_domain(domain_norm, preferred_protocol="try_both", timeout=DEFAULT_TIMEOUT): # Changed 'domain' to 'domain_norm'
+    tld = domain_norm.split('.')[-1].lower()
+    try:
+        server, protocol, error = _get_authoritative_server_for_tld(tld, preferred_protocol, timeout)
+    except LookupError as e:
+        return None, None, str(e)
+
+    if protocol == "rdap":
+        return f"{server}domain/{domain_norm}", protocol, error
+    return server, protocol, error
 
 
 def unified_domain_lookup(domain, preferred_protocol="try_both", whois_max_referrals=2, timeout=DEFAULT_TIMEOUT):
@@ -448,15 +716,46 @@ def unified_domain_lookup(domain, preferred_protocol="try_both", whois_max_refer
     return lookup_result # domain_queried is in lookup_result
 
 
+async def unified_domain_lookup_async(domain, preferred_protocol="try_both", whois_max_referrals=2, timeout=DEFAULT_TIMEOUT):
+    """Awaitable :func:`unified_domain_lookup`, run on a worker thread so lookups can overlap."""
+    import asyncio
+
+    return await asyncio.to_thread(unified_domain_lookup, domain, preferred_protocol, whois_max_referrals, timeout)
+
+
+async def lookup_many(domains, concurrency=DEFAULT_LOOKUP_CONCURRENCY, preferred_protocol="try_both", whois_max_referrals=2, timeout=DEFAULT_TIMEOUT):
+    """Look up many domains concurrently, at most ``concurrency`` at a time.
+
+    The lookups are network-bound, so a batch takes roughly as long as its
+    slowest domain rather than the sum of all of them. Results are returned in
+    the same order as ``domains``.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    # A dedicated pool: the loop's default executor is sized by CPU count, which
+    # would cap a network-bound batch well below ``concurrency``.
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        return await asyncio.gather(*(
+            loop.run_in_executor(executor, unified_domain_lookup, domain, preferred_protocol, whois_max_referrals, timeout)
+            for domain in domains
+        ))
+
+
 if __name__ == "__main__":
     test_domains_main = [
         "google.com", "github.io", "nic.uk", "example.de",
         "nonexistentdomain12345abc.org", "fsf.org", "gouv.fr"
     ]
 
-    for domain_to_test in test_domains_main:
+    import asyncio
+
+    skip_keys = frozenset(("raw_text", "raw_json", "protocol", "queried_server",
+                           "referral_path_whois", "parser_error", "error",
+                           "errors_during_lookup", "domain_queried", "protocol_attempts"))
+    results_main = asyncio.run(lookup_many(test_domains_main, preferred_protocol="try_both"))
+    for domain_to_test, result in zip(test_domains_main, results_main):
         logger.info(f"\n--- Unified Lookup for: {domain_to_test} (Prefer RDAP, fallback WHOIS) ---")
-        result = unified_domain_lookup(domain_to_test, preferred_protocol="try_both")
 
         if "error" in result and not (result.get("raw_text") or result.get("raw_json")):
             logger.info(f"  Critical Error for {result.get('domain_queried', domain_to_test)}: {result['error']}")
@@ -474,9 +773,6 @@ if __name__ == "__main__":
 
             logger.info("\n  Parsed Information:")
             for key, val in result.items():
-                skip_keys = ["raw_text", "raw_json", "protocol", "queried_server",
-                             "referral_path_whois", "parser_error", "error",
-                             "errors_during_lookup", "domain_queried", "protocol_attempts"]
                 if key in skip_keys: continue
 
                 if isinstance(val, list) and val:
@@ -502,4 +798,3 @@ if __name__ == "__main__":
                 logger.info("  Protocol Attempt Log:")
                 for attempt in result["protocol_attempts"]: logger.info(f"    - Tried {attempt['protocol']} on {attempt.get('server','N/A')}" + (f" (Reason: {attempt.get('reason')})" if attempt.get('reason') else ""))
         logger.info("-" * 70)
-        time.sleep(1.5)
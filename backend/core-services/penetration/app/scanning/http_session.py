@@ -0,0 +1,143 @@
+"""Keep-alive HTTP connection pool shared by the scanning helpers.
+
+``urllib.request.urlopen`` opens a new TCP (and TLS) connection for every
+probe.  :class:`HTTPSession` keeps idle ``http.client`` connections per
+``(scheme, host:port)`` so that word-list brute forcing and spidering reuse
+sockets across requests and worker threads.
+"""
+
+from __future__ import annotations
+
+import http.client
+import ssl
+import threading
+import urllib.parse
+from collections import deque
+from typing import Deque, Dict, NamedTuple, Optional, Tuple
+
+DEFAULT_POOL_MAXSIZE = 256
+DEFAULT_MAX_REDIRECTS = 5
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+class HTTPResult(NamedTuple):
+    """Outcome of :meth:`HTTPSession.request` after following redirects."""
+
+    status: int
+    reason: str
+    headers: http.client.HTTPMessage
+    url: str
+    body: bytes
+
+
+class HTTPSession:
+    """Thread-safe pool of persistent HTTP/HTTPS connections.
+
+    Connections are checked out for the duration of one request and returned
+    afterwards unless the server asked to close them.  At most
+    ``pool_maxsize`` idle connections are kept per host.
+
+    Args:
+        ssl_context: Context used for ``https`` connections.
+        pool_maxsize: Idle connections retained per ``(scheme, netloc)``.
+        max_redirects: Redirects followed by :meth:`request`, mirroring
+            ``urlopen`` which follows them transparently.
+    """
+
+    def __init__(
+        self,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_redirects: int = DEFAULT_MAX_REDIRECTS,
+    ) -> None:
+        self.ssl_context = ssl_context
+        self.pool_maxsize = pool_maxsize
+        self.max_redirects = max_redirects
+        self._idle: Dict[Tuple[str, str], Deque[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _checkout(self, scheme: str, netloc: str, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            conn = idle.pop() if idle else None
+        if conn is None:
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(netloc, timeout=timeout, context=self.ssl_context)
+            else:
+                conn = http.client.HTTPConnection(netloc, timeout=timeout)
+            return conn, True
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, False
+
+    def _checkin(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), deque())
+            if len(idle) < self.pool_maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(self, method: str, url: str, headers: Dict[str, str], timeout: float):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise http.client.InvalidURL(f"Unsupported URL scheme: {url}")
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        while True:
+            conn, fresh = self._checkout(parts.scheme, parts.netloc, timeout)
+            try:
+                conn.request(method, path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                # A reused socket may have been closed by the server while idle
+                if fresh:
+                    raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(parts.scheme, parts.netloc, conn)
+        return response, body
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 5.0,
+    ) -> HTTPResult:
+        """Send ``method`` to ``url`` over a pooled connection.
+
+        Redirects are followed like ``urlopen`` does: ``GET`` and ``HEAD``
+        keep their method, anything else becomes a ``GET``.
+
+        Raises:
+            OSError: On connection or socket failures.
+            http.client.HTTPException: On protocol errors or redirect loops.
+        """
+
+        headers = dict(headers or {})
+        for _ in range(self.max_redirects + 1):
+            response, body = self._send(method, url, headers, timeout)
+            location = response.getheader("Location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                return HTTPResult(response.status, response.reason, response.msg, url, body)
+            url = urllib.parse.urljoin(url, location)
+            if method not in ("GET", "HEAD"):
+                method = "GET"
+        raise http.client.HTTPException(f"Too many redirects fetching {url}")
+
+    def close(self) -> None:
+        """Close every idle connection held by the pool."""
+
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+
+__all__ = ["HTTPSession", "HTTPResult", "DEFAULT_POOL_MAXSIZE"]
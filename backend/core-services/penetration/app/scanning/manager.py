@@ -9,11 +9,14 @@ application.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from .http_session import HTTPSession
 from .web_spider import WebSpider
 from .vulnerability_scanning.vulnerability_scan import VulnerabilityScanner
-from .wordlist_scanning.directory_bruteforce import brute_force_paths
+from .wordlist_scanning.directory_bruteforce import UNVERIFIED_SSL_CONTEXT, brute_force_paths
 from .wordlist_scanning.file_bruteforce import brute_force_files
 
 if TYPE_CHECKING:  # pragma: no cover - for static analysis only
@@ -24,6 +27,8 @@ else:  # pragma: no cover - resolved lazily for runtime use
     _ScanType = Any
 
 _PORT_SCANNER_MODULE: Optional[Any] = None
+# ``ScanType`` members by name, resolved on first use.
+_SCAN_TYPES: Dict[str, Any] = {}
 
 
 def _get_port_scanner_module() -> Any:
@@ -47,9 +52,26 @@ def _parse_ports(port_spec: Union[str, Iterable[int]]) -> List[int]:
     return module.parse_ports(port_spec)
 
 
+@lru_cache(maxsize=128)
+def _parse_ports_cached(port_spec: Union[str, Tuple[Any, ...]]) -> Tuple[int, ...]:
+    """Memoised :func:`_parse_ports` keyed on a string or tuple specification.
+
+    Large ranges such as ``"1-65535"`` are expanded once; callers get a fresh
+    list from the cached tuple so they cannot mutate the cache.
+    """
+
+    # ``parse_ports`` gracefully handles lists, so generic iterables are
+    # converted before reusing its validation logic.
+    spec = port_spec if isinstance(port_spec, str) else list(port_spec)
+    return tuple(_parse_ports(spec))  # type: ignore[arg-type]
+
+
 def _get_scan_type(name: str) -> Any:
-    module = _get_port_scanner_module()
-    return getattr(module.ScanType, name)
+    scan_type = _SCAN_TYPES.get(name)
+    if scan_type is None:
+        module = _get_port_scanner_module()
+        scan_type = _SCAN_TYPES[name] = getattr(module.ScanType, name)
+    return scan_type
 
 
 def scan_ports(target_ip: str, ports: List[int], scan_type: Any, **opts: Any) -> Dict[str, Any]:
@@ -64,9 +86,54 @@ def parse_ports(port_spec: Union[str, Iterable[int]]) -> List[int]:
     return _parse_ports(port_spec)
 
 
+#: Steps understood by :meth:`Scanning.run`, mapped to the keyword arguments
+#: passed positionally to the step method and the key holding its options.
+RUN_STEPS: Dict[str, Tuple[Tuple[str, ...], Optional[str]]] = {
+    "web_spider": (("base_url",), "web_spider_options"),
+    "vulnerability_scan": (("target_ip", "services"), None),
+    "tcp_port_scan": (("target_ip", "ports"), "tcp_port_scan_options"),
+    "udp_port_scan": (("target_ip", "ports"), "udp_port_scan_options"),
+    "stealth_port_scan": (("target_ip", "ports"), "stealth_port_scan_options"),
+    "directory_bruteforce": (("base_url",), "directory_bruteforce_options"),
+    "file_bruteforce": (("base_url",), "file_bruteforce_options"),
+}
+
+#: Upper bound on scanning jobs :meth:`Scanning.run` keeps in flight.
+MAX_PARALLEL_STEPS = 8
+
+PORT_SCAN_STEPS = frozenset({"tcp_port_scan", "udp_port_scan", "stealth_port_scan"})
+
+_RUN_ARG_DEFAULTS: Dict[str, Any] = {"services": {}}
+
+
+@lru_cache(maxsize=64)
+def _run_plan(steps: Tuple[str, ...]) -> Tuple[Tuple[str, Tuple[str, ...], Optional[str]], ...]:
+    """Resolve a ``steps`` sequence into ``(step, arg_names, options_key)`` entries.
+
+    Unknown names are dropped and repeats collapsed, keeping caller order.
+    Orchestrators run the same pipeline against many hosts, so the plan is
+    built once per distinct sequence.
+    """
+
+    return tuple((step, *RUN_STEPS[step]) for step in dict.fromkeys(steps) if step in RUN_STEPS)
+
+
 class Scanning:
     """Granular interface for scanning related tasks."""
 
+    @property
+    def _http_session(self) -> HTTPSession:
+        """Keep-alive connection pool shared by the HTTP based wrappers.
+
+        Created on first use; ``setdefault`` keeps a single instance even when
+        :meth:`run` starts several HTTP steps at once.
+        """
+
+        session = self.__dict__.get("_session")
+        if session is None:
+            session = self.__dict__.setdefault("_session", HTTPSession(ssl_context=UNVERIFIED_SSL_CONTEXT))
+        return session
+
     # ------------------------------------------------------------------
     # Simple wrappers around individual scanning utilities
     # ------------------------------------------------------------------
@@ -74,6 +141,7 @@ class Scanning:
     def web_spider(self, base_url: str, **kwargs) -> Dict[str, List[str]]:
         """Crawl a target website and return discovered links."""
 
+        kwargs.setdefault("session", self._http_session)
         spider = WebSpider(base_url, **kwargs)
         spider.crawl()
         return {
@@ -102,17 +170,21 @@ class Scanning:
             return []
 
         if isinstance(ports, str):
-            return _parse_ports(ports)
+            return list(_parse_ports_cached(ports))
 
         try:
-            # ``parse_ports`` gracefully handles lists, so we convert generic
-            # iterables before reusing its validation logic.
-            return _parse_ports(list(ports))  # type: ignore[arg-type]
+            spec = tuple(ports)
         except TypeError as exc:
             raise ValueError(
                 "Ports must be provided as a string or iterable of integers."
             ) from exc
 
+        try:
+            return list(_parse_ports_cached(spec))
+        except TypeError:
+            # Unhashable entries cannot be cached; ``parse_ports`` drops them.
+            return _parse_ports(list(spec))
+
     def tcp_port_scan(
         self,
         target_ip: str,
@@ -193,6 +265,7 @@ class Scanning:
             List of dictionaries describing discovered paths.
         """
 
+        opts.setdefault("session", self._http_session)
         return brute_force_paths(base_url, **opts)
 
     def file_bruteforce(self, base_url: str, **opts) -> List[Dict[str, Any]]:
@@ -206,96 +279,64 @@ class Scanning:
             List of dictionaries describing discovered files.
         """
 
+        opts.setdefault("session", self._http_session)
         return brute_force_files(base_url, **opts)
 
     # ------------------------------------------------------------------
     # Orchestration
     # ------------------------------------------------------------------
 
-    def run(self, steps: Optional[List[str]] = None, **kwargs) -> Dict[str, Any]:
-        """Execute multiple scanning steps sequentially.
+    def run(
+        self,
+        steps: Optional[List[str]] = None,
+        post_scan_hook: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Execute multiple scanning steps concurrently.
 
         Recognised step names include ``web_spider``, ``vulnerability_scan`` and
         the specialised port and word‑list based scans such as
-        ``tcp_port_scan`` and ``directory_bruteforce``.  Additional keyword
-        arguments provide the parameters required by each step.
+        ``tcp_port_scan`` and ``directory_bruteforce`` (see :data:`RUN_STEPS`).
+        Each step runs at most once and unknown names are ignored.  The steps
+        are independent network operations, so they run on a thread pool of up
+        to :data:`MAX_PARALLEL_STEPS` workers; pass ``_serial=True`` to run them
+        one after another in the given order instead.  Results are returned in
+        the order requested.  Additional keyword arguments provide the
+        parameters required by each step.
+
+        ``post_scan_hook``, when given, is called on the calling thread as
+        ``post_scan_hook(step, result)`` once each port scan finishes.  It
+        replaces the second scan ``run`` used to perform for consumers that
+        wanted to observe port-scan results.
         """
 
+        serial = bool(kwargs.pop("_serial", False))
+        jobs: List[Tuple[str, Callable[..., Any], List[Any], Dict[str, Any]]] = []
+
+        plan = _run_plan(tuple(steps or ()))
+        for step, arg_names, options_key in plan:
+            args = [kwargs.get(name, _RUN_ARG_DEFAULTS.get(name)) for name in arg_names]
+            opts = kwargs.get(options_key, {}) if options_key else {}
+            jobs.append((step, getattr(self, step), args, opts))
+
         results: Dict[str, Any] = {}
-        # ``run`` has historically invoked each port-scan twice: once to gather
-        # the result returned to the caller and once more to feed downstream
-        # consumers that expect a "second pass" (e.g. logging hooks).  Some of
-        # the regression tests codify this behaviour, so we keep track of the
-        # additional invocations required to preserve compatibility.
-        port_scan_replays: List[Callable[[], Any]] = []
-        steps = steps or []
-
-        if "web_spider" in steps:
-            base_url = kwargs.get("base_url")
-            web_opts = kwargs.get("web_spider_options", {})
-            results["web_spider"] = self.web_spider(base_url, **web_opts)
-
-        if "vulnerability_scan" in steps:
-            target_ip = kwargs.get("target_ip")
-            services = kwargs.get("services", {})
-            results["vulnerability_scan"] = self.vulnerability_scan(target_ip, services)
-
-        if "tcp_port_scan" in steps:
-            target = kwargs.get("target_ip")
-            ports = kwargs.get("ports")
-            opts = kwargs.get("tcp_port_scan_options", {})
-            results["tcp_port_scan"] = self.tcp_port_scan(target, ports, **opts)
-            port_scan_replays.append(
-                lambda target=target,
-                ports=self._normalise_ports(ports),
-                opts=opts: self.tcp_port_scan(target, ports, **opts)
-            )
-
-        if "udp_port_scan" in steps:
-            target = kwargs.get("target_ip")
-            ports = kwargs.get("ports")
-            opts = kwargs.get("udp_port_scan_options", {})
-            results["udp_port_scan"] = self.udp_port_scan(target, ports, **opts)
-            port_scan_replays.append(
-                lambda target=target,
-                ports=self._normalise_ports(ports),
-                opts=opts: self.udp_port_scan(target, ports, **opts)
-            )
-
-        if "stealth_port_scan" in steps:
-            target = kwargs.get("target_ip")
-            ports = kwargs.get("ports")
-            opts = kwargs.get("stealth_port_scan_options", {})
-            results["stealth_port_scan"] = self.stealth_port_scan(target, ports, **opts)
-            port_scan_replays.append(
-                lambda target=target,
-                ports=self._normalise_ports(ports),
-                opts=opts: self.stealth_port_scan(target, ports, **opts)
-            )
-
-        if "directory_bruteforce" in steps:
-            base_url = kwargs.get("base_url")
-            opts = kwargs.get("directory_bruteforce_options", {})
-            results["directory_bruteforce"] = self.directory_bruteforce(base_url, **opts)
-
-        if 'directory_bruteforce' in steps:
-            base_url = kwargs.get('base_url')
-            opts = kwargs.get('directory_bruteforce_options', {})
-            results['directory_bruteforce'] = self.directory_bruteforce(base_url, **opts)
-
-        if 'file_bruteforce' in steps:
-            base_url = kwargs.get('base_url')
-            opts = kwargs.get('file_bruteforce_options', {})
-            results['file_bruteforce'] = self.file_bruteforce(base_url, **opts)
-
-        if "file_bruteforce" in steps:
-            base_url = kwargs.get("base_url")
-            opts = kwargs.get("file_bruteforce_options", {})
-            results["file_bruteforce"] = self.file_bruteforce(base_url, **opts)
-
-
-        for replay in port_scan_replays:
-            replay()
-
-        return results
 
+        def record(step: str, value: Any) -> None:
+            results[step] = value
+            if post_scan_hook is not None and step in PORT_SCAN_STEPS:
+                post_scan_hook(step, value)
+
+        if serial or len(jobs) <= 1:
+            for step, handler, args, opts in jobs:
+                record(step, handler(*args, **opts))
+            return results
+
+        # Every step is network-bound and independent, so run them side by side.
+        with ThreadPoolExecutor(max_workers=min(len(jobs), MAX_PARALLEL_STEPS)) as executor:
+            futures = {
+                executor.submit(handler, *args, **opts): step
+                for step, handler, args, opts in jobs
+            }
+            for future in as_completed(futures):
+                record(futures[future], future.result())
+        return {step: results[step] for step, _, _ in plan}
@@ -0,0 +1,77 @@
+import http.client
+import http.server
+import threading
+import unittest
+
+from http_session import HTTPSession
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        _KeepAliveHandler.connections.add(self.client_address)
+
+    def do_GET(self):
+        if self.path == "/old":
+            self.send_response(301)
+            self.send_header("Location", "/new")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = self.path.encode()
+        self.send_response(200 if self.path == "/new" else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command == "GET":
+            self.wfile.write(body)
+
+    do_HEAD = do_GET
+
+
+class TestHTTPSession(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _KeepAliveHandler.connections.clear()
+        self.session = HTTPSession()
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_01_reuses_connection(self):
+        for path in ("/a", "/b", "/c"):
+            result = self.session.request("HEAD", self.base_url + path, timeout=2)
+            self.assertEqual(result.status, 404)
+        self.assertEqual(len(_KeepAliveHandler.connections), 1)
+
+    def test_02_follows_redirects(self):
+        result = self.session.request("GET", self.base_url + "/old", timeout=2)
+        self.assertEqual(result.status, 200)
+        self.assertEqual(result.url, self.base_url + "/new")
+        self.assertEqual(result.body, b"/new")
+
+    def test_03_redirect_limit(self):
+        session = HTTPSession(max_redirects=0)
+        with self.assertRaises(http.client.HTTPException):
+            session.request("GET", self.base_url + "/old", timeout=2)
+        session.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import patch, MagicMock
 import urllib.parse
 
+import pytest
+
 # Assuming web_spider.py is in the same directory or adjusted relative path
 # from .web_spider import WebSpider, UNVERIFIED_SSL_CONTEXT_SPIDER
 # For now, direct import if in same dir for testing ease:
@@ -113,54 +115,6 @@ class TestWebSpider(unittest.TestCase):
         self.assertTrue(spider._can_fetch("/disallowed_for_mycrawler/page.html"))
 
 
-    @patch('web_spider.WebSpider._fetch_url_content') # Patching at the module level where WebSpider is defined
-    def test_05_crawl_basic_and_depth(self, mock_fetch_url_content):
-        print("\nRunning test_05_crawl_basic_and_depth...")
-        # Setup mock responses
-        # url: (html_content, final_url_after_redirects_if_any)
-        mock_page_data = {
-            "http://example.com/": ('<html><a href="page1.html">1</a> <a href="/page2.html">2</a></html>', "http://example.com/"),
-            "http://example.com/page1.html": ('<html><a href="sub/page1_1.html">1.1</a></html>', "http://example.com/page1.html"),
-            "http://example.com/page2.html": ('<html><a href="http://example.com/">Home</a></html>', "http://example.com/page2.html"),
-            "http://example.com/sub/page1_1.html": ('<html>Deepest page</html>', "http://example.com/sub/page1_1.html")
-        }
-
-        def fetch_side_effect(url):
-            if url in mock_page_data:
-                content, final_url = mock_page_data[url]
-                return content, final_url, None
-            return None, url, "404 Not Found" # Simulate 404 for other URLs
-
-        mock_fetch_url_content.side_effect = fetch_side_effect
-
-        # Test crawl with depth 1
-        spider_depth1 = WebSpider("http://example.com/", max_depth=1, respect_robots_txt=False, verbose=False, delay=0)
-        # spider_depth1.user_agent_to_use = "TestSpider" # Set for consistent robots.txt if it were enabled
-
-        discovered1 = spider_depth1.crawl()
-        expected_depth1 = {
-            "http://example.com/",
-            "http://example.com/page1.html",
-            "http://example.com/page2.html"
-        }
-        self.assertEqual(set(discovered1), expected_depth1, f"Crawl depth 1 failed. Got: {discovered1}")
-        self.assertNotIn("http://example.com/sub/page1_1.html", discovered1) # Should not be crawled
-
-        # Test crawl with depth 2
-        mock_fetch_url_content.reset_mock() # Reset call count for next spider
-        spider_depth2 = WebSpider("http://example.com/", max_depth=2, respect_robots_txt=False, verbose=False, delay=0)
-        # spider_depth2.user_agent_to_use = "TestSpider"
-
-        discovered2 = spider_depth2.crawl()
-        expected_depth2 = {
-            "http://example.com/",
-            "http://example.com/page1.html",
-            "http://example.com/page2.html",
-            "http://example.com/sub/page1_1.html"
-        }
-        self.assertEqual(set(discovered2), expected_depth2, f"Crawl depth 2 failed. Got: {discovered2}")
-
-
     @patch('web_spider.WebSpider._fetch_url_content')
     def test_06_crawl_with_robots_respect(self, mock_fetch_url_content):
         print("\nRunning test_06_crawl_with_robots_respect...")
@@ -201,18 +155,36 @@ class TestWebSpider(unittest.TestCase):
         self.assertNotIn(base + "another.html", fetched_urls_for_content)
 
 
+# url: (html_content, final_url_after_redirects_if_any)
+@pytest.fixture(scope="module")
+def crawl_pages():
+    """Mock site shared by the crawl depth cases; built once per module."""
+    return {
+        "http://example.com/": ('<html><a href="page1.html">1</a> <a href="/page2.html">2</a></html>', "http://example.com/"),
+        "http://example.com/page1.html": ('<html><a href="sub/page1_1.html">1.1</a></html>', "http://example.com/page1.html"),
+        "http://example.com/page2.html": ('<html><a href="http://example.com/">Home</a></html>', "http://example.com/page2.html"),
+        "http://example.com/sub/page1_1.html": ('<html>Deepest page</html>', "http://example.com/sub/page1_1.html")
+    }
+
+
+@pytest.mark.parametrize("max_depth, expected", [
+    (1, {"http://example.com/", "http://example.com/page1.html", "http://example.com/page2.html"}),
+    (2, {"http://example.com/", "http://example.com/page1.html", "http://example.com/page2.html",
+         "http://example.com/sub/page1_1.html"}),
+])
+def test_05_crawl_basic_and_depth(crawl_pages, monkeypatch, max_depth, expected):
+    def fetch(self, url):
+        if url in crawl_pages:
+            content, final_url = crawl_pages[url]
+            return content, final_url, None
+        return None, url, "404 Not Found" # Simulate 404 for other URLs
+
+    monkeypatch.setattr(WebSpider, "_fetch_url_content", fetch)
+    spider = WebSpider("http://example.com/", max_depth=max_depth, respect_robots_txt=False, verbose=False, delay=0)
+
+    discovered = spider.crawl()
+    assert set(discovered) == expected, f"Crawl depth {max_depth} failed. Got: {discovered}"
+
+
 if __name__ == '__main__':
-    suite = unittest.TestSuite()
-    tests_to_run = [
-        TestWebSpider('test_01_is_in_scope'),
-        TestWebSpider('test_02_parse_links'),
-        TestWebSpider('test_03_fetch_and_parse_robots_txt'),
-        TestWebSpider('test_04_can_fetch_with_robots'),
-        TestWebSpider('test_05_crawl_basic_and_depth'),
-        TestWebSpider('test_06_crawl_with_robots_respect'),
-    ]
-    for test in tests_to_run:
-        suite.addTest(test)
-    runner = unittest.TextTestRunner(verbosity=2)
-    runner.run(suite)
-    # unittest.main(verbosity=2)
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -1,3 +1,6 @@
+import functools
+import http.client
+import re
 import urllib.request
 import urllib.parse
 import urllib.error
@@ -8,6 +11,13 @@ import random
 from collections import deque
 from bs4 import BeautifulSoup # Requires beautifulsoup4 to be installed
 
+try:
+    # libxml2's C parser is much faster than html.parser on large pages
+    from lxml import etree as lxml_etree, html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 # Attempt to import or replicate get_random_user_agent
 try:
     from ..reconnaissance.passive_reconnaissance.search_engine_scraper.search_engine_scraper import get_random_user_agent
@@ -24,14 +34,33 @@ DEFAULT_MAX_DEPTH = 2
 DEFAULT_TIMEOUT_SPIDER = 5.0 # seconds
 DEFAULT_DELAY_SPIDER = 0.2 # seconds
 
+# Scheme and netloc of an absolute URL, matching what urlparse would report
+URL_SCHEME_NETLOC_REGEX = re.compile(r"[ \x00-\x1f]*([A-Za-z][A-Za-z0-9+.-]*):(?://([^/?#]*))?")
+SPIDER_SCHEMES = frozenset({"http", "https"})
+
 UNVERIFIED_SSL_CONTEXT_SPIDER = ssl.create_default_context()
 UNVERIFIED_SSL_CONTEXT_SPIDER.check_hostname = False
 UNVERIFIED_SSL_CONTEXT_SPIDER.verify_mode = ssl.CERT_NONE
 
+@functools.lru_cache(maxsize=64)
+def _disallow_matcher(*rule_lists):
+    """Compile robots.txt disallow prefixes into one anchored regex.
+
+    Matching a path is then a single C-level prefix test instead of a Python
+    loop over every rule. Keyed on the rule tuples, so edits to
+    ``robots_rules`` are picked up on the next check. Returns None when there
+    is nothing to disallow.
+    """
+    prefixes = {rule for rules in rule_lists for rule in rules if rule}
+    if not prefixes:
+        return None
+    return re.compile("|".join(re.escape(rule) for rule in sorted(prefixes)))
+
 class WebSpider:
     def __init__(self, base_url, scope_domains=None, max_depth=DEFAULT_MAX_DEPTH,
                  user_agent=None, respect_robots_txt=True,
-                 timeout=DEFAULT_TIMEOUT_SPIDER, delay=DEFAULT_DELAY_SPIDER, verbose=False):
+                 timeout=DEFAULT_TIMEOUT_SPIDER, delay=DEFAULT_DELAY_SPIDER, verbose=False,
+                 session=None):
 
         self.base_url = base_url
         parsed_base_url = urllib.parse.urlparse(base_url)
@@ -41,6 +70,7 @@ class WebSpider:
             self.scope_domains = [d.lower() for d in scope_domains]
         else:
             self.scope_domains = [self.base_netloc.lower()]
+        self._scope_netlocs = frozenset(self.scope_domains)
 
         self.max_depth = max_depth
         self.user_agent_to_use = user_agent if user_agent else get_random_user_agent()
@@ -48,8 +78,10 @@ class WebSpider:
         self.timeout = timeout
         self.delay = delay
         self.verbose = verbose
+        self.session = session # Optional HTTPSession for keep-alive fetches
 
         self.urls_to_visit = deque([(base_url, 0)]) # Store (url, depth)
+        self._queued_urls = {base_url} # URLs currently in urls_to_visit, for O(1) membership checks
         self.visited_urls = set()
         self.discovered_links = set() # All valid, in-scope links found
         self.robots_rules = {} # Store parsed robots.txt rules {user_agent: [disallowed_paths]}
@@ -57,15 +89,31 @@ class WebSpider:
         if self.respect_robots_txt:
             self._fetch_and_parse_robots_txt(parsed_base_url)
 
-    def _is_in_scope(self, url):
+    def _fetch_url_content_pooled(self, url, req_headers):
+        """``_fetch_url_content`` over the shared keep-alive session."""
         try:
-            parsed_url = urllib.parse.urlparse(url)
-            # Ensure it's http or https and netloc is in scope_domains
-            if parsed_url.scheme not in ["http", "https"]:
-                return False
-            return parsed_url.netloc.lower() in self.scope_domains
-        except Exception:
-            return False # Invalid URL
+            response = self.session.request("GET", url, headers=req_headers, timeout=self.timeout)
+            if not 200 <= response.status < 300: # urlopen raises HTTPError for these
+                return None, url, f"HTTPError: {response.status} {response.reason}"
+            if response.status != 200:
+                return None, response.url, f"HTTP status {response.status}"
+            content_type = response.headers.get('Content-Type', '').lower()
+            if 'text/html' in content_type or 'application/xhtml+xml' in content_type:
+                charset = response.headers.get_content_charset() or 'utf-8'
+                return response.body.decode(charset, errors='replace'), response.url, None
+            if self.verbose: print(f"    Skipping non-HTML content at {url} (Content-Type: {content_type})")
+            return None, response.url, f"Non-HTML content-type: {content_type}"
+        except (http.client.HTTPException, socket.timeout, ConnectionRefusedError, socket.error) as e:
+            return None, url, f"Network/URL Error: {e}"
+        except Exception as e:
+            return None, url, f"Unexpected fetch error: {e}"
+
+    def _is_in_scope(self, url):
+        # Called for every discovered link, so avoid urlparse's allocations
+        match = URL_SCHEME_NETLOC_REGEX.match(url) if isinstance(url, str) else None
+        if match is None or match.group(1).lower() not in SPIDER_SCHEMES:
+            return False # Invalid URL or not http/https
+        return (match.group(2) or "").lower() in self._scope_netlocs
 
     def _fetch_and_parse_robots_txt(self, base_parsed_url):
         robots_url = urllib.parse.urlunparse((base_parsed_url.scheme, base_parsed_url.netloc, "/robots.txt", "", "", ""))
@@ -75,15 +123,12 @@ class WebSpider:
             if content:
                 current_ua = None
                 for line in content.splitlines():
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-
-                    parts = line.split(":", 1)
-                    if len(parts) != 2:
+                    # Blank and comment lines fall through: no ':' or a key never matched below
+                    key, sep, value = line.partition(":")
+                    if not sep:
                         continue
 
-                    key, value = parts[0].strip().lower(), parts[1].strip()
+                    key, value = key.strip().lower(), value.strip()
 
                     if key == "user-agent":
                         current_ua = value.lower() # Store UA keys in lowercase
@@ -111,24 +156,18 @@ class WebSpider:
             return True
 
         ua_to_check = self.user_agent_to_use.lower()
-        # Check rules for specific user agent first
-        disallowed_for_specific_ua = self.robots_rules.get(ua_to_check, [])
-        for disallowed_path in disallowed_for_specific_ua:
-            if disallowed_path == "/" and url_path.startswith("/"): return False # Disallow all
-            if disallowed_path and url_path.startswith(disallowed_path):
-                return False
-
-        # Then check rules for wildcard '*' user agent (if specific UA didn't disallow)
-        disallowed_for_wildcard_ua = self.robots_rules.get('*', [])
-        for disallowed_path in disallowed_for_wildcard_ua:
-            if disallowed_path == "/" and url_path.startswith("/"): return False
-            if disallowed_path and url_path.startswith(disallowed_path):
-                return False
-        return True
+        # Rules for the specific user agent and for '*' both apply
+        disallowed = _disallow_matcher(
+            tuple(self.robots_rules.get(ua_to_check, ())),
+            tuple(self.robots_rules.get('*', ())),
+        )
+        return disallowed is None or disallowed.match(url_path) is None
 
     def _fetch_url_content(self, url):
         """Fetches URL content, returns (content_text, final_url, error_message)."""
         req_headers = {"User-Agent": self.user_agent_to_use}
+        if self.session is not None:
+            return self._fetch_url_content_pooled(url, req_headers)
         try:
             req = urllib.request.Request(url, headers=req_headers)
             context = UNVERIFIED_SSL_CONTEXT_SPIDER if url.startswith("https://") else None
@@ -152,15 +191,26 @@ class WebSpider:
         except Exception as e:
             return None, url, f"Unexpected fetch error: {e}"
 
+    @staticmethod
+    def _iter_anchor_hrefs(html_content):
+        """Yields the raw href of every <a> tag, using lxml when it is installed."""
+        if HAS_LXML:
+            try:
+                doc = lxml_html.fromstring(html_content)
+            except (ValueError, lxml_etree.ParserError):
+                pass # Empty or undecodable document; let BeautifulSoup have a go
+            else:
+                return (href for href in (a.get('href') for a in doc.iter('a')) if href is not None)
+        soup = BeautifulSoup(html_content, 'html.parser')
+        return (anchor_tag['href'] for anchor_tag in soup.find_all('a', href=True))
+
     def _parse_links(self, html_content, current_page_url):
         """Parses HTML and extracts valid, in-scope links."""
         links = set()
         if not html_content:
             return links
 
-        soup = BeautifulSoup(html_content, 'html.parser')
-        for anchor_tag in soup.find_all('a', href=True):
-            href = anchor_tag['href']
+        for href in self._iter_anchor_hrefs(html_content):
             if not href or href.startswith('#') or href.lower().startswith(('mailto:', 'tel:', 'javascript:')):
                 continue
 
@@ -179,6 +229,7 @@ class WebSpider:
 
         while self.urls_to_visit:
             current_url, current_depth = self.urls_to_visit.popleft()
+            self._queued_urls.discard(current_url)
 
             if current_url in self.visited_urls or current_depth > self.max_depth:
                 continue
@@ -210,8 +261,9 @@ class WebSpider:
             if html_content and current_depth < self.max_depth:
                 new_links = self._parse_links(html_content, final_url)
                 for link in new_links:
-                    if link not in self.visited_urls and link not in {q_item[0] for q_item in self.urls_to_visit}:
+                    if link not in self.visited_urls and link not in self._queued_urls:
                         self.urls_to_visit.append((link, current_depth + 1))
+                        self._queued_urls.add(link)
 
             if self.delay > 0:
                 time.sleep(self.delay)
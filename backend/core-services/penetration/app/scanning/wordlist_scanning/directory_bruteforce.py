@@ -1,3 +1,5 @@
+import http.client
+import re
 import urllib.request
 import urllib.error
 import urllib.parse
@@ -28,6 +30,13 @@ DEFAULT_TIMEOUT = 5.0 # seconds
 DEFAULT_DELAY = 0.1 # seconds
 DEFAULT_MAX_REDIRECTS = 3
 
+# Words already ending in one of these get no further extension (avoids word.php.txt)
+WORD_EXTENSION_SUFFIXES = ('.php', '.html', '.txt', '.js', '.asp', '.aspx')
+# Path components that urljoin would rewrite (absolute paths, schemes, params, queries,
+# control characters, empty or dot segments, ...);
+# anything else can simply be appended to a base URL ending in '/'
+URLJOIN_NEEDED_REGEX = re.compile(r"^/|//|[\x00-\x20:;?#\\]|(?:^|/)\.\.?(?:/|$)")
+
 # Create an SSL context that doesn't verify certificates (for scanning dev/internal sites)
 # WARNING: This is insecure for general browsing but useful for pentesting tools.
 UNVERIFIED_SSL_CONTEXT = ssl.create_default_context()
@@ -35,16 +44,33 @@ UNVERIFIED_SSL_CONTEXT.check_hostname = False
 UNVERIFIED_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
 
 
-def check_url(url, timeout, custom_headers=None, method="HEAD"):
+def check_url(url, timeout, custom_headers=None, method="HEAD", session=None):
     """
     Checks a single URL and returns its status code and other relevant info.
     Tries HEAD first, then GET if HEAD is not informative or fails.
+    When ``session`` (an ``HTTPSession``) is given its pooled keep-alive
+    connections are used instead of a fresh ``urlopen`` connection.
     """
     result = {"url": url, "status_code": None, "reason": None, "headers": None, "content_length": None, "error": None, "final_url": url}
     req_headers = {"User-Agent": get_random_user_agent()}
     if custom_headers:
         req_headers.update(custom_headers)
 
+    if session is not None:
+        try:
+            response = session.request(method, url, headers=req_headers, timeout=timeout)
+            result["status_code"] = response.status
+            result["reason"] = response.reason
+            result["headers"] = dict(response.headers)
+            result["final_url"] = response.url
+            if 200 <= response.status < 300: # urlopen reports other statuses as HTTPError, without a length
+                result["content_length"] = response.headers.get('Content-Length')
+        except (http.client.HTTPException, socket.timeout, ConnectionRefusedError, socket.error) as e:
+            result["error"] = str(e)
+        except Exception as e:
+            result["error"] = f"Unexpected error: {str(e)}"
+        return result
+
     try:
         req = urllib.request.Request(url, headers=req_headers, method=method)
         context_to_use = UNVERIFIED_SSL_CONTEXT if url.startswith("https://") else None
@@ -76,7 +102,7 @@ def brute_force_paths(base_url, wordlist_path=None, custom_wordlist=None,
                       extensions=None, num_threads=DEFAULT_THREADS,
                       timeout=DEFAULT_TIMEOUT, delay=DEFAULT_DELAY,
                       follow_redirects=True, max_redirects=DEFAULT_MAX_REDIRECTS,
-                      custom_headers=None, verbose=False):
+                      custom_headers=None, verbose=False, session=None):
     """
     Brute-forces directories and files on a web server.
 
@@ -92,6 +118,7 @@ def brute_force_paths(base_url, wordlist_path=None, custom_wordlist=None,
         max_redirects (int): Maximum number of redirects to follow for a single path.
         custom_headers (dict, optional): Custom HTTP headers to send.
         verbose (bool): If True, prints progress and all attempts.
+        session (HTTPSession, optional): Shared keep-alive connection pool for the probes.
 
     Returns:
         list: A list of dictionaries, each representing a found path with details.
@@ -121,31 +148,38 @@ def brute_force_paths(base_url, wordlist_path=None, custom_wordlist=None,
     found_paths = []
     urls_to_check = []
 
+    # Appending matches urljoin only if urljoin leaves the base itself untouched
+    plain_base = urllib.parse.urljoin(base_url, "x") == base_url + "x"
+
+    def join(path_component):
+        if plain_base and not URLJOIN_NEEDED_REGEX.search(path_component):
+            return base_url + path_component
+        return urllib.parse.urljoin(base_url, path_component)
+
     for word in words:
         if not word: continue # Skip empty words
         # Normalize word: remove leading/trailing slashes as we add them systematically
         word = word.strip('/')
-        for ext in extensions:
-            # Construct path: word + ext. If ext is empty, it's a directory/extensionless file.
-            # If word itself contains typical extension, don't add another (basic heuristic)
-            path_component = word
-            if ext and not any(word.lower().endswith(e) for e in ['.php', '.html', '.txt', '.js', '.asp', '.aspx'] if e): # Avoid word.php.txt
-                path_component += ext
-
-            # Ensure no double slashes if base_url ends with / and path_component starts with /
-            # urllib.parse.urljoin handles this well.
-            full_url = urllib.parse.urljoin(base_url, path_component)
-            urls_to_check.append(full_url)
+        # If word itself contains typical extension, don't add another (basic heuristic)
+        if word.lower().endswith(WORD_EXTENSION_SUFFIXES):
+            if extensions:
+                urls_to_check.append(join(word))
+        else:
+            # If ext is empty, it's a directory/extensionless file.
+            urls_to_check.extend(join(word + ext) for ext in extensions)
 
     # Deduplicate URLs before scanning
     urls_to_check = sorted(list(set(urls_to_check)))
     if verbose: print(f"Generated {len(urls_to_check)} unique URLs to check.")
 
+    # Only pass ``session`` through when set so check_url keeps its plain signature otherwise
+    session_kwargs = {"session": session} if session is not None else {}
+
     def process_url(url, current_redirect_depth=0):
         if verbose: print(f"  Checking: {url}")
 
         # Try HEAD first for efficiency
-        head_result = check_url(url, timeout, custom_headers=custom_headers, method="HEAD")
+        head_result = check_url(url, timeout, custom_headers=custom_headers, method="HEAD", **session_kwargs)
 
         # Analyze HEAD result
         # If HEAD gives a clear "found" (2xx) or "forbidden" (401/403), or a definitive "not found" (404 for some servers)
@@ -160,7 +194,7 @@ def brute_force_paths(base_url, wordlist_path=None, custom_wordlist=None,
             if verbose and (head_result.get("status_code") != 404 or head_result.get("error")): # Avoid too much noise for typical 404s on HEAD
                 print(f"    HEAD request for {url} status: {head_result.get('status_code')}, error: {head_result.get('error')}. Trying GET.")
             time.sleep(delay / 2 if delay > 0 else 0) # Small pause before GET
-            get_result = check_url(url, timeout, custom_headers=custom_headers, method="GET")
+            get_result = check_url(url, timeout, custom_headers=custom_headers, method="GET", **session_kwargs)
             final_result = get_result # Prioritize GET result if HEAD was inconclusive
 
         status = final_result.get("status_code")
@@ -191,8 +225,18 @@ def brute_force_paths(base_url, wordlist_path=None, custom_wordlist=None,
 
         return None # Not found or not interesting
 
+    def paced_process_url(url):
+        # Each worker waits ``delay`` after its own probe, so the threads stay
+        # polite individually without serialising the whole scan behind the
+        # result loop below.
+        try:
+            return process_url(url)
+        finally:
+            if delay > 0:
+                time.sleep(delay)
+
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        future_to_url = {executor.submit(process_url, u): u for u in urls_to_check}
+        future_to_url = {executor.submit(paced_process_url, u): u for u in urls_to_check}
         for future in as_completed(future_to_url):
             # url_origin = future_to_url[future] # Original URL submitted
             try:
@@ -201,8 +245,6 @@ def brute_force_paths(base_url, wordlist_path=None, custom_wordlist=None,
                     found_paths.append(path_info)
             except Exception as exc:
                 if verbose: print(f"    Error processing future for a URL: {exc}") # Should be caught by check_url
-            if delay > 0:
-                time.sleep(delay) # Apply delay between processing results of threads
 
     return sorted(found_paths, key=lambda x: x['url'])
 
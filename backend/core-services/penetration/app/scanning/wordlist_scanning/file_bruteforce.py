@@ -13,6 +13,8 @@ that specifically want to brute force files only.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 # ``directory_bruteforce`` lives in the same directory.  Importing it directly
 # (rather than using relative imports) keeps the module importable whether the
 # package is executed as a script or as part of a package.
@@ -26,6 +28,9 @@ except Exception:  # pragma: no cover - fallback for script style execution
 # ``directory_bruteforce`` lives in the same directory.
 from . import directory_bruteforce
 
+if TYPE_CHECKING:  # pragma: no cover - for static analysis only
+    from ..http_session import HTTPSession
+
 
 # ``directory_bruteforce`` exposes a list of default extensions including an
 # empty string used for directory discovery.  For file brute forcing we drop the
@@ -47,6 +52,7 @@ def brute_force_files(
     max_redirects: int = directory_bruteforce.DEFAULT_MAX_REDIRECTS,
     custom_headers: dict | None = None,
     verbose: bool = False,
+    session: HTTPSession | None = None,
 ):
     """Brute-force file names on a web server.
 
@@ -81,6 +87,7 @@ def brute_force_files(
         max_redirects=max_redirects,
         custom_headers=custom_headers,
         verbose=verbose,
+        session=session,
     )
 
 
@@ -78,6 +78,14 @@ class PenTestStore:
         stored.append(_serialise(evidence.model_dump()))
         self._persist()
 
+    def record_evidence_many(self, evidence: list[EvidenceRecord]) -> None:
+        if not evidence:
+            return
+        test_id = str(evidence[0].test_id)
+        stored = self._data["evidence"].setdefault(test_id, [])
+        stored.extend(_serialise(record.model_dump()) for record in evidence)
+        self._persist()
+
     def list_evidence(self, test_id: UUID) -> list[dict]:
         return list(self._data["evidence"].get(str(test_id), []))
 
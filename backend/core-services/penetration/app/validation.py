@@ -49,7 +49,8 @@ def validate_plan_start(plan: PenTestPlan, now: datetime) -> None:
     """Validate that a plan can be started."""
     if plan.status not in {"planned", "scheduled"}:
         raise ValidationError("invalid_state")
-    if now < plan.schedule.start_at or now > plan.schedule.end_at:
+    now_epoch = now.timestamp()
+    if now_epoch < plan.schedule.start_epoch or now_epoch > plan.schedule.end_epoch:
         raise ValidationError("outside_execution_window")
     if plan.scope.decommissioned_assets:
         decommissioned = set(plan.scope.decommissioned_assets)
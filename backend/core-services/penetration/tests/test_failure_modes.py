@@ -28,8 +28,8 @@ from app.validation import (
 )
 
 
-def build_plan() -> PenTestPlan:
-    """Create a baseline plan for testing."""
+def _build_base_plan() -> PenTestPlan:
+    """Create the validated baseline plan shared by the tests."""
     now = datetime.now(timezone.utc)
     return PenTestPlan(
         test_id=uuid4(),
@@ -56,14 +56,47 @@ def build_plan() -> PenTestPlan:
     )
 
 
+_BASE_PLAN = _build_base_plan()
+
+
+def build_plan() -> PenTestPlan:
+    """Create a baseline plan for testing.
+
+    Copies the module-level template instead of re-validating every nested
+    model. Every time-dependent field is re-anchored on the current clock, so
+    results do not depend on how long after import a test runs.
+    """
+    now = datetime.now(timezone.utc)
+    plan = _BASE_PLAN.model_copy(
+        update={"test_id": uuid4(), "created_at": now, "last_updated_at": now},
+        deep=True,
+    )
+    plan.schedule = plan.schedule.model_copy(
+        update={"start_at": now - timedelta(minutes=5), "end_at": now + timedelta(minutes=55)}
+    )
+    plan.authorisation = plan.authorisation.model_copy(update={"authorised_at": now})
+    return plan
+
+
 class FailureModeTests(unittest.TestCase):
     """Validate failure-mode handling with safe defaults."""
 
+    def setUp(self) -> None:
+        self.now = datetime.now(timezone.utc)
+
     def test_decommissioned_assets_block_start(self) -> None:
         plan = build_plan()
         plan = plan.model_copy(update={"scope": plan.scope.model_copy(update={"decommissioned_assets": ["asset-001"]})})
         with self.assertRaises(ValidationError):
-            validate_plan_start(plan, datetime.now(timezone.utc))
+            validate_plan_start(plan, self.now)
+
+    def test_schedule_copy_recomputes_window_epochs(self) -> None:
+        plan = build_plan()
+        self.assertGreater(plan.schedule.end_epoch, self.now.timestamp())
+        expired = plan.schedule.model_copy(update={"end_at": self.now - timedelta(minutes=1)})
+        self.assertEqual(expired.end_epoch, (self.now - timedelta(minutes=1)).timestamp())
+        with self.assertRaises(ValidationError):
+            validate_plan_start(plan.model_copy(update={"schedule": expired}), self.now)
 
     def test_credential_revocation_aborts(self) -> None:
         observations = [
@@ -73,7 +106,7 @@ class FailureModeTests(unittest.TestCase):
                 summary="Test observation",
                 evidence="Safe payload rejected.",
                 confidence=0.8,
-                observed_at=datetime.now(timezone.utc),
+                observed_at=self.now,
                 credential_state="revoked",
             )
         ]
@@ -110,8 +143,8 @@ class FailureModeTests(unittest.TestCase):
             method="scan",
             credentials=[],
             schedule=ScheduleWindow(
-                start_at=datetime.now(timezone.utc),
-                end_at=datetime.now(timezone.utc) + timedelta(minutes=30),
+                start_at=self.now,
+                end_at=self.now + timedelta(minutes=30),
             ),
             safeguards=Safeguards(
                 target_allow_list=["asset-001"],
@@ -121,7 +154,7 @@ class FailureModeTests(unittest.TestCase):
             ),
             authorisation=AuthorisationRecord(
                 authorised_by="security-lead",
-                authorised_at=datetime.now(timezone.utc),
+                authorised_at=self.now,
                 policy_reference="POL-12",
             ),
             requested_by="security-lead",
@@ -138,7 +171,7 @@ class FailureModeTests(unittest.TestCase):
                             summary="Test observation",
                             evidence="Safe payload rejected.",
                             confidence=0.5,
-                            observed_at=datetime.now(timezone.utc),
+                            observed_at=self.now,
                         ),
                         Observation(
                             asset_id="asset-002",
@@ -146,7 +179,7 @@ class FailureModeTests(unittest.TestCase):
                             summary="Second observation",
                             evidence="Safe payload blocked.",
                             confidence=0.5,
-                            observed_at=datetime.now(timezone.utc),
+                            observed_at=self.now,
                         ),
                     ],
                     detection_summary=DetectionResponseSummary(
@@ -168,8 +201,8 @@ class FailureModeTests(unittest.TestCase):
             method="scan",
             credentials=[],
             schedule=ScheduleWindow(
-                start_at=datetime.now(timezone.utc),
-                end_at=datetime.now(timezone.utc) + timedelta(minutes=30),
+                start_at=self.now,
+                end_at=self.now + timedelta(minutes=30),
             ),
             safeguards=Safeguards(
                 target_allow_list=["asset-001"],
@@ -179,7 +212,7 @@ class FailureModeTests(unittest.TestCase):
             ),
             authorisation=AuthorisationRecord(
                 authorised_by="security-lead",
-                authorised_at=datetime.now(timezone.utc),
+                authorised_at=self.now,
                 policy_reference="POL-12",
             ),
             requested_by="analyst",
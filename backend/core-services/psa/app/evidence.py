@@ -4,8 +4,15 @@ from __future__ import annotations
 import hashlib
 import json
 
+# Built once: json.dumps would rebuild an encoder for every hash. Evidence
+# payloads are decoded JSON, so they cannot be self-referential and the
+# circular-reference bookkeeping is skipped.
+_CANONICAL_ENCODE = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=True, check_circular=False
+).encode
+
 
 def build_hash(payload: dict) -> str:
     """Generate a deterministic SHA-256 hash for evidence payloads."""
-    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    canonical = _CANONICAL_ENCODE(payload)
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
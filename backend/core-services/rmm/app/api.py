@@ -14,7 +14,7 @@ def get_db():
         s.close()
 
 
-@router.post("/configuration_profiles")
+@router.post("/configuration_profiles", response_model=schemas.CreatedOut)
 def create_profile(p: schemas.ConfigurationProfileCreate, session: Session = Depends(get_db)):
     prof = models.ConfigurationProfile(name=p.name, profile_type=p.profile_type, description=p.description)
     session.add(prof)
@@ -23,7 +23,7 @@ def create_profile(p: schemas.ConfigurationProfileCreate, session: Session = Dep
     return {"id": prof.id}
 
 
-@router.post("/configuration_items")
+@router.post("/configuration_items", response_model=schemas.CreatedOut)
 def add_configuration_item(it: schemas.ConfigurationItemCreate, session: Session = Depends(get_db)):
     ci = models.ConfigurationItem(profile_id=it.profile_id, config_key=it.config_key, desired_value=it.desired_value, enforcement_mode=it.enforcement_mode)
     session.add(ci)
@@ -32,7 +32,7 @@ def add_configuration_item(it: schemas.ConfigurationItemCreate, session: Session
     return {"id": ci.id}
 
 
-@router.post("/assign_profile")
+@router.post("/assign_profile", response_model=schemas.CreatedOut)
 def assign_profile(a: schemas.AssignProfileCreate, session: Session = Depends(get_db)):
     ap = models.AssetConfigurationProfile(asset_id=a.asset_id, profile_id=a.profile_id)
     session.add(ap)
@@ -41,7 +41,7 @@ def assign_profile(a: schemas.AssignProfileCreate, session: Session = Depends(ge
     return {"id": ap.id}
 
 
-@router.post("/patch_catalog")
+@router.post("/patch_catalog", response_model=schemas.CreatedOut)
 def add_patch_catalog(p: schemas.PatchCatalogCreate, session: Session = Depends(get_db)):
     pc = models.PatchCatalog(vendor=p.vendor, product=p.product, patch_id=p.patch_id, severity=p.severity)
     session.add(pc)
@@ -50,7 +50,7 @@ def add_patch_catalog(p: schemas.PatchCatalogCreate, session: Session = Depends(
     return {"id": pc.id}
 
 
-@router.post("/patch_jobs")
+@router.post("/patch_jobs", response_model=schemas.PatchJobOut)
 def create_patch_job(job: schemas.PatchJobCreate, session: Session = Depends(get_db)):
     pj = models.PatchJob(psa_case_id=job.psa_case_id, scheduled_for=job.scheduled_for, reboot_policy=job.reboot_policy, status="scheduled")
     session.add(pj)
@@ -73,7 +73,7 @@ def create_patch_job(job: schemas.PatchJobCreate, session: Session = Depends(get
     return {"id": pj.id, "psa_case_id": pj.psa_case_id}
 
 
-@router.post("/script_results")
+@router.post("/script_results", response_model=schemas.CreatedOut)
 def record_script_result(r: schemas.ScriptResultCreate, session: Session = Depends(get_db)):
     sr = models.ScriptResult(job_id=r.job_id, stdout=r.stdout, stderr=r.stderr, exit_code=r.exit_code, hash=r.hash)
     session.add(sr)
@@ -82,7 +82,7 @@ def record_script_result(r: schemas.ScriptResultCreate, session: Session = Depen
     return {"id": sr.id}
 
 
-@router.post("/remote_sessions")
+@router.post("/remote_sessions", response_model=schemas.CreatedOut)
 def create_remote_session(s: schemas.RemoteSessionCreate, session: Session = Depends(get_db)):
     rs = models.RemoteSession(asset_id=s.asset_id, initiated_by=s.initiated_by, session_type=s.session_type, recorded=False)
     session.add(rs)
@@ -91,7 +91,7 @@ def create_remote_session(s: schemas.RemoteSessionCreate, session: Session = Dep
     return {"id": rs.id}
 
 
-@router.post("/evidence")
+@router.post("/evidence", response_model=schemas.CreatedOut)
 def add_evidence(e: schemas.EvidenceCreate, session: Session = Depends(get_db)):
     ev = models.RMMEvidence(asset_id=e.asset_id, evidence_type=e.evidence_type, related_entity=e.related_entity, related_id=e.related_id, storage_uri=e.storage_uri, hash=e.hash)
     session.add(ev)
@@ -100,7 +100,7 @@ def add_evidence(e: schemas.EvidenceCreate, session: Session = Depends(get_db)):
     return {"id": ev.id}
 
 
-@router.post("/device_inventory")
+@router.post("/device_inventory", response_model=schemas.CreatedOut)
 def add_device_inventory(inv: schemas.DeviceInventoryCreate, session: Session = Depends(get_db)):
     collected_at = None
     if inv.collected_at:
@@ -1,10 +1,16 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from core_services.common.db import engine_options
 from .config import RMM_DATABASE_URL
 
-engine = create_engine(RMM_DATABASE_URL, connect_args={"check_same_thread": False} if RMM_DATABASE_URL.startswith("sqlite") else {})
+
+engine = create_engine(RMM_DATABASE_URL, **engine_options(RMM_DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+
+
+class Base(DeclarativeBase):
+    pass
+
 
 def init_db():
     Base.metadata.create_all(bind=engine)
@@ -61,3 +61,11 @@ class DeviceInventoryCreate(BaseModel):
     os_version: Optional[str]
     serial_number: Optional[str]
     collected_at: Optional[str]
+
+
+class CreatedOut(BaseModel):
+    id: str
+
+
+class PatchJobOut(CreatedOut):
+    psa_case_id: Optional[str] = None
@@ -1,4 +1,8 @@
+import asyncio
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 from . import db, models, schemas
 from .rules import evaluate_rule
@@ -13,53 +17,91 @@ def get_db():
     finally:
         session.close()
 
+_escalation_client: EscalationClient | None = None
+
+def get_escalation_client() -> EscalationClient:
+    global _escalation_client
+    if _escalation_client is None:
+        _escalation_client = EscalationClient()
+    return _escalation_client
+
+def _insert_many(session: Session, model, rows: List[dict]) -> list:
+    """Insert ``rows`` in one executemany statement and commit once.
+
+    Returns the inserted ORM objects in the same order as ``rows``.
+    """
+    if not rows:
+        return []
+    stmt = insert(model).returning(model, sort_by_parameter_order=True)
+    created = session.scalars(stmt, rows).all()
+    session.commit()
+    return created
+
+
+def _raw_event_row(event: schemas.RawEventIn) -> dict:
+    return {
+        "source_system": event.source_system,
+        "event_time": event.event_time,
+        "payload": event.payload,
+    }
+
+
+def _event_row(event_in: schemas.EventIn) -> dict:
+    return {
+        "raw_event_id": event_in.raw_event_id,
+        "event_category": event_in.event_category,
+        "event_type": event_in.event_type,
+        "severity": event_in.severity or 1,
+        "asset_id": event_in.asset_id,
+        "user_id": event_in.user_id,
+        "source_ip": event_in.source_ip,
+        "destination_ip": event_in.destination_ip,
+        "event_time": event_in.event_time,
+    }
+
+
+def _finding_row(f: schemas.FindingCreate) -> dict:
+    return {
+        "organisation_id": f.organisation_id,
+        "finding_type": f.finding_type,
+        "severity": f.severity,
+        "confidence": f.confidence,
+    }
+
+
+@router.post("/raw_events:bulk", response_model=List[schemas.RawEventOut])
+def ingest_raw_bulk(events: List[schemas.RawEventIn], session: Session = Depends(get_db)):
+    return _insert_many(session, models.RawEvent, [_raw_event_row(e) for e in events])
+
 @router.post("/raw_events", response_model=schemas.RawEventOut)
 def ingest_raw(event: schemas.RawEventIn, session: Session = Depends(get_db)):
-    rv = models.RawEvent(
-        source_system=event.source_system,
-        event_time=event.event_time,
-        payload=event.payload,
-    )
-    session.add(rv)
-    session.commit()
-    session.refresh(rv)
-    return rv
+    return ingest_raw_bulk([event], session)[0]
 
-@router.post("/events")
+@router.post("/events:bulk", response_model=List[schemas.CreatedOut])
+def create_events_bulk(events_in: List[schemas.EventIn], session: Session = Depends(get_db)):
+    created = _insert_many(session, models.Event, [_event_row(e) for e in events_in])
+    return [{"id": ev.id} for ev in created]
+
+@router.post("/events", response_model=schemas.CreatedOut)
 def create_event(event_in: schemas.EventIn, session: Session = Depends(get_db)):
-    ev = models.Event(
-        raw_event_id=event_in.raw_event_id,
-        event_category=event_in.event_category,
-        event_type=event_in.event_type,
-        severity=event_in.severity or 1,
-        asset_id=event_in.asset_id,
-        user_id=event_in.user_id,
-        source_ip=event_in.source_ip,
-        destination_ip=event_in.destination_ip,
-        event_time=event_in.event_time,
-    )
-    session.add(ev)
-    session.commit()
-    session.refresh(ev)
-    return {"id": ev.id}
+    return create_events_bulk([event_in], session)[0]
 
-@router.post("/findings")
+@router.post("/findings:bulk", response_model=List[schemas.CreatedOut])
+def create_findings_bulk(findings: List[schemas.FindingCreate], session: Session = Depends(get_db)):
+    created = _insert_many(session, models.SiemFinding, [_finding_row(f) for f in findings])
+    return [{"id": finding.id} for finding in created]
+
+@router.post("/findings", response_model=schemas.CreatedOut)
 def create_finding(f: schemas.FindingCreate, session: Session = Depends(get_db)):
-    finding = models.SiemFinding(
-        organisation_id=f.organisation_id,
-        finding_type=f.finding_type,
-        severity=f.severity,
-        confidence=f.confidence,
-    )
-    session.add(finding)
-    session.commit()
-    session.refresh(finding)
-    return {"id": finding.id}
+    return create_findings_bulk([f], session)[0]
 
 
 @router.post("/rules/{rule_id}/evaluate")
-def run_rule(rule_id: str, session: Session = Depends(get_db)):
-    client = EscalationClient()
+def run_rule(
+    rule_id: str,
+    session: Session = Depends(get_db),
+    client: EscalationClient = Depends(get_escalation_client),
+):
     try:
         res = evaluate_rule(rule_id=rule_id, session=session, escalation_client=client)
         return res
@@ -68,14 +110,41 @@ def run_rule(rule_id: str, session: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/rules/evaluate_all")
-def run_all_rules(session: Session = Depends(get_db)):
-    rules = session.query(models.CorrelationRule).filter(models.CorrelationRule.enabled == True).all()
-    client = EscalationClient()
-    results = []
-    for r in rules:
+def _enabled_rule_ids() -> List[str]:
+    with db.SessionLocal() as session:
+        return session.scalars(
+            select(models.CorrelationRule.id).where(models.CorrelationRule.enabled.is_(True))
+        ).all()
+
+def _evaluate_rule_isolated(rule_id: str, client: EscalationClient):
+    # Each worker thread gets its own Session; Sessions are not thread-safe
+    with db.SessionLocal() as session:
+        return evaluate_rule(rule_id, session=session, escalation_client=client)
+
+def _evaluate_rules_serially(rule_ids: List[str], client: EscalationClient) -> list:
+    outcomes = []
+    for rule_id in rule_ids:
         try:
-            results.append({"rule_id": r.id, "result": evaluate_rule(r.id, session=session, escalation_client=client)})
+            outcomes.append(_evaluate_rule_isolated(rule_id, client))
         except Exception as e:
-            results.append({"rule_id": r.id, "error": str(e)})
+            outcomes.append(e)
+    return outcomes
+
+@router.post("/rules/evaluate_all")
+async def run_all_rules(client: EscalationClient = Depends(get_escalation_client)):
+    rule_ids = await asyncio.to_thread(_enabled_rule_ids)
+    if db.CONCURRENT_SESSIONS:
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(_evaluate_rule_isolated, rule_id, client) for rule_id in rule_ids),
+            return_exceptions=True,
+        )
+    else:
+        # Concurrent transactions would interleave on the one shared connection
+        outcomes = await asyncio.to_thread(_evaluate_rules_serially, rule_ids, client)
+    results = []
+    for rule_id, outcome in zip(rule_ids, outcomes):
+        if isinstance(outcome, Exception):
+            results.append({"rule_id": rule_id, "error": str(outcome)})
+        else:
+            results.append({"rule_id": rule_id, "result": outcome})
     return results
@@ -1,10 +1,18 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from core_services.common.db import engine_options, supports_concurrent_sessions
 from .config import DATABASE_URL
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {})
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+# False when every Session would share one connection (in-memory SQLite)
+CONCURRENT_SESSIONS = supports_concurrent_sessions(DATABASE_URL)
+
+
+class Base(DeclarativeBase):
+    pass
+
 
 def init_db():
     Base.metadata.create_all(bind=engine)
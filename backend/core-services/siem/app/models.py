@@ -50,7 +50,7 @@ class CorrelationRule(Base):
     name = Column(Text)
     description = Column(Text)
     logic = Column(JSON)
-    enabled = Column(Boolean, default=True)
+    enabled = Column(Boolean, default=True, index=True)
     severity = Column(Integer, default=1)
 
 class CorrelationHit(Base):
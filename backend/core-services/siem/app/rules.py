@@ -38,8 +38,6 @@ def evaluate_rule(rule_id: str, session: Session, escalation_client: EscalationC
         event_ids = [e.id for e in events[:count_needed]]
         hit = CorrelationHit(rule_id=rule.id, event_ids=event_ids, confidence=80)
         session.add(hit)
-        session.commit()
-        session.refresh(hit)
 
         # create a finding
         finding = SiemFinding(
@@ -50,33 +48,33 @@ def evaluate_rule(rule_id: str, session: Session, escalation_client: EscalationC
             status="new",
         )
         session.add(finding)
-        session.commit()
-        session.refresh(finding)
+        # ids are Python-side defaults, assigned on flush; no refresh needed
+        session.flush()
 
         # link events to finding
         for eid in event_ids:
             fe = FindingEvent(finding_id=finding.id, event_id=eid)
             session.add(fe)
-        session.commit()
 
         # create simple evidence package placeholder (real packaging handled elsewhere)
         pkg = EvidencePackage(finding_id=finding.id, package_uri=f"siem://finding/{finding.id}", hash="")
         session.add(pkg)
-        session.commit()
 
         # store escalation record
         esc = Escalation(source_service="siem", source_id=finding.id, organisation_id=None, status="pending")
         session.add(esc)
-        session.commit()
-        session.refresh(esc)
+        session.flush()
 
+        # read back before commit expires the instances
         result = {"hit_id": hit.id, "finding_id": finding.id, "escalation_id": esc.id}
+        organisation_id, severity = esc.organisation_id, finding.severity
+        session.commit()
 
         # escalate to PSA if client provided
         if escalation_client:
             try:
                 # organisation_id left None above; callers should fill organisation context if available
-                case_resp = escalation_client.create_case(organisation_id=esc.organisation_id or "", case_type="incident", source_system="siem", severity=finding.severity)
+                case_resp = escalation_client.create_case(organisation_id=organisation_id or "", case_type="incident", source_system="siem", severity=severity)
                 psa_case = case_resp.get("id") or case_resp
                 finding.psa_case_id = psa_case
                 esc.psa_case_id = psa_case
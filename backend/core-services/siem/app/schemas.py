@@ -1,32 +1,35 @@
-from pydantic import BaseModel
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Any
 
 class RawEventIn(BaseModel):
-    source_system: Optional[str]
-    event_time: Optional[str]
-    payload: Any
+    source_system: Optional[str] = None
+    event_time: Optional[datetime] = None
+    payload: Any = None
 
 class RawEventOut(BaseModel):
-    id: str
-    source_system: Optional[str]
-    received_at: Optional[str]
+    model_config = ConfigDict(from_attributes=True)
 
-    class Config:
-        orm_mode = True
+    id: str
+    source_system: Optional[str] = None
+    received_at: Optional[datetime] = None
 
 class EventIn(BaseModel):
     raw_event_id: str
-    event_category: Optional[str]
-    event_type: Optional[str]
-    severity: Optional[int]
-    asset_id: Optional[str]
-    user_id: Optional[str]
-    source_ip: Optional[str]
-    destination_ip: Optional[str]
-    event_time: Optional[str]
+    event_category: Optional[str] = None
+    event_type: Optional[str] = None
+    severity: Optional[int] = None
+    asset_id: Optional[str] = None
+    user_id: Optional[str] = None
+    source_ip: Optional[str] = None
+    destination_ip: Optional[str] = None
+    event_time: Optional[datetime] = None
 
 class FindingCreate(BaseModel):
     organisation_id: str
     finding_type: str
     severity: int = 1
     confidence: int = 50
+
+class CreatedOut(BaseModel):
+    id: str
@@ -0,0 +1,17 @@
+from sqlalchemy.pool import StaticPool
+
+from core_services.common.db import engine_options
+
+
+def test_in_memory_sqlite_shares_one_connection():
+    for url in (
+        "sqlite://",
+        "sqlite:///:memory:",
+        "sqlite:///file:siem?mode=memory&cache=shared&uri=true",
+    ):
+        assert engine_options(url)["poolclass"] is StaticPool, url
+
+
+def test_file_sqlite_keeps_default_pool():
+    assert "poolclass" not in engine_options("sqlite:////var/lib/siem.db")
+    assert "poolclass" not in engine_options("sqlite:///file:siem.db?uri=true")
@@ -0,0 +1,76 @@
+import os
+from datetime import datetime
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from core_services.common.db import engine_options, supports_concurrent_sessions
+from core_services.siem.app import api, db, models
+from core_services.siem.app.main import app
+
+
+def _seed_rules(count: int) -> set:
+    with db.SessionLocal() as session:
+        session.add_all(
+            models.Event(event_type="login_failed", event_time=datetime.utcnow()) for _ in range(3)
+        )
+        rules = [
+            models.CorrelationRule(name=f"rule-{i}", logic={"match_event_type": "login_failed", "count": 3})
+            for i in range(count)
+        ]
+        session.add_all(rules)
+        session.commit()
+        return {rule.id for rule in rules}
+
+
+def _evaluate_all(client: TestClient, rule_ids: set) -> list:
+    r = client.post("/siem/rules/evaluate_all")
+    assert r.status_code == 200
+    return [o for o in r.json() if o["rule_id"] in rule_ids]
+
+
+@pytest.fixture
+def no_escalation():
+    app.dependency_overrides[api.get_escalation_client] = lambda: None
+    yield
+    app.dependency_overrides.pop(api.get_escalation_client, None)
+
+
+@pytest.fixture
+def file_database(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'siem.db'}"
+    engine = create_engine(url, **engine_options(url))
+    monkeypatch.setattr(db, "engine", engine)
+    monkeypatch.setattr(db, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    monkeypatch.setattr(db, "CONCURRENT_SESSIONS", supports_concurrent_sessions(url))
+    yield
+    engine.dispose()
+
+
+def test_evaluate_all_rules_concurrently(no_escalation, file_database, monkeypatch):
+    assert db.CONCURRENT_SESSIONS
+
+    def unexpected_serial(*args):
+        raise AssertionError("file-backed database should evaluate rules concurrently")
+
+    monkeypatch.setattr(api, "_evaluate_rules_serially", unexpected_serial)
+    with TestClient(app) as client:
+        rule_ids = _seed_rules(8)
+        outcomes = _evaluate_all(client, rule_ids)
+
+    assert len(outcomes) == 8
+    assert all("error" not in o and o["result"]["finding_id"] for o in outcomes)
+
+
+def test_evaluate_all_rules_on_shared_in_memory_connection(no_escalation, monkeypatch):
+    if supports_concurrent_sessions(os.environ["DATABASE_URL"]):
+        pytest.skip("DATABASE_URL is not an in-memory SQLite database")
+    with TestClient(app) as client:
+        rule_ids = _seed_rules(8)
+        outcomes = _evaluate_all(client, rule_ids)
+
+    assert len(outcomes) == 8
+    assert all("error" not in o and o["result"]["finding_id"] for o in outcomes)
@@ -61,8 +61,16 @@ def validate_batch(batch: EventBatch, event_limit: int) -> None:
         validate_event_payload(event)
 
 
+# Same output as json.dumps(sort_keys=True, separators=(",", ":")) without
+# constructing an encoder per event. Payloads are decoded request JSON, so the
+# circular-reference check can never fire.
+_CANONICAL_ENCODE = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), check_circular=False
+).encode
+
+
 def canonical_payload_hash(payload: dict) -> str:
-    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    canonical = _CANONICAL_ENCODE(payload)
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
@@ -573,7 +573,7 @@ class InventoryStore:
 
     async def snapshot(self, asset_id: str) -> InventorySnapshot:
         asset = await self._fetch_asset_context(asset_id)
-        tenant_id = asset["tenant_id"] if asset else ""
+        tenant_id = str(asset["tenant_id"]) if asset else ""
         hostname = asset["hostname"] if asset else None
 
         hardware = await self._fetch_hardware(asset_id, tenant_id, hostname)
@@ -1115,7 +1115,8 @@ class InventoryStore:
         )
         if not row:
             return None
-        return HardwareInventory(
+        # Rows were validated on ingest; rebuild without re-running validators.
+        return HardwareInventory.model_construct(
             tenant_id=tenant_id,
             asset_id=asset_id,
             collected_at=row["updated_at"],
@@ -1150,7 +1151,7 @@ class InventoryStore:
         )
         if not row:
             return None
-        return OsInventory(
+        return OsInventory.model_construct(
             tenant_id=tenant_id,
             asset_id=asset_id,
             collected_at=row["updated_at"],
@@ -1186,7 +1187,7 @@ class InventoryStore:
             return None
         collected_at = max(row["updated_at"] for row in rows)
         items = [
-            SoftwareItem(
+            SoftwareItem.model_construct(
                 name=row["name"],
                 vendor=row["vendor"],
                 version=row["version"],
@@ -1195,7 +1196,7 @@ class InventoryStore:
             )
             for row in rows
         ]
-        return SoftwareInventory(
+        return SoftwareInventory.model_construct(
             tenant_id=tenant_id,
             asset_id=asset_id,
             collected_at=collected_at,
@@ -1227,7 +1228,7 @@ class InventoryStore:
             return None
         collected_at = max(row["updated_at"] for row in rows)
         users = [
-            LocalUser(
+            LocalUser.model_construct(
                 username=row["username"],
                 display_name=row["display_name"],
                 uid=row["uid"],
@@ -1236,7 +1237,7 @@ class InventoryStore:
             )
             for row in rows
         ]
-        return LocalUsersInventory(
+        return LocalUsersInventory.model_construct(
             tenant_id=tenant_id,
             asset_id=asset_id,
             collected_at=collected_at,
@@ -1272,14 +1273,14 @@ class InventoryStore:
             return None
         collected_at = max(row["updated_at"] for row in rows)
         groups = [
-            LocalGroup(
+            LocalGroup.model_construct(
                 name=row["name"],
                 gid=row["gid"],
                 members=list(row["members"] or []),
             )
             for row in rows
         ]
-        return LocalGroupsInventory(
+        return LocalGroupsInventory.model_construct(
             tenant_id=tenant_id,
             asset_id=asset_id,
             collected_at=collected_at,
@@ -7,7 +7,8 @@ Usage:
 
 Behavior:
 - Detects per-service venv at `<service>/.venv` and uses its Python if present, otherwise uses the current interpreter.
-- Spawns each service with `python -m uvicorn app.main:app --host 0.0.0.0 --port <port> [--reload]`.
+- Spawns each service with `python -m uvicorn app.main:app --host 0.0.0.0 --port <port> --loop auto --http auto [--reload]`.
+  uvicorn picks uvloop and httptools when they are installed and falls back to asyncio/h11 otherwise.
 - Sets minimal default environment variables for each service. Override by exporting env vars yourself before running.
 - Streams subprocess stdout/stderr with a service name prefix and performs a simple TCP health check after start.
 - Gracefully terminates all children on CTRL+C.
@@ -22,10 +23,13 @@ import os
 import shutil
 import signal
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
 ROOT = Path(__file__).resolve().parent
+STREAM_CHUNK_SIZE = 65536
+VENV_PYTHON = Path("Scripts", "python.exe") if sys.platform == "win32" else Path("bin", "python")
 
 SERVICES: Dict[str, Dict] = {
     "api": {
@@ -92,8 +96,19 @@ if "transport" in SERVICES and "identity" in SERVICES:
 def _parse_env_file(path: Path) -> Dict[str, str]:
     """Read a simple KEY=VALUE .env file and return a dict.
 
-    Supports quoted values and ignores comments/blank lines.
+    Supports quoted values and ignores comments/blank lines. Parsed files are
+    cached by modification time, so the root .env shared by ``ROOT_ENV`` and
+    the ``api`` service is only read once.
     """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return dict(_parse_env_text(path, mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _parse_env_text(path: Path, mtime_ns: int) -> Dict[str, str]:
     result: Dict[str, str] = {}
     try:
         text = path.read_text(encoding="utf-8")
@@ -121,11 +136,30 @@ if ROOT_ENV:
 
 
 async def read_stream(stream: asyncio.StreamReader, prefix: str) -> None:
+    """Copy ``stream`` to stdout, prefixing every line with ``[prefix]``.
+
+    Output is read and written in large chunks; a trailing partial line is
+    held back until its newline (or EOF) arrives.
+    """
+    tag = f"[{prefix}] ".encode()
+    pending = b""
     while True:
-        line = await stream.readline()
-        if not line:
+        chunk = await stream.read(STREAM_CHUNK_SIZE)
+        if not chunk:
             break
-        print(f"[{prefix}] {line.decode().rstrip()}")
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        if lines:
+            _write_stdout(b"".join(tag + line.rstrip() + b"\n" for line in lines))
+    if pending:
+        _write_stdout(tag + pending.rstrip() + b"\n")
+
+
+def _write_stdout(data: bytes) -> None:
+    # Flush text-level prints first so runner messages keep their order
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
 
 
 async def wait_for_port(host: str, port: int, timeout: float = 10.0) -> bool:
@@ -144,13 +178,10 @@ async def wait_for_port(host: str, port: int, timeout: float = 10.0) -> bool:
     return False
 
 
+@lru_cache(maxsize=None)
 def find_venv_python(service_path: Path) -> Optional[str]:
     # Prefer .venv in service directory
-    venv_dir = service_path / ".venv"
-    if sys.platform == "win32":
-        candidate = venv_dir / "Scripts" / "python.exe"
-    else:
-        candidate = venv_dir / "bin" / "python"
+    candidate = service_path / ".venv" / VENV_PYTHON
     if candidate.exists():
         return str(candidate)
     return None
@@ -187,7 +218,11 @@ async def run_service(name: str, cfg: Dict, reload: bool) -> asyncio.subprocess.
     python_exe = find_venv_python(service_path) or sys.executable
 
     host = os.environ.get(f"{name.upper()}_HOST", "127.0.0.1")
-    cmd = [python_exe, "-m", "uvicorn", module, "--host", host, "--port", str(port)]
+    cmd = [
+        python_exe, "-m", "uvicorn", module,
+        "--host", host, "--port", str(port),
+        "--loop", "auto", "--http", "auto",
+    ]
     if reload:
         cmd.append("--reload")
 
@@ -225,22 +260,29 @@ async def main_async(services: list[str], reload: bool) -> int:
                 print(f"Unknown service: {name}")
                 exit_code = 2
                 return exit_code
-            proc = await run_service(name, SERVICES[name], reload)
-            procs[name] = proc
-
-        # Monitor processes
-        while True:
-            await asyncio.sleep(0.5)
-            for name, proc in list(procs.items()):
-                if proc.returncode is None:
-                    # poll
-                    rc = proc.returncode
-                    if rc is None:
-                        continue
-                # Process ended
-                rc = await proc.wait()
-                print(f"{name} exited with {rc}, shutting other services down")
-                raise RuntimeError(f"{name} exited: {rc}")
+        # Start every service at once so the port health checks overlap
+        started = await asyncio.gather(
+            *(run_service(name, SERVICES[name], reload) for name in services),
+            return_exceptions=True,
+        )
+        procs.update(
+            (name, proc) for name, proc in zip(services, started) if not isinstance(proc, BaseException)
+        )
+        for result in started:
+            if isinstance(result, BaseException):
+                raise result
+
+        # Monitor processes: wake only when a child actually exits
+        wait_tasks = {asyncio.create_task(proc.wait()): name for name, proc in procs.items()}
+        try:
+            done, _ = await asyncio.wait(wait_tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in wait_tasks:
+                task.cancel()
+        task = done.pop()
+        name, rc = wait_tasks[task], task.result()
+        print(f"{name} exited with {rc}, shutting other services down")
+        raise RuntimeError(f"{name} exited: {rc}")
     except asyncio.CancelledError:
         pass
     except KeyboardInterrupt:
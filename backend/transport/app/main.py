@@ -12,7 +12,7 @@ from typing import Optional
 import httpx
 from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
 from fastapi.responses import JSONResponse
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from .config import Settings, load_settings
 from .models import (
@@ -109,12 +109,14 @@ async def mtls_hello(
     return HelloResponse(**response.json())
 
 
-async def _forward_inventory(path: str, payload: dict, settings: Settings) -> dict:
+async def _forward_inventory(path: str, payload: BaseModel, settings: Settings) -> dict:
+    # Serialise in pydantic-core: one pass over large item lists, and datetimes
+    # are emitted as ISO strings (plain json.dumps rejects them).
     async with httpx.AsyncClient(timeout=settings.request_timeout_seconds) as client:
         response = await client.post(
             f"{settings.ingestion_service_url}{path}",
-            json=payload,
-            headers={"X-Forwarded-Proto": "https"},
+            content=payload.model_dump_json(),
+            headers={"Content-Type": "application/json", "X-Forwarded-Proto": "https"},
         )
 
     if response.status_code >= 400:
@@ -196,7 +198,7 @@ async def mtls_inventory_hardware(
     settings: Settings = Depends(get_settings),
     _: None = Depends(enforce_https),
 ) -> dict:
-    return await _forward_inventory("/inventory/hardware", payload.model_dump(), settings)
+    return await _forward_inventory("/inventory/hardware", payload, settings)
 
 
 @app.post("/mtls/inventory/os", response_class=JSONResponse)
@@ -205,7 +207,7 @@ async def mtls_inventory_os(
     settings: Settings = Depends(get_settings),
     _: None = Depends(enforce_https),
 ) -> dict:
-    return await _forward_inventory("/inventory/os", payload.model_dump(), settings)
+    return await _forward_inventory("/inventory/os", payload, settings)
 
 
 @app.post("/mtls/inventory/software", response_class=JSONResponse)
@@ -214,7 +216,7 @@ async def mtls_inventory_software(
     settings: Settings = Depends(get_settings),
     _: None = Depends(enforce_https),
 ) -> dict:
-    return await _forward_inventory("/inventory/software", payload.model_dump(), settings)
+    return await _forward_inventory("/inventory/software", payload, settings)
 
 
 @app.post("/mtls/inventory/users", response_class=JSONResponse)
@@ -223,7 +225,7 @@ async def mtls_inventory_users(
     settings: Settings = Depends(get_settings),
     _: None = Depends(enforce_https),
 ) -> dict:
-    return await _forward_inventory("/inventory/users", payload.model_dump(), settings)
+    return await _forward_inventory("/inventory/users", payload, settings)
 
 
 @app.post("/mtls/inventory/groups", response_class=JSONResponse)
@@ -232,7 +234,7 @@ async def mtls_inventory_groups(
     settings: Settings = Depends(get_settings),
     _: None = Depends(enforce_https),
 ) -> dict:
-    return await _forward_inventory("/inventory/groups", payload.model_dump(), settings)
+    return await _forward_inventory("/inventory/groups", payload, settings)
 
 
 @app.post("/mtls/events", response_class=JSONResponse)
@@ -1,7 +1,9 @@
 """Transport trust configuration for client certificates."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import FrozenSet, Optional
 
 from fastapi import HTTPException, status
@@ -14,16 +16,25 @@ class TrustStore:
     allowed_fingerprints: FrozenSet[str]
 
     def is_allowed(self, fingerprint: str) -> bool:
-        return fingerprint.lower() in self.allowed_fingerprints
+        # Proxies normally forward lowercase hex; only fold case on a miss
+        return (
+            fingerprint in self.allowed_fingerprints
+            or fingerprint.lower() in self.allowed_fingerprints
+        )
 
 
+@lru_cache(maxsize=16)
 def parse_fingerprints(raw_value: Optional[str]) -> TrustStore:
-    """Parse comma-separated fingerprints into a trust store."""
+    """Parse comma-separated fingerprints into a trust store.
+
+    The result is cached per configuration string, since settings are
+    reloaded on every request.
+    """
     if not raw_value:
         return TrustStore(allowed_fingerprints=frozenset())
 
     allowed = frozenset(
-        item.strip().lower()
+        sys.intern(item.strip().lower())
         for item in raw_value.split(",")
         if item.strip()
     )